@@ -16,11 +16,40 @@ class Config:
         self.CLUSTER_KUBE_CONFIG_PATH = self._config['CLUSTER']['KUBE_CONFIG_PATH']
         self.CLUSTER_VOLUME_NFS_SERVER = self._config['CLUSTER']['VOLUME_NFS_SERVER']
         self.CLUSTER_VOLUME_NFS_PATH = self._config['CLUSTER']['VOLUME_NFS_PATH']
+        self.CLUSTER_CONNECTION_POOL_MAXSIZE = int(os.environ.get(
+            'CLUSTER_CONNECTION_POOL_MAXSIZE', self._config['CLUSTER'].get('CONNECTION_POOL_MAXSIZE', 32)))
+        self.CLUSTER_CONNECTION_RETRIES = int(os.environ.get(
+            'CLUSTER_CONNECTION_RETRIES', self._config['CLUSTER'].get('CONNECTION_RETRIES', 3)))
+        self.CLUSTER_WATCH_CACHE_ENABLED = str(os.environ.get(
+            'CLUSTER_WATCH_CACHE_ENABLED', self._config['CLUSTER'].get('WATCH_CACHE_ENABLED', False))).lower() == 'true'
+        self.CLUSTER_WATCH_CACHE_RESYNC_SECONDS = int(os.environ.get(
+            'CLUSTER_WATCH_CACHE_RESYNC_SECONDS', self._config['CLUSTER'].get('WATCH_CACHE_RESYNC_SECONDS', 300)))
+        self.CLUSTER_USAGE_COLLECTOR_ENABLED = str(os.environ.get(
+            'CLUSTER_USAGE_COLLECTOR_ENABLED',
+            self._config['CLUSTER'].get('USAGE_COLLECTOR_ENABLED', False))).lower() == 'true'
+        self.CLUSTER_USAGE_INTERVAL_SECONDS = int(os.environ.get(
+            'CLUSTER_USAGE_INTERVAL_SECONDS', self._config['CLUSTER'].get('USAGE_INTERVAL_SECONDS', 30)))
+        self.CLUSTER_NOTEBOOK_CULLING_ENABLED = str(os.environ.get(
+            'CLUSTER_NOTEBOOK_CULLING_ENABLED',
+            self._config['CLUSTER'].get('NOTEBOOK_CULLING_ENABLED', False))).lower() == 'true'
+        self.CLUSTER_NOTEBOOK_IDLE_SECONDS = int(os.environ.get(
+            'CLUSTER_NOTEBOOK_IDLE_SECONDS', self._config['CLUSTER'].get('NOTEBOOK_IDLE_SECONDS', 3600)))
+        self.CLUSTER_NOTEBOOK_CULLING_INTERVAL_SECONDS = int(os.environ.get(
+            'CLUSTER_NOTEBOOK_CULLING_INTERVAL_SECONDS',
+            self._config['CLUSTER'].get('NOTEBOOK_CULLING_INTERVAL_SECONDS', 300)))
+        self.CLUSTER_WARM_POOL_ENABLED = str(os.environ.get(
+            'CLUSTER_WARM_POOL_ENABLED', self._config['CLUSTER'].get('WARM_POOL_ENABLED', False))).lower() == 'true'
+        self.CLUSTER_WARM_POOL_NAMESPACE = os.environ.get(
+            'CLUSTER_WARM_POOL_NAMESPACE', self._config['CLUSTER'].get('WARM_POOL_NAMESPACE', 'kubeflow'))
+        self.CLUSTER_WARM_POOL_INTERVAL_SECONDS = int(os.environ.get(
+            'CLUSTER_WARM_POOL_INTERVAL_SECONDS', self._config['CLUSTER'].get('WARM_POOL_INTERVAL_SECONDS', 60)))
         self.MINIO_ENDPOINT = self._config['MINIO']['ENDPOINT']
         self.MINIO_ACCESS_KEY = self._config['MINIO']['ACCESS_KEY']
         self.MINIO_SECRET_KEY = self._config['MINIO']['SECRET_KEY']
         self.MLFLOW_TRACKING_URI = self._config['MLFLOW']['TRACKING_URI']
         self.KUBEFLOW_PIPELINES_ENDPOINT = self._config['KUBEFLOW']['PIPELINES']['ENDPOINT']
+        self.KUBEFLOW_PIPELINES_MAX_BATCH_RUNS = int(os.environ.get(
+            'KUBEFLOW_PIPELINES_MAX_BATCH_RUNS', self._config['KUBEFLOW']['PIPELINES'].get('MAX_BATCH_RUNS', 100)))
         self.SQLALCHEMY_DATABASE_URL = self._config['DATABASE']['SQLALCHEMY_DATABASE_URL']
 
         self.SERVICE_CODE = 100
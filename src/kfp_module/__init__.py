@@ -1,7 +1,13 @@
+from src.kfp_module.async_service import AsyncKfpService
 from src.kfp_module.config import get_kube_config_path, get_kubeflow_pipelines_endpoint
+from src.kfp_module.run_watcher import RunWatcher
 from src.kfp_module.service import KfpService
 
 kfp_service = KfpService(
     host=get_kubeflow_pipelines_endpoint(),
     config_file=get_kube_config_path()
 )
+
+kfp_async_service = AsyncKfpService(kfp_service=kfp_service)
+
+kfp_run_watcher = RunWatcher(kfp_async_service=kfp_async_service)
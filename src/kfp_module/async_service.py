@@ -0,0 +1,296 @@
+import asyncio
+import json
+from typing import Optional
+
+import httpx
+from starlette.concurrency import run_in_threadpool
+
+from src.kfp_module.exceptions import KFPHttpError, KFPConnectionError
+from src.kfp_module.schemas import Experiment, Pipeline, PipelineVersion, Run, RecurringRun, RunPipelinePackage, \
+    RunBatch
+from src.kfp_module.service import KfpService
+
+
+class AsyncKfpService:
+    """
+    KFP v2beta1 REST API 를 httpx.AsyncClient 로 직접 호출하여 이벤트 루프를 막지 않는 서비스.
+    파이프라인 패키지 컴파일/업로드 등 kfp SDK 로직이 필요한 요청은 KfpService 를 스레드풀에서 실행한다.
+    """
+    api_prefix = "/apis/v2beta1"
+
+    def __init__(self, kfp_service: KfpService, timeout: float = 30.0, max_connections: int = 100,
+                 max_keepalive_connections: int = 20):
+        self.kfp_service = kfp_service
+        self.timeout = timeout
+        self.limits = httpx.Limits(max_connections=max_connections,
+                                   max_keepalive_connections=max_keepalive_connections)
+        self._http_client = None
+        self.request_count = 0
+
+    @property
+    def namespace(self):
+        return self.kfp_service.namespace
+
+    def get_http_client(self) -> httpx.AsyncClient:
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(base_url=self.kfp_service.host, timeout=self.timeout,
+                                                  limits=self.limits)
+        return self._http_client
+
+    async def close(self):
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def get_token(self):
+        token_manager = self.kfp_service.token_manager
+        if token_manager.needs_refresh():
+            # TokenRequest 발급은 동기 kubernetes 호출이므로 스레드풀에서 실행
+            return await run_in_threadpool(self.kfp_service.get_token)
+        return token_manager.get_token()
+
+    async def _request(self, method: str, path: str, params: Optional[dict] = None, body: Optional[dict] = None):
+        token = await self.get_token()
+        if params is not None:
+            params = {key: value for key, value in params.items() if value not in (None, '')}
+        try:
+            response = await self.get_http_client().request(method, f"{self.api_prefix}{path}", params=params,
+                                                            json=body,
+                                                            headers={"Authorization": f"Bearer {token}"})
+        except httpx.RequestError as e:
+            raise KFPConnectionError(e)
+        finally:
+            self.request_count += 1
+        if response.is_error:
+            raise KFPHttpError(response)
+        if not response.content:
+            return None
+        return response.json()
+
+    async def _cached(self, key: tuple, load: callable):
+        list_cache = self.kfp_service.list_cache
+        result = list_cache.get(key)
+        if result is None:
+            generation = list_cache.generation(key[0])
+            result = await load()
+            list_cache.set(key, result, generation)
+        return result
+
+    async def iter_all(self, path: str, items_key: str, params: Optional[dict] = None, page_size: int = 100):
+        """
+        첫 페이지를 조회한 뒤 page_token 을 따라가며 모든 항목을 하나씩 반환하는 async generator 를 반환한다.
+        첫 페이지 조회 오류는 여기서 발생하므로 응답을 시작하기 전에 처리할 수 있다.
+        현재 페이지를 내보내는 동안 다음 페이지를 미리 요청하며, 메모리에는 최대 두 페이지만 유지한다.
+        """
+        params = dict(params or {}, page_size=page_size)
+        first_page = await self._request("GET", path, params=params) or {}
+        return self._iter_pages(path, items_key, params, first_page)
+
+    async def _iter_pages(self, path: str, items_key: str, params: dict, page: dict):
+        next_page = None
+        try:
+            while True:
+                if page.get("next_page_token"):
+                    next_page = asyncio.ensure_future(
+                        self._request("GET", path, params=dict(params, page_token=page["next_page_token"])))
+                for item in page.get(items_key, []):
+                    yield item
+                if next_page is None:
+                    return
+                page = await next_page or {}
+                next_page = None
+        finally:
+            if next_page is not None and not next_page.done():
+                next_page.cancel()
+
+    def get_metrics(self):
+        metrics = self.kfp_service.get_metrics()
+        metrics["http"] = {"requests": self.request_count}
+        return metrics
+
+    async def get_kfp_healthz(self):
+        return await self._request("GET", "/healthz")
+
+    async def get_user_namespace(self):
+        return self.namespace
+
+    async def list_experiments(self, filter_option: Optional[str] = None, page_token: str = '', page_size: int = 10,
+                               sort_by: str = ''):
+        key = ("experiments", "async", self.namespace, page_token, page_size, sort_by, filter_option)
+        return await self._cached(key, lambda: self._request("GET", "/experiments", params={
+            "page_token": page_token,
+            "page_size": page_size,
+            "sort_by": sort_by,
+            "filter": filter_option,
+            "namespace": self.namespace,
+        }))
+
+    async def list_archive_experiments(self, page_token: str = '', page_size: int = 10, sort_by: str = ''):
+        return await self.list_experiments(page_token=page_token, page_size=page_size, sort_by=sort_by,
+                                           filter_option=json.dumps({
+                                               "predicates": [{
+                                                   "operation": "EQUALS",
+                                                   "key": "storage_state",
+                                                   "stringValue": "ARCHIVED",
+                                               }]
+                                           }))
+
+    async def list_unarchive_experiments(self, page_token: str = '', page_size: int = 10, sort_by: str = ''):
+        return await self.list_experiments(page_token=page_token, page_size=page_size, sort_by=sort_by,
+                                           filter_option=json.dumps({
+                                               "predicates": [{
+                                                   "operation": "EQUALS",
+                                                   "key": "storage_state",
+                                                   "stringValue": "AVAILABLE",
+                                               }]
+                                           }))
+
+    async def iter_experiments(self, filter_option: Optional[str] = None, sort_by: str = '', page_size: int = 100):
+        return await self.iter_all("/experiments", "experiments", page_size=page_size, params={
+            "sort_by": sort_by,
+            "filter": filter_option,
+            "namespace": self.namespace,
+        })
+
+    async def create_experiment(self, experiment: Experiment):
+        return await run_in_threadpool(self.kfp_service.create_experiment, experiment)
+
+    async def get_experiment(self, experiment_id: str):
+        return await self._request("GET", f"/experiments/{experiment_id}")
+
+    async def archive_experiment(self, experiment_id: str):
+        result = await self._request("POST", f"/experiments/{experiment_id}:archive")
+        self.kfp_service.list_cache.invalidate("experiments", "runs")
+        return result
+
+    async def unarchive_experiment(self, experiment_id: str):
+        result = await self._request("POST", f"/experiments/{experiment_id}:unarchive")
+        self.kfp_service.list_cache.invalidate("experiments", "runs")
+        return result
+
+    async def delete_experiment(self, experiment_id: str):
+        result = await self._request("DELETE", f"/experiments/{experiment_id}")
+        self.kfp_service.list_cache.invalidate("experiments", "runs", "recurring_runs")
+        return result
+
+    async def list_pipelines(self, page_token: str = '', page_size: int = 10, sort_by: str = ''):
+        key = ("pipelines", "async", self.namespace, page_token, page_size, sort_by)
+        return await self._cached(key, lambda: self._request("GET", "/pipelines", params={
+            "page_token": page_token,
+            "page_size": page_size,
+            "sort_by": sort_by,
+        }))
+
+    async def iter_pipelines(self, sort_by: str = '', page_size: int = 100):
+        return await self.iter_all("/pipelines", "pipelines", page_size=page_size, params={
+            "sort_by": sort_by,
+        })
+
+    async def upload_pipeline(self, pipeline: Pipeline):
+        return await run_in_threadpool(self.kfp_service.upload_pipeline, pipeline)
+
+    async def get_pipeline(self, pipeline_id: str):
+        return await self._request("GET", f"/pipelines/{pipeline_id}")
+
+    async def delete_pipeline(self, pipeline_id: str):
+        result = await self._request("DELETE", f"/pipelines/{pipeline_id}")
+        self.kfp_service.list_cache.invalidate("pipelines", "pipeline_versions")
+        await run_in_threadpool(self.kfp_service.package_index.remove, pipeline_id)
+        return result
+
+    async def list_pipeline_versions(self, pipeline_id: str, page_token: str = '', page_size: int = 10,
+                                     sort_by: str = ''):
+        key = ("pipeline_versions", "async", pipeline_id, page_token, page_size, sort_by)
+        return await self._cached(key, lambda: self._request("GET", f"/pipelines/{pipeline_id}/versions", params={
+            "page_token": page_token,
+            "page_size": page_size,
+            "sort_by": sort_by,
+        }))
+
+    async def upload_pipeline_version(self, pipeline_version: PipelineVersion):
+        return await run_in_threadpool(self.kfp_service.upload_pipeline_version, pipeline_version)
+
+    async def get_pipeline_version(self, pipeline_id: str, version_id: str):
+        return await self._request("GET", f"/pipelines/{pipeline_id}/versions/{version_id}")
+
+    async def delete_pipeline_version(self, pipeline_id: str, version_id: str):
+        result = await self._request("DELETE", f"/pipelines/{pipeline_id}/versions/{version_id}")
+        self.kfp_service.list_cache.invalidate("pipeline_versions")
+        await run_in_threadpool(self.kfp_service.package_index.remove, pipeline_id, version_id)
+        return result
+
+    async def list_runs(self, page_token: str = '', page_size: int = 10, sort_by: str = '',
+                        experiment_id: Optional[str] = None):
+        key = ("runs", "async", self.namespace, page_token, page_size, sort_by, experiment_id)
+        return await self._cached(key, lambda: self._request("GET", "/runs", params={
+            "page_token": page_token,
+            "page_size": page_size,
+            "sort_by": sort_by,
+            "experiment_id": experiment_id,
+            "namespace": self.namespace,
+        }))
+
+    async def iter_runs(self, experiment_id: Optional[str] = None, sort_by: str = '', page_size: int = 100):
+        return await self.iter_all("/runs", "runs", page_size=page_size, params={
+            "sort_by": sort_by,
+            "experiment_id": experiment_id,
+            "namespace": self.namespace,
+        })
+
+    async def run_pipeline(self, run: Run):
+        return await run_in_threadpool(self.kfp_service.run_pipeline, run)
+
+    async def run_pipeline_batch(self, run_batch: RunBatch):
+        return await run_in_threadpool(self.kfp_service.run_pipeline_batch, run_batch)
+
+    async def create_run_from_pipeline_package(self, run: RunPipelinePackage):
+        return await run_in_threadpool(self.kfp_service.create_run_from_pipeline_package, run)
+
+    async def get_run(self, run_id: str):
+        return await self._request("GET", f"/runs/{run_id}")
+
+    async def list_runs_by_ids(self, run_ids: list):
+        result = await self._request("GET", "/runs", params={
+            "page_size": len(run_ids),
+            "namespace": self.namespace,
+            "filter": json.dumps({
+                "predicates": [{
+                    "operation": "IN",
+                    "key": "run_id",
+                    "stringValues": {"values": run_ids},
+                }]
+            }),
+        })
+        return result.get("runs", []) if result else []
+
+    async def list_recurring_runs(self, page_token: str = '', page_size: int = 10, sort_by: str = '',
+                                  experiment_id: Optional[str] = None):
+        key = ("recurring_runs", "async", self.namespace, page_token, page_size, sort_by, experiment_id)
+        return await self._cached(key, lambda: self._request("GET", "/recurringruns", params={
+            "page_token": page_token,
+            "page_size": page_size,
+            "sort_by": sort_by,
+            "experiment_id": experiment_id,
+            "namespace": self.namespace,
+        }))
+
+    async def create_recurring_run(self, recurring_run: RecurringRun):
+        return await run_in_threadpool(self.kfp_service.create_recurring_run, recurring_run)
+
+    async def get_recurring_run(self, recurring_run_id: str):
+        return await self._request("GET", f"/recurringruns/{recurring_run_id}")
+
+    async def delete_recurring_run(self, recurring_run_id: str):
+        result = await self._request("DELETE", f"/recurringruns/{recurring_run_id}")
+        self.kfp_service.list_cache.invalidate("recurring_runs")
+        return result
+
+    async def disable_recurring_run(self, recurring_run_id: str):
+        result = await self._request("POST", f"/recurringruns/{recurring_run_id}:disable")
+        self.kfp_service.list_cache.invalidate("recurring_runs")
+        return result
+
+    async def enable_recurring_run(self, recurring_run_id: str):
+        result = await self._request("POST", f"/recurringruns/{recurring_run_id}:enable")
+        self.kfp_service.list_cache.invalidate("recurring_runs")
+        return result
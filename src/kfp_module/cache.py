@@ -0,0 +1,73 @@
+import copy
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+
+class KfpListCache:
+    """
+    KFP list 조회 결과를 짧은 TTL 동안 보관하는 LRU 캐시.
+    key 의 첫 번째 값은 리소스 그룹(experiments, pipelines, ...)이며 생성/삭제/보관 시 그룹 단위로 무효화한다.
+    호출한 쪽에서 결과를 수정해도 캐시된 값이 바뀌지 않도록 저장과 반환 시 복사본을 사용한다.
+    """
+
+    def __init__(self, ttl_seconds: float = 5.0, max_size: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._items = OrderedDict()
+        self._generations = defaultdict(int)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: tuple):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None or item[0] <= time.monotonic():
+                if item is not None:
+                    del self._items[key]
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(item[1])
+
+    def generation(self, group: str):
+        with self._lock:
+            return self._generations[group]
+
+    def set(self, key: tuple, value, generation: int = None):
+        value = copy.deepcopy(value)
+        with self._lock:
+            # 조회 도중 무효화가 일어났다면 이전 결과를 저장하지 않는다.
+            if generation is not None and generation != self._generations[key[0]]:
+                return
+            self._items[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, *groups: str):
+        with self._lock:
+            for group in groups:
+                self._generations[group] += 1
+            for key in [key for key in self._items if key[0] in groups]:
+                del self._items[key]
+            self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def get_metrics(self):
+        with self._lock:
+            return {
+                "size": len(self._items),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
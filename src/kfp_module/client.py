@@ -0,0 +1,57 @@
+import threading
+
+from kfp import Client
+
+
+class KfpClientPool:
+    """
+    (host, namespace) 별로 kfp.Client 를 하나만 생성하여 재사용한다.
+    토큰이 갱신되면 새 클라이언트를 만들지 않고 기존 클라이언트의 인증 토큰만 교체한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients = {}
+        self._tokens = {}
+        self.constructed_count = 0
+        self.reused_count = 0
+        self.token_swapped_count = 0
+
+    def get_client(self, host: str, namespace: str, token: str) -> Client:
+        key = (host, namespace)
+        with self._lock:
+            kfp_client = self._clients.get(key)
+            if kfp_client is None:
+                kfp_client = Client(host=host, namespace=namespace, existing_token=token)
+                self._clients[key] = kfp_client
+                self._tokens[key] = token
+                self.constructed_count += 1
+                return kfp_client
+
+            if self._tokens[key] != token:
+                self._swap_token(kfp_client, token)
+                self._tokens[key] = token
+                self.token_swapped_count += 1
+            else:
+                self.reused_count += 1
+            return kfp_client
+
+    @staticmethod
+    def _swap_token(kfp_client: Client, token: str):
+        # kfp.Client 내부의 모든 *ServiceApi 는 같은 Configuration 객체를 참조하므로 값만 바꾸면 된다.
+        kfp_client._existing_config.api_key['authorization'] = token
+        kfp_client._existing_config.api_key_prefix['authorization'] = 'Bearer'
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
+            self._tokens.clear()
+
+    def get_metrics(self):
+        with self._lock:
+            return {
+                "clients": len(self._clients),
+                "constructed": self.constructed_count,
+                "reused": self.reused_count,
+                "token_swapped": self.token_swapped_count,
+            }
@@ -9,3 +9,7 @@ def get_kube_config_path():
 
 def get_kubeflow_pipelines_endpoint():
     return app_config.KUBEFLOW_PIPELINES_ENDPOINT
+
+
+def get_max_batch_runs():
+    return app_config.KUBEFLOW_PIPELINES_MAX_BATCH_RUNS
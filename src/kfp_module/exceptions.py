@@ -1,6 +1,7 @@
 import json
 from typing import Union
 
+import httpx
 from kfp_server_api import ApiException as KFPApiException
 from kubernetes.client import ApiException as KubernetesApiException
 from starlette import status
@@ -36,3 +37,23 @@ class RequestValidationError(KFPException):
         self.code = int(f"{MODULE_CODE}{status.HTTP_400_BAD_REQUEST}")
         self.message = message
         self.result = result
+
+
+class KFPHttpError(KFPException):
+    def __init__(self, response: httpx.Response):
+        self.code = int(f"{MODULE_CODE}{response.status_code}")
+        self.message = response.reason_phrase
+        self.status_code = response.status_code
+        # 프록시(istio 등)가 반환한 오류는 JSON 이 아니거나 dict 가 아닐 수 있다.
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+        self.result = body.get('message', response.text) if isinstance(body, dict) else response.text
+
+
+class KFPConnectionError(KFPException):
+    def __init__(self, e: httpx.RequestError):
+        self.code = int(f"{MODULE_CODE}{status.HTTP_503_SERVICE_UNAVAILABLE}")
+        self.message = "KFP API server is unavailable"
+        self.result = str(e)
@@ -0,0 +1,75 @@
+import hashlib
+import json
+from datetime import datetime
+from typing import Optional
+
+from src.workflow_pipeline_module.database import SessionLocal
+from src.workflow_pipeline_module.models import PipelinePackage
+
+
+class PipelinePackageIndex:
+    """
+    파이프라인 패키지 내용의 SHA-256 → 업로드된 KFP pipeline / pipeline version 매핑을 DB 에 저장한다.
+    같은 패키지를 다시 업로드하면 multipart 업로드 없이 기존 결과를 반환하기 위해 사용한다.
+    """
+    PIPELINE = "pipeline"
+    PIPELINE_VERSION = "pipeline_version"
+
+    def __init__(self, session_factory=SessionLocal, chunk_size: int = 1024 * 1024):
+        self.session_factory = session_factory
+        self.chunk_size = chunk_size
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def target_of(*names: Optional[str]) -> str:
+        """업로드 대상(pipeline 이름, pipeline id / 이름 + version 이름)을 index key 로 사용할 문자열로 만든다."""
+        return json.dumps(list(names))
+
+    def hash_package(self, package_path: str) -> str:
+        sha256 = hashlib.sha256()
+        with open(package_path, "rb") as package:
+            for chunk in iter(lambda: package.read(self.chunk_size), b""):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+    def find(self, package_hash: str, resource_type: str, target: Optional[str] = None) -> Optional[dict]:
+        db = self.session_factory()
+        try:
+            package = db.query(PipelinePackage).filter(PipelinePackage.package_hash == package_hash,
+                                                       PipelinePackage.resource_type == resource_type,
+                                                       PipelinePackage.target == target).first()
+            if package is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return {"pipeline_id": package.pipeline_id, "pipeline_version_id": package.pipeline_version_id,
+                    "result": package.result}
+        finally:
+            db.close()
+
+    def save(self, package_hash: str, resource_type: str, result: dict, target: Optional[str] = None):
+        db = self.session_factory()
+        try:
+            db.add(PipelinePackage(package_hash=package_hash, resource_type=resource_type, target=target,
+                                   pipeline_id=result.get("pipeline_id"),
+                                   pipeline_version_id=result.get("pipeline_version_id"),
+                                   result=json.loads(json.dumps(result, default=str)),
+                                   created_at=datetime.now()))
+            db.commit()
+        finally:
+            db.close()
+
+    def remove(self, pipeline_id: str, pipeline_version_id: Optional[str] = None):
+        db = self.session_factory()
+        try:
+            query = db.query(PipelinePackage).filter(PipelinePackage.pipeline_id == pipeline_id)
+            if pipeline_version_id is not None:
+                query = query.filter(PipelinePackage.pipeline_version_id == pipeline_version_id)
+            query.delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+    def get_metrics(self):
+        return {"hits": self.hits, "misses": self.misses}
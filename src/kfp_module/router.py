@@ -1,10 +1,13 @@
+import json
 from typing import Optional
 
-from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, StreamingResponse
 
-from src.kfp_module import kfp_service
-from src.kfp_module.schemas import Experiment, Pipeline, PipelineVersion, Run, RecurringRun, RunPipelinePackage
+from src.kfp_module import kfp_async_service, kfp_run_watcher
+from src.kfp_module.exceptions import KFPException
+from src.kfp_module.schemas import Experiment, Pipeline, PipelineVersion, Run, RecurringRun, RunPipelinePackage, \
+    RunBatch
 from src.kserve_module.config import MODULE_CODE
 from src.response import Response
 
@@ -17,159 +20,223 @@ router = APIRouter(
 
 @router.get("", tags=["kfp"], response_model=Response)
 async def get_kfp_healthz():
-    return Response.from_result(MODULE_CODE, kfp_service.get_kfp_healthz())
+    return Response.from_result(MODULE_CODE, await kfp_async_service.get_kfp_healthz())
+
+
+@router.get("/metrics", tags=["kfp"], response_model=Response)
+async def get_metrics():
+    result = kfp_async_service.get_metrics()
+    result["run_watcher"] = kfp_run_watcher.get_metrics()
+    return Response.from_result(MODULE_CODE, result)
+
+
+def to_ndjson_response(items):
+    """응답이 시작된 뒤 다음 페이지 조회에서 발생한 오류는 마지막 줄에 {"error": {...}} 레코드로 기록한다."""
+    async def ndjson_stream():
+        try:
+            async for item in items:
+                yield json.dumps(item, default=str) + "\n"
+        except KFPException as e:
+            yield json.dumps({"error": {"code": e.code, "message": e.message, "result": e.result}},
+                             default=str) + "\n"
+        finally:
+            await items.aclose()
+
+    return StreamingResponse(ndjson_stream(), media_type="application/x-ndjson")
+
+
+@router.get("/export/experiments", tags=["kfp"])
+async def export_experiments(sort_by: str = '', page_size: int = 100):
+    # 첫 페이지 조회 오류는 응답 시작 전에 일반 오류 응답으로 반환된다.
+    return to_ndjson_response(await kfp_async_service.iter_experiments(sort_by=sort_by, page_size=page_size))
+
+
+@router.get("/export/pipelines", tags=["kfp"])
+async def export_pipelines(sort_by: str = '', page_size: int = 100):
+    return to_ndjson_response(await kfp_async_service.iter_pipelines(sort_by=sort_by, page_size=page_size))
+
+
+@router.get("/export/runs", tags=["kfp"])
+async def export_runs(sort_by: str = '', page_size: int = 100, experiment_id: Optional[str] = None):
+    return to_ndjson_response(await kfp_async_service.iter_runs(experiment_id=experiment_id, sort_by=sort_by,
+                                                                page_size=page_size))
 
 
 @router.get("/namespace", tags=["kfp"], response_model=Response)
 async def get_user_namespace():
-    return Response.from_result(MODULE_CODE, kfp_service.get_user_namespace())
+    return Response.from_result(MODULE_CODE, await kfp_async_service.get_user_namespace())
 
 
 @router.get("/experiments", tags=["kfp"], response_model=Response)
 async def list_experiments(page_token: str = '', page_size: int = 10, sort_by: str = ''):
-    return Response.from_result(MODULE_CODE, kfp_service.list_experiments(page_token=page_token,
-                                                                          page_size=page_size,
-                                                                          sort_by=sort_by))
+    result = await kfp_async_service.list_experiments(page_token=page_token, page_size=page_size, sort_by=sort_by)
+    return Response.from_result(MODULE_CODE, result)
 
 
 @router.get("/archive-experiments", tags=["kfp"], response_model=Response)
 async def list_archive_experiments(page_token: str = '', page_size: int = 10, sort_by: str = ''):
-    return Response.from_result(MODULE_CODE, kfp_service.list_archive_experiments(page_token=page_token,
-                                                                                  page_size=page_size,
-                                                                                  sort_by=sort_by))
+    result = await kfp_async_service.list_archive_experiments(page_token=page_token, page_size=page_size, sort_by=sort_by)
+    return Response.from_result(MODULE_CODE, result)
 
 
 @router.get("/unarchive-experiments", tags=["kfp"], response_model=Response)
 async def list_unarchive_experiments(page_token: str = '', page_size: int = 10, sort_by: str = ''):
-    return Response.from_result(MODULE_CODE, kfp_service.list_unarchive_experiments(page_token=page_token,
-                                                                                    page_size=page_size,
-                                                                                    sort_by=sort_by))
+    result = await kfp_async_service.list_unarchive_experiments(page_token=page_token, page_size=page_size, sort_by=sort_by)
+    return Response.from_result(MODULE_CODE, result)
 
 
 @router.post("/experiments", tags=["kfp"], response_model=Response)
 async def create_experiment(experiment: Experiment):
-    return Response.from_result(MODULE_CODE, kfp_service.create_experiment(experiment))
+    return Response.from_result(MODULE_CODE, await kfp_async_service.create_experiment(experiment))
 
 
 @router.get("/experiments/{experiment_id}", tags=["kfp"], response_model=Response)
 async def get_experiment(experiment_id: str):
-    return Response.from_result(MODULE_CODE, kfp_service.get_experiment(experiment_id=experiment_id))
+    return Response.from_result(MODULE_CODE, await kfp_async_service.get_experiment(experiment_id=experiment_id))
 
 
 @router.patch("/experiments/{experiment_id}/archive", tags=["kfp"], response_model=Response)
 async def archive_experiment(experiment_id: str):
-    return Response.from_result(MODULE_CODE, kfp_service.archive_experiment(experiment_id=experiment_id))
+    return Response.from_result(MODULE_CODE, await kfp_async_service.archive_experiment(experiment_id=experiment_id))
 
 
 @router.patch("/experiments/{experiment_id}/unarchive", tags=["kfp"], response_model=Response)
 async def unarchive_experiment(experiment_id: str):
-    return Response.from_result(MODULE_CODE, kfp_service.unarchive_experiment(experiment_id=experiment_id))
+    return Response.from_result(MODULE_CODE, await kfp_async_service.unarchive_experiment(experiment_id=experiment_id))
 
 
 @router.delete("/experiments/{experiment_id}", tags=["kfp"], response_model=Response)
 async def delete_experiment(experiment_id: str):
-    return Response.from_result(MODULE_CODE, kfp_service.delete_experiment(experiment_id=experiment_id))
+    return Response.from_result(MODULE_CODE, await kfp_async_service.delete_experiment(experiment_id=experiment_id))
 
 
 @router.get("/pipelines", tags=["kfp"], response_model=Response)
 async def list_pipelines(page_token: str = '', page_size: int = 10, sort_by: str = ''):
-    return Response.from_result(MODULE_CODE, kfp_service.list_pipelines(page_token=page_token,
-                                                                        page_size=page_size,
-                                                                        sort_by=sort_by))
+    result = await kfp_async_service.list_pipelines(page_token=page_token, page_size=page_size, sort_by=sort_by)
+    return Response.from_result(MODULE_CODE, result)
 
 
 @router.post("/pipelines", tags=["kfp"], response_model=Response)
 async def upload_pipeline(pipeline: Pipeline):
-    return Response.from_result(MODULE_CODE, kfp_service.upload_pipeline(pipeline))
+    return Response.from_result(MODULE_CODE, await kfp_async_service.upload_pipeline(pipeline))
 
 
 @router.get("/pipelines/{pipeline_id}", tags=["kfp"], response_model=Response)
 async def get_pipeline(pipeline_id: str):
-    return Response.from_result(MODULE_CODE, kfp_service.get_pipeline(pipeline_id))
+    return Response.from_result(MODULE_CODE, await kfp_async_service.get_pipeline(pipeline_id))
 
 
 @router.delete("/pipelines/{pipeline_id}", tags=["kfp"], response_model=Response)
 async def delete_pipeline(pipeline_id: str):
-    return Response.from_result(MODULE_CODE, kfp_service.delete_pipeline(pipeline_id))
+    return Response.from_result(MODULE_CODE, await kfp_async_service.delete_pipeline(pipeline_id))
 
 
 @router.post("/pipelines/versions", tags=["kfp"], response_model=Response)
 async def upload_pipeline_version(pipeline_version: PipelineVersion):
-    return Response.from_result(MODULE_CODE, kfp_service.upload_pipeline_version(pipeline_version))
+    return Response.from_result(MODULE_CODE, await kfp_async_service.upload_pipeline_version(pipeline_version))
 
 
 @router.get("/pipelines/versions/{pipeline_id}", tags=["kfp"], response_model=Response)
 async def list_pipeline_versions(pipeline_id: str):
-    return Response.from_result(MODULE_CODE, kfp_service.list_pipeline_versions(pipeline_id))
+    return Response.from_result(MODULE_CODE, await kfp_async_service.list_pipeline_versions(pipeline_id))
 
 
 @router.get("/pipelines/versions/{pipeline_id}/{version_id}", tags=["kfp"], response_model=Response)
 async def get_pipeline_version(pipeline_id: str, version_id: str):
-    return Response.from_result(MODULE_CODE, kfp_service.get_pipeline_version(pipeline_id, version_id))
+    return Response.from_result(MODULE_CODE, await kfp_async_service.get_pipeline_version(pipeline_id, version_id))
 
 
 @router.delete("/pipelines/versions/{pipeline_id}/{version_id}", tags=["kfp"], response_model=Response)
 async def delete_pipeline_version(pipeline_id: str, version_id: str):
-    return Response.from_result(MODULE_CODE, kfp_service.delete_pipeline_version(pipeline_id, version_id))
+    return Response.from_result(MODULE_CODE, await kfp_async_service.delete_pipeline_version(pipeline_id, version_id))
 
 
 @router.get("/runs", tags=["kfp"], response_model=Response)
 async def list_runs(page_token: str = '', page_size: int = 10, sort_by: str = '', experiment_id: Optional[str] = None):
-    return Response.from_result(MODULE_CODE, kfp_service.list_runs(page_token=page_token,
-                                                                   page_size=page_size,
-                                                                   sort_by=sort_by,
-                                                                   experiment_id=experiment_id))
+    result = await kfp_async_service.list_runs(page_token=page_token, page_size=page_size, sort_by=sort_by,
+                                               experiment_id=experiment_id)
+    return Response.from_result(MODULE_CODE, result)
 
 
 @router.post("/runs", tags=["kfp"], response_model=Response)
 async def run_pipeline(run: Run):
-    return Response.from_result(MODULE_CODE, kfp_service.run_pipeline(run))
+    return Response.from_result(MODULE_CODE, await kfp_async_service.run_pipeline(run))
+
+
+@router.post("/runs/batch", tags=["kfp"], response_model=Response)
+async def run_pipeline_batch(run_batch: RunBatch):
+    return Response.from_result(MODULE_CODE, await kfp_async_service.run_pipeline_batch(run_batch))
 
 
 @router.post("/runs/package", tags=["kfp"], response_model=Response)
 async def create_run_from_pipeline_package(run: RunPipelinePackage):
-    return Response.from_result(MODULE_CODE, kfp_service.create_run_from_pipeline_package(run))
+    return Response.from_result(MODULE_CODE, await kfp_async_service.create_run_from_pipeline_package(run))
 
 
 @router.get("/runs/{run_id}", tags=["kfp"], response_model=Response)
 async def get_run(run_id: str):
-    return Response.from_result(MODULE_CODE, kfp_service.get_run(run_id))
+    return Response.from_result(MODULE_CODE, await kfp_async_service.get_run(run_id))
+
+
+@router.get("/runs/{run_id}/watch", tags=["kfp"])
+async def watch_run_events(run_id: str):
+    # 존재하지 않는 run 등 첫 조회 오류는 응답 시작 전에 일반 오류 응답으로 반환된다.
+    runs = await kfp_run_watcher.subscribe(run_id)
+
+    async def event_stream():
+        async for run in runs:
+            yield f"data: {json.dumps(run, default=str)}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+@router.websocket("/runs/{run_id}/watch")
+async def watch_run_websocket(websocket: WebSocket, run_id: str):
+    await websocket.accept()
+    try:
+        async for run in await kfp_run_watcher.subscribe(run_id):
+            await websocket.send_json(Response.from_result(MODULE_CODE, run).dict())
+        await websocket.close()
+    except KFPException as e:
+        await websocket.send_json({"code": e.code, "message": e.message, "result": e.result})
+        await websocket.close(code=1011)
+    except WebSocketDisconnect:
+        pass
 
 
 @router.get("/runs/{run_id}/{timeout}", tags=["kfp"], response_model=Response)
 async def wait_for_run_completion(run_id: str, timeout: int):
-    return Response.from_result(MODULE_CODE, kfp_service.wait_for_run_completion(run_id, timeout))
+    return Response.from_result(MODULE_CODE, await kfp_run_watcher.wait(run_id, timeout))
 
 
 @router.get("/recurring-runs", tags=["kfp"], response_model=Response)
 async def list_recurring_runs(page_token: str = '', page_size: int = 10, sort_by: str = '',
                               experiment_id: Optional[str] = None):
-    return Response.from_result(MODULE_CODE, kfp_service.list_recurring_runs(page_token=page_token,
-                                                                             page_size=page_size,
-                                                                             sort_by=sort_by,
-                                                                             experiment_id=experiment_id))
+    result = await kfp_async_service.list_recurring_runs(page_token=page_token, page_size=page_size, sort_by=sort_by,
+                                                         experiment_id=experiment_id)
+    return Response.from_result(MODULE_CODE, result)
 
 
 @router.post("/recurring-runs", tags=["kfp"], response_model=Response)
 async def create_recurring_run(recurring_run: RecurringRun):
-    return Response.from_result(MODULE_CODE, kfp_service.create_recurring_run(recurring_run))
+    return Response.from_result(MODULE_CODE, await kfp_async_service.create_recurring_run(recurring_run))
 
 
 @router.get("/recurring-runs/{recurring_run_id}", tags=["kfp"], response_model=Response)
 async def get_recurring_run(recurring_run_id: str):
-    return Response.from_result(MODULE_CODE, kfp_service.get_recurring_run(recurring_run_id))
+    return Response.from_result(MODULE_CODE, await kfp_async_service.get_recurring_run(recurring_run_id))
 
 
 @router.delete("/recurring-runs/{recurring_run_id}", tags=["kfp"], response_model=Response)
 async def delete_recurring_run(recurring_run_id: str):
-    return Response.from_result(MODULE_CODE, kfp_service.delete_recurring_run(recurring_run_id))
+    return Response.from_result(MODULE_CODE, await kfp_async_service.delete_recurring_run(recurring_run_id))
 
 
 @router.patch("/recurring-runs/{recurring_run_id}/disable", tags=["kfp"], response_model=Response)
 async def disable_recurring_run(recurring_run_id: str):
-    return Response.from_result(MODULE_CODE, kfp_service.disable_recurring_run(recurring_run_id))
+    return Response.from_result(MODULE_CODE, await kfp_async_service.disable_recurring_run(recurring_run_id))
 
 
 @router.patch("/recurring-runs/{recurring_run_id}/enable", tags=["kfp"], response_model=Response)
 async def enable_recurring_run(recurring_run_id: str):
-    return Response.from_result(MODULE_CODE, kfp_service.enable_recurring_run(recurring_run_id))
+    return Response.from_result(MODULE_CODE, await kfp_async_service.enable_recurring_run(recurring_run_id))
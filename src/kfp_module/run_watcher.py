@@ -0,0 +1,187 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Optional, Set
+
+from src.kfp_module.async_service import AsyncKfpService
+from src.kfp_module.exceptions import KFPException, KFPHttpError
+
+TERMINAL_STATES = {"SUCCEEDED", "FAILED", "SKIPPED", "CANCELED"}
+
+
+def is_terminal(run: Optional[dict]):
+    return run is not None and str(run.get("state", "")).upper() in TERMINAL_STATES
+
+
+class WatchedRun:
+    def __init__(self, run_id: str):
+        self.run_id = run_id
+        self.run = None
+        self.done = asyncio.Event()
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.waiters = 0
+        self.finished_at = None
+
+    def update(self, run: dict):
+        changed = self.run is None or self.run.get("state") != run.get("state")
+        self.run = run
+        if changed:
+            for queue in self.subscribers:
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(run)
+        if is_terminal(run) and not self.done.is_set():
+            self.finished_at = time.time()
+            self.done.set()
+
+    def is_idle(self):
+        return self.waiters == 0 and len(self.subscribers) == 0
+
+
+class RunWatcher:
+    """
+    여러 클라이언트가 기다리는 run 들의 상태를 하나의 백그라운드 poller 가 일괄 조회(list_runs filter)하여 공유한다.
+    대기 중인 요청은 스레드를 점유하지 않고 asyncio.Event / Queue 로 완료 또는 상태 변경을 전달받는다.
+    """
+
+    def __init__(self, kfp_async_service: AsyncKfpService, interval: float = 5.0, batch_size: int = 50,
+                 retention_seconds: float = 60.0, queue_size: int = 16):
+        self.kfp_async_service = kfp_async_service
+        self.interval = interval
+        self.batch_size = batch_size
+        self.retention_seconds = retention_seconds
+        self.queue_size = queue_size
+        self._runs: Dict[str, WatchedRun] = {}
+        self._wakeup = None
+        self._task = None
+        self.poll_count = 0
+
+    def start(self):
+        if self._task is not None and not self._task.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run_loop())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def _register(self, run_id: str):
+        watched = self._runs.get(run_id)
+        if watched is not None:
+            return watched, False
+        watched = WatchedRun(run_id)
+        self._runs[run_id] = watched
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return watched, True
+
+    async def _fetch_first(self, watched: WatchedRun, created: bool):
+        # 최초 등록 시 한 번 조회하여 이미 종료된 run 은 poll 주기를 기다리지 않고 응답
+        if not created:
+            return
+        try:
+            watched.update(await self.kfp_async_service.get_run(watched.run_id))
+        except KFPException as e:
+            if isinstance(e, KFPHttpError) and e.status_code == 404:
+                raise
+            # 일시적인 오류는 대기 중인 요청을 실패시키지 않고 poll 에서 다시 조회
+            logging.warning(f"KFP run {watched.run_id} fetch failed, retrying in poll: {e.message}")
+
+    async def wait(self, run_id: str, timeout: float):
+        """run 이 종료 상태가 되거나 timeout 이 지날 때까지 대기 후 마지막으로 조회된 run 을 반환 (long-poll)"""
+        watched, created = self._register(run_id)
+        watched.waiters += 1
+        try:
+            await self._fetch_first(watched, created)
+            await asyncio.wait_for(watched.done.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            watched.waiters -= 1
+        return watched.run
+
+    async def subscribe(self, run_id: str):
+        """
+        run 을 먼저 조회한 뒤, 상태가 바뀔 때마다 run 을 전달하고 종료 상태가 되면 끝나는 async generator 를 반환한다.
+        존재하지 않는 run 은 여기서 예외가 발생하므로 응답을 시작하기 전에 처리할 수 있다.
+        """
+        watched, created = self._register(run_id)
+        watched.waiters += 1
+        try:
+            await self._fetch_first(watched, created)
+        finally:
+            watched.waiters -= 1
+        return self._iter_updates(run_id)
+
+    async def _iter_updates(self, run_id: str):
+        # 반환 후 iteration 이 시작되기 전에 정리되었을 수 있으므로 다시 등록한다.
+        watched, _ = self._register(run_id)
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        watched.subscribers.add(queue)
+        try:
+            if watched.run is not None:
+                queue.put_nowait(watched.run)
+            while True:
+                run = await queue.get()
+                yield run
+                if is_terminal(run):
+                    return
+        finally:
+            watched.subscribers.discard(queue)
+
+    async def _run_loop(self):
+        while True:
+            if not self._runs:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            await asyncio.sleep(self.interval)
+            try:
+                await self.poll()
+            except KFPException as e:
+                logging.warning(f"KFP run watcher poll failed: {e.message}")
+            except Exception as e:
+                logging.exception(f"KFP run watcher poll failed: {e}")
+            self._purge()
+
+    async def poll(self):
+        pending = [run_id for run_id, watched in self._runs.items() if not watched.done.is_set()]
+        for index in range(0, len(pending), self.batch_size):
+            batch = pending[index:index + self.batch_size]
+            for run in await self._fetch_runs(batch):
+                watched = self._runs.get(run.get("run_id"))
+                if watched is not None:
+                    watched.update(run)
+        self.poll_count += 1
+
+    async def _fetch_runs(self, run_ids: list):
+        try:
+            return await self.kfp_async_service.list_runs_by_ids(run_ids)
+        except KFPException:
+            # run_id 필터를 지원하지 않는 서버인 경우 개별 조회로 대체
+            results = await asyncio.gather(*[self.kfp_async_service.get_run(run_id) for run_id in run_ids],
+                                           return_exceptions=True)
+            return [run for run in results if isinstance(run, dict)]
+
+    def _purge(self):
+        now = time.time()
+        expired = [run_id for run_id, watched in self._runs.items()
+                   if watched.is_idle() and (watched.finished_at is None
+                                             or now - watched.finished_at > self.retention_seconds)]
+        for run_id in expired:
+            del self._runs[run_id]
+
+    def get_metrics(self):
+        return {
+            "watched": len(self._runs),
+            "pending": sum(1 for watched in self._runs.values() if not watched.done.is_set()),
+            "waiters": sum(watched.waiters for watched in self._runs.values()),
+            "subscribers": sum(len(watched.subscribers) for watched in self._runs.values()),
+            "polls": self.poll_count,
+        }
@@ -1,8 +1,10 @@
+import math
 import re
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, validator, root_validator
 
+from src.kfp_module.config import get_max_batch_runs
 from src.kfp_module.exceptions import RequestValidationError
 
 
@@ -237,3 +239,44 @@ class RecurringRun(BaseModel):
                 result={"current_name": v}
             )
         return v
+
+
+class RunBatch(BaseModel):
+    runs: Optional[List[Run]] = Field(title="Run 목록",
+                                      description="List of runs to submit.",
+                                      default=None)
+    run_template: Optional[Run] = Field(title="기준 Run",
+                                        description="Base run used with ``parameter_grid``."
+                                                    " One run is submitted per combination of the grid values.",
+                                        default=None)
+    parameter_grid: Optional[Dict[str, List[Any]]] = Field(title="매개 변수 그리드",
+                                                           description="Candidate values for each pipeline parameter.",
+                                                           default=None)
+    max_workers: int = Field(title="최대 동시 제출 수",
+                             description="Maximum number of runs submitted concurrently.",
+                             default=8, ge=1, le=32)
+    max_retries: int = Field(title="최대 재시도 횟수",
+                             description="Retries per run on 429 or 5xx responses from the KFP API.",
+                             default=3, ge=0, le=10)
+
+    @root_validator(allow_reuse=True)
+    def validate_runs(cls, values):
+        runs, run_template, parameter_grid = values.get('runs'), values.get('run_template'), values.get('parameter_grid')
+        if runs and (run_template is not None or parameter_grid):
+            raise RequestValidationError(
+                message="runs cannot be combined with run_template or parameter_grid.",
+                result={"runs": len(runs), "parameter_grid": parameter_grid}
+            )
+        if not runs and (run_template is None or not parameter_grid):
+            raise RequestValidationError(
+                message="Either runs or run_template with parameter_grid is required.",
+                result={"runs": runs, "parameter_grid": parameter_grid}
+            )
+        # 배치 전체가 스레드풀 worker 하나를 점유하므로 한 요청에서 제출할 run 수를 제한한다.
+        count = len(runs) if runs else math.prod(len(candidates) for candidates in parameter_grid.values())
+        if count > get_max_batch_runs():
+            raise RequestValidationError(
+                message=f"A batch can submit at most {get_max_batch_runs()} runs.",
+                result={"runs": count}
+            )
+        return values
@@ -1,6 +1,8 @@
-import base64
+import itertools
 import json
+import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from kfp import Client
@@ -10,68 +12,67 @@ from kfp_server_api import ApiException as KFPApiException
 #     PipelineUploadServiceApi, HealthzServiceApi
 # from kfp_server_api.api_client import ApiClient
 # from kfp_server_api.configuration import Configuration
-from kubernetes import config, client
 from kubernetes.client import ApiException as KubernetesApiException
-from kubernetes.client import AuthenticationV1TokenRequest, V1ObjectMeta, V1TokenRequestSpec
 
+from src.kfp_module.cache import KfpListCache
+from src.kfp_module.client import KfpClientPool
 from src.kfp_module.exceptions import KFPApiError
+from src.kfp_module.package_index import PipelinePackageIndex
 from src.kfp_module.schemas import Experiment, Pipeline, PipelineVersion, Run, RecurringRun, RunPipelinePackage, \
-    RunPipelineBase
+    RunPipelineBase, RunBatch
+from src.kfp_module.token_manager import KfpTokenManager
+from src.kubernetes_module.client import ClientFactory
 
 
 class KfpService:
     def __init__(self, host, config_file, sa_name: str = 'default-editor',
                  namespace: str = 'kubeflow-user-example-com'):
-        config.load_kube_config(config_file=config_file)
+        ClientFactory.get_configuration(config_file=config_file)
         self.host = host
         self.sa_name = sa_name
         self.namespace = namespace
-        self.token = None
+        self.token_manager = KfpTokenManager(sa_name=sa_name, namespace=namespace)
+        self.client_pool = KfpClientPool()
+        self.list_cache = KfpListCache()
+        self.package_index = PipelinePackageIndex()
 
     def is_token_expired(self):
-        if self.token is None:
-            return True
-        payload = self.token.split(".")[1]
-        payload = payload + '=' * (4 - len(payload) % 4)
-        payload = base64.b64decode(payload).decode()
-        payload = json.loads(payload)
-        exp = payload['exp']
-        now = time.time()
-        if exp < now:
-            return True
-        return False
+        return self.token_manager.is_expired()
 
     @staticmethod
     def get_cluster_client():
-        return client.CoreV1Api()
+        return ClientFactory.get_core_client()
 
     def get_token(self):
         try:
-            if self.is_token_expired():
-                self.token = self.get_cluster_client(). \
-                    create_namespaced_service_account_token(name=self.sa_name,
-                                                            namespace=self.namespace,
-                                                            body=AuthenticationV1TokenRequest(
-                                                                api_version="authentication.k8s.io/v1",
-                                                                kind="TokenRequest",
-                                                                metadata=V1ObjectMeta(
-                                                                    name=self.sa_name,
-                                                                    namespace=self.namespace),
-                                                                spec=V1TokenRequestSpec(
-                                                                    audiences=[
-                                                                        "pipelines.kubeflow.org"],
-                                                                    expiration_seconds=7200))
-                                                            ).status.token
-            return self.token
-        except KFPApiException or KubernetesApiException as e:
+            return self.token_manager.get_token()
+        except (KFPApiException, KubernetesApiException) as e:
             raise KFPApiError(e)
 
+    def start_token_refresher(self):
+        self.token_manager.start()
+
+    def stop_token_refresher(self):
+        self.token_manager.stop()
+
     def get_kfp_client(self):
         try:
-            return Client(host=self.host, namespace=self.namespace, existing_token=self.get_token())
+            return self.client_pool.get_client(host=self.host, namespace=self.namespace, token=self.get_token())
         except KFPApiException or KubernetesApiException as e:
             raise KFPApiError(e)
 
+    def get_metrics(self):
+        return {"client": self.client_pool.get_metrics(), "token": self.token_manager.get_metrics(),
+                "cache": self.list_cache.get_metrics(), "package_index": self.package_index.get_metrics()}
+
+    def _cached(self, key: tuple, load: callable):
+        result = self.list_cache.get(key)
+        if result is None:
+            generation = self.list_cache.generation(key[0])
+            result = load()
+            self.list_cache.set(key, result, generation)
+        return result
+
     # def get_api_client(self):
     #     try:
     #         kfp_config = Configuration()
@@ -127,9 +128,10 @@ class KfpService:
     def list_experiments(self, filter_option: Optional[str] = None, page_token: str = '', page_size: int = 10,
                          sort_by: str = ''):
         try:
-            return self.get_kfp_client().list_experiments(page_token=page_token, page_size=page_size, sort_by=sort_by,
-                                                          filter=filter_option,
-                                                          namespace=self.namespace).to_dict()
+            key = ("experiments", "sync", self.namespace, page_token, page_size, sort_by, filter_option)
+            return self._cached(key, lambda: self.get_kfp_client().list_experiments(
+                page_token=page_token, page_size=page_size, sort_by=sort_by, filter=filter_option,
+                namespace=self.namespace).to_dict())
         except KFPApiException or KubernetesApiException as e:
             raise KFPApiError(e)
 
@@ -161,8 +163,10 @@ class KfpService:
 
     def create_experiment(self, experiment: Experiment):
         try:
-            return self.get_kfp_client().create_experiment(name=experiment.name, description=experiment.description,
-                                                           namespace=self.namespace).to_dict()
+            result = self.get_kfp_client().create_experiment(name=experiment.name, description=experiment.description,
+                                                             namespace=self.namespace).to_dict()
+            self.list_cache.invalidate("experiments")
+            return result
         except KFPApiException or KubernetesApiException as e:
             raise KFPApiError(e)
 
@@ -175,34 +179,68 @@ class KfpService:
 
     def archive_experiment(self, experiment_id: str):
         try:
-            return self.get_kfp_client().archive_experiment(experiment_id=experiment_id)
+            result = self.get_kfp_client().archive_experiment(experiment_id=experiment_id)
+            self.list_cache.invalidate("experiments", "runs")
+            return result
         except KFPApiException or KubernetesApiException as e:
             raise KFPApiError(e)
 
     def unarchive_experiment(self, experiment_id: str):
         try:
-            return self.get_kfp_client().unarchive_experiment(experiment_id=experiment_id)
+            result = self.get_kfp_client().unarchive_experiment(experiment_id=experiment_id)
+            self.list_cache.invalidate("experiments", "runs")
+            return result
         except KFPApiException or KubernetesApiException as e:
             raise KFPApiError(e)
 
     def delete_experiment(self, experiment_id: str):
         try:
-            return self.get_kfp_client().delete_experiment(experiment_id=experiment_id)
+            result = self.get_kfp_client().delete_experiment(experiment_id=experiment_id)
+            self.list_cache.invalidate("experiments", "runs", "recurring_runs")
+            return result
         except KFPApiException or KubernetesApiException as e:
             raise KFPApiError(e)
 
     def list_pipelines(self, page_token: str = '', page_size: int = 10, sort_by: str = ''):
         try:
-            return self.get_kfp_client().list_pipelines(page_token=page_token, page_size=page_size,
-                                                        sort_by=sort_by).to_dict()
+            key = ("pipelines", "sync", self.namespace, page_token, page_size, sort_by)
+            return self._cached(key, lambda: self.get_kfp_client().list_pipelines(
+                page_token=page_token, page_size=page_size, sort_by=sort_by).to_dict())
         except KFPApiException or KubernetesApiException as e:
             raise KFPApiError(e)
 
+    def _find_uploaded_package(self, package_hash: str, resource_type: str, target: Optional[str]):
+        uploaded = self.package_index.find(package_hash, resource_type, target)
+        if uploaded is None:
+            return None
+        try:
+            # KFP UI 등에서 삭제된 경우를 대비하여 존재 여부만 가볍게 확인
+            if resource_type == PipelinePackageIndex.PIPELINE:
+                self.get_kfp_client().get_pipeline(pipeline_id=uploaded["pipeline_id"])
+            else:
+                self.get_kfp_client().get_pipeline_version(pipeline_id=uploaded["pipeline_id"],
+                                                           pipeline_version_id=uploaded["pipeline_version_id"])
+        except KFPApiException as e:
+            if e.status != 404:
+                raise
+            self.package_index.remove(uploaded["pipeline_id"], uploaded["pipeline_version_id"])
+            return None
+        return uploaded["result"]
+
     def upload_pipeline(self, pipeline: Pipeline):
         try:
-            return self.get_kfp_client().upload_pipeline(pipeline_package_path=pipeline.pipeline_package_path,
-                                                         pipeline_name=pipeline.pipeline_name,
-                                                         description=pipeline.description).to_dict()
+            package_hash = self.package_index.hash_package(pipeline.pipeline_package_path)
+            # 같은 패키지라도 다른 이름으로 올리면 새 pipeline 을 만들도록 이름까지 비교
+            target = PipelinePackageIndex.target_of(pipeline.pipeline_name)
+            uploaded = self._find_uploaded_package(package_hash, PipelinePackageIndex.PIPELINE, target)
+            if uploaded is not None:
+                return uploaded
+            result = self.get_kfp_client().upload_pipeline(pipeline_package_path=pipeline.pipeline_package_path,
+                                                           pipeline_name=pipeline.pipeline_name,
+                                                           description=pipeline.description).to_dict()
+            self.list_cache.invalidate("pipelines", "pipeline_versions")
+            self.package_index.save(package_hash, PipelinePackageIndex.PIPELINE, result, target)
+            return result
         except KFPApiException or KubernetesApiException as e:
             raise KFPApiError(e)
 
@@ -214,7 +252,10 @@ class KfpService:
 
     def delete_pipeline(self, pipeline_id: str):
         try:
-            return self.get_kfp_client().delete_pipeline(pipeline_id=pipeline_id)
+            result = self.get_kfp_client().delete_pipeline(pipeline_id=pipeline_id)
+            self.list_cache.invalidate("pipelines", "pipeline_versions")
+            self.package_index.remove(pipeline_id)
+            return result
         except KFPApiException or KubernetesApiException as e:
             raise KFPApiError(e)
 
@@ -227,26 +268,39 @@ class KfpService:
     def list_pipeline_versions(self, pipeline_id: str, page_token: str = '', page_size: int = 10,
                                sort_by: str = ''):
         try:
-            return self.get_kfp_client().list_pipeline_versions(pipeline_id=pipeline_id, page_token=page_token,
-                                                                page_size=page_size, sort_by=sort_by).to_dict()
+            key = ("pipeline_versions", "sync", pipeline_id, page_token, page_size, sort_by)
+            return self._cached(key, lambda: self.get_kfp_client().list_pipeline_versions(
+                pipeline_id=pipeline_id, page_token=page_token, page_size=page_size, sort_by=sort_by).to_dict())
         except KFPApiException or KubernetesApiException as e:
             raise KFPApiError(e)
 
     def upload_pipeline_version(self, pipeline_version: PipelineVersion):
         try:
-            return self.get_kfp_client().upload_pipeline_version(
+            package_hash = self.package_index.hash_package(pipeline_version.pipeline_package_path)
+            target = PipelinePackageIndex.target_of(pipeline_version.pipeline_id or pipeline_version.pipeline_name,
+                                                    pipeline_version.pipeline_version_name)
+            uploaded = self._find_uploaded_package(package_hash, PipelinePackageIndex.PIPELINE_VERSION, target)
+            if uploaded is not None:
+                return uploaded
+            result = self.get_kfp_client().upload_pipeline_version(
                 pipeline_package_path=pipeline_version.pipeline_package_path,
                 pipeline_version_name=pipeline_version.pipeline_version_name,
                 pipeline_id=pipeline_version.pipeline_id,
                 pipeline_name=pipeline_version.pipeline_name,
                 description=pipeline_version.description).to_dict()
+            self.list_cache.invalidate("pipeline_versions")
+            self.package_index.save(package_hash, PipelinePackageIndex.PIPELINE_VERSION, result, target)
+            return result
         except KFPApiException or KubernetesApiException as e:
             raise KFPApiError(e)
 
     def delete_pipeline_version(self, pipeline_id: str, version_id: str):
         try:
-            return self.get_kfp_client().delete_pipeline_version(pipeline_id=pipeline_id,
-                                                                 pipeline_version_id=version_id)
+            result = self.get_kfp_client().delete_pipeline_version(pipeline_id=pipeline_id,
+                                                                   pipeline_version_id=version_id)
+            self.list_cache.invalidate("pipeline_versions")
+            self.package_index.remove(pipeline_id, version_id)
+            return result
         except KFPApiException or KubernetesApiException as e:
             raise KFPApiError(e)
 
@@ -260,49 +314,110 @@ class KfpService:
     def list_runs(self, page_token: str = '', page_size: int = 10, sort_by: str = '',
                   experiment_id: Optional[str] = None):
         try:
-            return self.get_kfp_client().list_runs(page_token=page_token, page_size=page_size, sort_by=sort_by,
-                                                   experiment_id=experiment_id,
-                                                   namespace=self.namespace).to_dict()
+            key = ("runs", "sync", self.namespace, page_token, page_size, sort_by, experiment_id)
+            return self._cached(key, lambda: self.get_kfp_client().list_runs(
+                page_token=page_token, page_size=page_size, sort_by=sort_by, experiment_id=experiment_id,
+                namespace=self.namespace).to_dict())
         except KFPApiException or KubernetesApiException as e:
             raise KFPApiError(e)
 
     def run_pipeline(self, run: Run):
         try:
-            return self.get_kfp_client().run_pipeline(experiment_id=run.experiment_id,
-                                                      job_name=run.job_name,
-                                                      pipeline_package_path=run.pipeline_package_path,
-                                                      params=run.params,
-                                                      pipeline_id=run.pipeline_id,
-                                                      version_id=run.version_id,
-                                                      pipeline_root=run.pipeline_root,
-                                                      enable_caching=run.enable_caching,
-                                                      service_account=self.sa_name).to_dict()
+            result = self.get_kfp_client().run_pipeline(experiment_id=run.experiment_id,
+                                                        job_name=run.job_name,
+                                                        pipeline_package_path=run.pipeline_package_path,
+                                                        params=run.params,
+                                                        pipeline_id=run.pipeline_id,
+                                                        version_id=run.version_id,
+                                                        pipeline_root=run.pipeline_root,
+                                                        enable_caching=run.enable_caching,
+                                                        service_account=self.sa_name).to_dict()
+            self.list_cache.invalidate("runs")
+            return result
         except KFPApiException or KubernetesApiException as e:
             raise KFPApiError(e)
 
+    @staticmethod
+    def expand_runs(run_batch: RunBatch):
+        if run_batch.runs:
+            return list(run_batch.runs)
+        template = run_batch.run_template
+        keys = list(run_batch.parameter_grid.keys())
+        runs = []
+        for index, values in enumerate(itertools.product(*[run_batch.parameter_grid[key] for key in keys])):
+            params = dict(template.params or {})
+            params.update(zip(keys, values))
+            runs.append(template.copy(update={"job_name": f"{template.job_name}_{index}", "params": params}))
+        return runs
+
+    def _submit_run(self, kfp_client: Client, index: int, run: Run, max_retries: int):
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                result = kfp_client.run_pipeline(experiment_id=run.experiment_id,
+                                                 job_name=run.job_name,
+                                                 pipeline_package_path=run.pipeline_package_path,
+                                                 params=run.params,
+                                                 pipeline_id=run.pipeline_id,
+                                                 version_id=run.version_id,
+                                                 pipeline_root=run.pipeline_root,
+                                                 enable_caching=run.enable_caching,
+                                                 service_account=self.sa_name).to_dict()
+                return {"index": index, "job_name": run.job_name, "success": True, "attempts": attempt,
+                        "result": result}
+            except KFPApiException as e:
+                retryable = e.status == 429 or (e.status is not None and e.status >= 500)
+                if not retryable or attempt > max_retries:
+                    return {"index": index, "job_name": run.job_name, "success": False, "attempts": attempt,
+                            "result": {"status": e.status, "reason": e.reason, "body": e.body}}
+                # exponential backoff + jitter
+                time.sleep(min(0.5 * 2 ** (attempt - 1), 10) + random.uniform(0, 0.5))
+            except Exception as e:
+                return {"index": index, "job_name": run.job_name, "success": False, "attempts": attempt,
+                        "result": {"reason": str(e)}}
+
+    def run_pipeline_batch(self, run_batch: RunBatch):
+        runs = self.expand_runs(run_batch)
+        # 배치 전체에서 하나의 토큰과 클라이언트를 공유
+        kfp_client = self.get_kfp_client()
+        with ThreadPoolExecutor(max_workers=max(1, min(run_batch.max_workers, len(runs))),
+                                thread_name_prefix="kfp-run-batch") as executor:
+            results = list(executor.map(
+                lambda item: self._submit_run(kfp_client, item[0], item[1], run_batch.max_retries),
+                enumerate(runs)))
+        self.list_cache.invalidate("runs")
+        succeeded = sum(1 for result in results if result["success"])
+        return {"total": len(results), "succeeded": succeeded, "failed": len(results) - succeeded,
+                "results": results}
+
     def create_run_from_pipeline_package(self, run: RunPipelinePackage):
         try:
-            return self.get_kfp_client().create_run_from_pipeline_package(pipeline_file=run.pipeline_file,
-                                                                          arguments=run.arguments,
-                                                                          run_name=run.run_name,
-                                                                          namespace=self.namespace,
-                                                                          pipeline_root=run.pipeline_root,
-                                                                          enable_caching=run.enable_caching,
-                                                                          service_account=self.sa_name,
-                                                                          experiment_id=run.experiment_id)
+            result = self.get_kfp_client().create_run_from_pipeline_package(pipeline_file=run.pipeline_file,
+                                                                            arguments=run.arguments,
+                                                                            run_name=run.run_name,
+                                                                            namespace=self.namespace,
+                                                                            pipeline_root=run.pipeline_root,
+                                                                            enable_caching=run.enable_caching,
+                                                                            service_account=self.sa_name,
+                                                                            experiment_id=run.experiment_id)
+            self.list_cache.invalidate("runs")
+            return result
         except KFPApiException or KubernetesApiException as e:
             raise KFPApiError(e)
 
     def create_run_from_pipeline_func(self, pipeline_func: base_component.BaseComponent, run: RunPipelineBase):
         try:
-            return self.get_kfp_client().create_run_from_pipeline_func(pipeline_func=pipeline_func,
-                                                                       arguments=run.arguments,
-                                                                       run_name=run.run_name,
-                                                                       namespace=self.namespace,
-                                                                       pipeline_root=run.pipeline_root,
-                                                                       enable_caching=run.enable_caching,
-                                                                       service_account=self.sa_name,
-                                                                       experiment_id=run.experiment_id)
+            result = self.get_kfp_client().create_run_from_pipeline_func(pipeline_func=pipeline_func,
+                                                                         arguments=run.arguments,
+                                                                         run_name=run.run_name,
+                                                                         namespace=self.namespace,
+                                                                         pipeline_root=run.pipeline_root,
+                                                                         enable_caching=run.enable_caching,
+                                                                         service_account=self.sa_name,
+                                                                         experiment_id=run.experiment_id)
+            self.list_cache.invalidate("runs")
+            return result
         except KFPApiException or KubernetesApiException as e:
             raise KFPApiError(e)
 
@@ -321,31 +436,33 @@ class KfpService:
     def list_recurring_runs(self, page_token: str = '', page_size: int = 10, sort_by: str = '',
                             experiment_id: Optional[str] = None):
         try:
-            return self.get_kfp_client().list_recurring_runs(page_token=page_token, page_size=page_size,
-                                                             sort_by=sort_by,
-                                                             experiment_id=experiment_id,
-                                                             namespace=self.namespace).to_dict()
+            key = ("recurring_runs", "sync", self.namespace, page_token, page_size, sort_by, experiment_id)
+            return self._cached(key, lambda: self.get_kfp_client().list_recurring_runs(
+                page_token=page_token, page_size=page_size, sort_by=sort_by, experiment_id=experiment_id,
+                namespace=self.namespace).to_dict())
         except KFPApiException or KubernetesApiException as e:
             raise KFPApiError(e)
 
     def create_recurring_run(self, recurring_run: RecurringRun):
         try:
-            return self.get_kfp_client().create_recurring_run(experiment_id=recurring_run.experiment_id,
-                                                              job_name=recurring_run.job_name,
-                                                              description=recurring_run.description,
-                                                              start_time=recurring_run.start_time,
-                                                              end_time=recurring_run.end_time,
-                                                              interval_second=recurring_run.interval_second,
-                                                              cron_expression=recurring_run.cron_expression,
-                                                              max_concurrency=recurring_run.max_concurrency,
-                                                              no_catchup=recurring_run.no_catchup,
-                                                              params=recurring_run.params,
-                                                              pipeline_package_path=recurring_run.pipeline_package_path,
-                                                              pipeline_id=recurring_run.pipeline_id,
-                                                              version_id=recurring_run.version_id,
-                                                              enabled=recurring_run.enabled,
-                                                              enable_caching=recurring_run.enable_caching,
-                                                              service_account=self.sa_name).to_dict()
+            result = self.get_kfp_client().create_recurring_run(experiment_id=recurring_run.experiment_id,
+                                                                job_name=recurring_run.job_name,
+                                                                description=recurring_run.description,
+                                                                start_time=recurring_run.start_time,
+                                                                end_time=recurring_run.end_time,
+                                                                interval_second=recurring_run.interval_second,
+                                                                cron_expression=recurring_run.cron_expression,
+                                                                max_concurrency=recurring_run.max_concurrency,
+                                                                no_catchup=recurring_run.no_catchup,
+                                                                params=recurring_run.params,
+                                                                pipeline_package_path=recurring_run.pipeline_package_path,
+                                                                pipeline_id=recurring_run.pipeline_id,
+                                                                version_id=recurring_run.version_id,
+                                                                enabled=recurring_run.enabled,
+                                                                enable_caching=recurring_run.enable_caching,
+                                                                service_account=self.sa_name).to_dict()
+            self.list_cache.invalidate("recurring_runs")
+            return result
         except KFPApiException or KubernetesApiException as e:
             raise KFPApiError(e)
 
@@ -357,19 +474,25 @@ class KfpService:
 
     def delete_recurring_run(self, recurring_run_id: str):
         try:
-            return self.get_kfp_client().delete_recurring_run(recurring_run_id=recurring_run_id)
+            result = self.get_kfp_client().delete_recurring_run(recurring_run_id=recurring_run_id)
+            self.list_cache.invalidate("recurring_runs")
+            return result
         except KFPApiException or KubernetesApiException as e:
             raise KFPApiError(e)
 
     def disable_recurring_run(self, recurring_run_id: str):
         try:
-            return self.get_kfp_client().disable_recurring_run(recurring_run_id=recurring_run_id)
+            result = self.get_kfp_client().disable_recurring_run(recurring_run_id=recurring_run_id)
+            self.list_cache.invalidate("recurring_runs")
+            return result
         except KFPApiException or KubernetesApiException as e:
             raise KFPApiError(e)
 
     def enable_recurring_run(self, recurring_run_id: str):
         try:
-            return self.get_kfp_client().enable_recurring_run(recurring_run_id=recurring_run_id)
+            result = self.get_kfp_client().enable_recurring_run(recurring_run_id=recurring_run_id)
+            self.list_cache.invalidate("recurring_runs")
+            return result
         except KFPApiException or KubernetesApiException as e:
             raise KFPApiError(e)
 
@@ -0,0 +1,124 @@
+import base64
+import json
+import logging
+import threading
+import time
+from typing import Optional
+
+from kubernetes.client import AuthenticationV1TokenRequest, V1ObjectMeta, V1TokenRequestSpec
+
+from src.kubernetes_module.client import ClientFactory
+
+
+class KfpTokenManager:
+    """
+    KFP 호출에 사용하는 ServiceAccount 토큰(TokenRequest)을 관리한다.
+    - 만료 시각(exp)은 발급 시 한 번만 계산하여 캐싱
+    - 유효기간의 refresh_ratio 지점이 지나면 미리 갱신 (refresh-ahead)
+    - 동시에 여러 요청이 갱신을 시도해도 실제 발급은 한 번만 수행 (single-flight)
+    """
+
+    def __init__(self, sa_name: str, namespace: str, audiences: Optional[list] = None,
+                 expiration_seconds: int = 7200, refresh_ratio: float = 0.8, retry_seconds: int = 30):
+        self.sa_name = sa_name
+        self.namespace = namespace
+        self.audiences = audiences or ["pipelines.kubeflow.org"]
+        self.expiration_seconds = expiration_seconds
+        self.refresh_ratio = refresh_ratio
+        self.retry_seconds = retry_seconds
+        self._token = None
+        self._expires_at = 0.0
+        self._refresh_at = 0.0
+        self._refresh_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.refreshed_count = 0
+
+    @staticmethod
+    def get_cluster_client():
+        return ClientFactory.get_core_client()
+
+    @staticmethod
+    def decode_exp(token: str) -> float:
+        payload = token.split(".")[1]
+        payload = payload + '=' * (4 - len(payload) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(payload).decode())
+        return float(payload['exp'])
+
+    def is_expired(self) -> bool:
+        return self._token is None or self._expires_at <= time.time()
+
+    def needs_refresh(self) -> bool:
+        return self._token is None or self._refresh_at <= time.time()
+
+    def get_token(self) -> str:
+        if not self.needs_refresh():
+            return self._token
+
+        if not self.is_expired():
+            # 아직 유효한 토큰이 있으면 다른 스레드가 갱신 중일 때 기다리지 않고 현재 토큰을 사용한다.
+            if self._refresh_lock.acquire(blocking=False):
+                try:
+                    if self.needs_refresh():
+                        self._refresh()
+                finally:
+                    self._refresh_lock.release()
+            return self._token
+
+        with self._refresh_lock:
+            if self.is_expired():
+                self._refresh()
+            return self._token
+
+    def _refresh(self):
+        issued_at = time.time()
+        status = self.get_cluster_client().create_namespaced_service_account_token(
+            name=self.sa_name,
+            namespace=self.namespace,
+            body=AuthenticationV1TokenRequest(
+                api_version="authentication.k8s.io/v1",
+                kind="TokenRequest",
+                metadata=V1ObjectMeta(name=self.sa_name, namespace=self.namespace),
+                spec=V1TokenRequestSpec(audiences=self.audiences, expiration_seconds=self.expiration_seconds))
+        ).status
+
+        if status.expiration_timestamp is not None:
+            expires_at = status.expiration_timestamp.timestamp()
+        else:
+            expires_at = self.decode_exp(status.token)
+
+        self._token = status.token
+        self._expires_at = expires_at
+        self._refresh_at = issued_at + (expires_at - issued_at) * self.refresh_ratio
+        self.refreshed_count += 1
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.get_token()
+                wait_seconds = max(self._refresh_at - time.time(), 1)
+            except Exception as e:
+                logging.warning(f"KFP token refresh failed, retry in {self.retry_seconds}s: {e}")
+                wait_seconds = self.retry_seconds
+            self._stop_event.wait(timeout=wait_seconds)
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="kfp-token-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def get_metrics(self):
+        return {
+            "refreshed": self.refreshed_count,
+            "expires_at": self._expires_at,
+            "refresh_at": self._refresh_at,
+            "background": self._thread is not None and self._thread.is_alive(),
+        }
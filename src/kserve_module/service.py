@@ -1,3 +1,4 @@
+import threading
 from typing import List, Optional
 
 from kserve import ApiException
@@ -7,18 +8,32 @@ from kubernetes import client
 from mlflow import MlflowException, MlflowClient
 
 from src.kserve_module.exceptions import KServeApiError
+from src.kubernetes_module.client import ClientFactory
 
 
 class KServeService:
     def __init__(self, config_file):
         self.config_file = config_file
+        self._kserve_client = None
+        self._lock = threading.Lock()
 
     @staticmethod
     def get_mlflow_client():
         return MlflowClient()
 
     def get_kserve_client(self):
-        return KServeClient(config_file=self.config_file)
+        with self._lock:
+            if self._kserve_client is None:
+                # 전역 기본 Configuration 을 덮어쓰지 않도록 별도 Configuration 으로 kubeconfig 를 읽고,
+                # 실제 API 호출은 공용 ApiClient 를 사용하도록 교체
+                kserve_client = KServeClient(config_file=self.config_file,
+                                             client_configuration=client.Configuration())
+                api_client = ClientFactory.get_api_client()
+                kserve_client.core_api = client.CoreV1Api(api_client)
+                kserve_client.app_api = client.AppsV1Api(api_client)
+                kserve_client.api_instance = client.CustomObjectsApi(api_client)
+                self._kserve_client = kserve_client
+            return self._kserve_client
 
     def get_latest_versions_from_mlflow(self, model_name: str, stage: str = None) -> List:
         try:
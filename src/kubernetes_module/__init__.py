@@ -1,17 +1,58 @@
+from functools import partial
+
 from src.kubernetes_module.client import ClientFactory
+from src.kubernetes_module.cluster.informer import WatchCache
+from src.kubernetes_module.cluster.metrics import ResourceUsageCollector
 from src.kubernetes_module.cluster.service import ClusterService
-from src.kubernetes_module.config import load_cluster_config
+from src.kubernetes_module.config import get_watch_cache_config, get_usage_config, get_notebook_culling_config, \
+    get_warm_pool_config
+from src.kubernetes_module.crds.culler import NotebookCuller
 from src.kubernetes_module.crds.service import CrdService
+from src.kubernetes_module.crds.templates import NotebookTemplateService
+from src.kubernetes_module.event_hub import EventHub
 
-load_cluster_config()
+watch_cache_enabled, watch_cache_resync_seconds = get_watch_cache_config()
+watch_cache = WatchCache(resync_seconds=watch_cache_resync_seconds) if watch_cache_enabled else None
 
 cluster_service = ClusterService(
     cluster_client=ClientFactory.get_core_client(),
     deployment_client=ClientFactory.get_deployment_client(),
-    network_client=ClientFactory.get_networking_client()
+    network_client=ClientFactory.get_networking_client(),
+    watch_cache=watch_cache
 )
 
 crd_service = CrdService(
     api_client=ClientFactory.get_api_client(),
-    crd_client=ClientFactory.create_crd_client()
+    crd_client=ClientFactory.create_crd_client(),
+    watch_cache=watch_cache
+)
+
+notebook_culling_enabled, notebook_idle_seconds, notebook_culling_interval = get_notebook_culling_config()
+notebook_culler = NotebookCuller(
+    crd_client=ClientFactory.create_crd_client(),
+    idle_seconds=notebook_idle_seconds,
+    interval=notebook_culling_interval
+)
+
+warm_pool_enabled, warm_pool_namespace, warm_pool_interval = get_warm_pool_config()
+notebook_templates = NotebookTemplateService(
+    api_client=ClientFactory.get_api_client(),
+    crd_client=ClientFactory.create_crd_client(),
+    namespace=warm_pool_namespace,
+    enabled=warm_pool_enabled,
+    interval=warm_pool_interval
 )
+
+usage_collector_enabled, usage_interval = get_usage_config()
+resource_usage = ResourceUsageCollector(
+    api_client=ClientFactory.get_api_client(),
+    interval=usage_interval
+)
+
+event_hub = EventHub(list_funcs={
+    "pods": ClientFactory.get_core_client().list_namespaced_pod,
+    "deployments": ClientFactory.get_deployment_client().list_namespaced_deployment,
+    "services": ClientFactory.get_core_client().list_namespaced_service,
+    "notebooks": partial(ClientFactory.create_crd_client().list_namespaced_custom_object,
+                         group="kubeflow.org", version="v1alpha1", plural="notebooks"),
+})
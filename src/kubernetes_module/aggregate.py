@@ -0,0 +1,71 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+from kubernetes.client.rest import ApiException
+
+
+def _elapsed_ms(started: float):
+    return round((time.monotonic() - started) * 1000, 1)
+
+
+def list_across_namespaces(list_all: Callable[[], list], list_namespaced: Callable[[str], list],
+                           get_namespaces: Callable[[], List[str]], namespace_of: Callable,
+                           namespaces: Optional[List[str]] = None, max_workers: int = 16):
+    """
+    여러 namespace 의 리소스를 모아서 반환한다.
+    - namespaces 를 지정하지 않으면 list_*_for_all_namespaces 한 번으로 조회하고 namespace 별로 묶는다.
+    - 권한이 없거나(403) namespaces 를 지정한 경우 namespace 별 조회를 동시에 실행한다.
+      이때 일부 namespace 의 실패는 error 로 기록하고 나머지 결과는 그대로 반환한다.
+    """
+    started = time.monotonic()
+    if namespaces is None:
+        try:
+            items = list_all()
+            elapsed_ms = _elapsed_ms(started)
+            grouped = {}
+            for item in items:
+                grouped.setdefault(namespace_of(item), []).append(item)
+            return {
+                "source": "all_namespaces",
+                "elapsed_ms": elapsed_ms,
+                "namespaces": {namespace: {"items": namespace_items, "elapsed_ms": elapsed_ms, "error": None}
+                               for namespace, namespace_items in grouped.items()},
+            }
+        except ApiException as e:
+            if e.status != 403:
+                raise
+        namespaces = get_namespaces()
+
+    def list_one(namespace: str):
+        namespace_started = time.monotonic()
+        try:
+            return namespace, {"items": list_namespaced(namespace), "elapsed_ms": _elapsed_ms(namespace_started),
+                               "error": None}
+        except ApiException as e:
+            return namespace, {"items": [], "elapsed_ms": _elapsed_ms(namespace_started),
+                               "error": f"({e.status}) {e.reason}"}
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(namespaces)))) as executor:
+        results = dict(executor.map(list_one, namespaces))
+    return {"source": "fan_out", "elapsed_ms": _elapsed_ms(started), "namespaces": results}
+
+
+def to_aggregated_list(model: dict, to_each_shape: callable):
+    items = []
+    namespaces = []
+    for namespace in sorted(model["namespaces"]):
+        listing = model["namespaces"][namespace]
+        items.extend(dict(to_each_shape(item), namespace=namespace) for item in listing["items"])
+        namespaces.append({
+            "namespace": namespace,
+            "count": len(listing["items"]),
+            "elapsed_ms": listing["elapsed_ms"],
+            "error": listing["error"],
+        })
+    return {
+        "source": model["source"],
+        "elapsed_ms": model["elapsed_ms"],
+        "items": items,
+        "namespaces": namespaces,
+    }
@@ -0,0 +1,71 @@
+from kubernetes.client import ApiClient
+
+# plural: (API 경로, apiVersion, kind)
+APPLY_RESOURCES = {
+    "configmaps": ("/api/v1", "v1", "ConfigMap"),
+    "secrets": ("/api/v1", "v1", "Secret"),
+    "persistentvolumeclaims": ("/api/v1", "v1", "PersistentVolumeClaim"),
+    "deployments": ("/apis/apps/v1", "apps/v1", "Deployment"),
+    "services": ("/api/v1", "v1", "Service"),
+    "ingresses": ("/apis/networking.k8s.io/v1", "networking.k8s.io/v1", "Ingress"),
+}
+
+
+def server_side_apply(api_client: ApiClient, plural: str, namespace: str, body, field_manager: str,
+                      force: bool = True, dry_run: bool = False) -> dict:
+    """
+    ResourceFactory 가 만든 객체를 server-side apply(PATCH application/apply-patch+yaml)로 적용한다.
+    없으면 생성되고 있으면 field_manager 가 관리하는 필드만 갱신된다.
+    """
+    prefix = APPLY_RESOURCES[plural][0]
+    body = to_apply_body(api_client, plural, body)
+    query_params = [("fieldManager", field_manager), ("force", "true" if force else "false")]
+    if dry_run:
+        query_params.append(("dryRun", "All"))
+    return api_client.call_api(
+        f"{prefix}/namespaces/{{namespace}}/{plural}/{{name}}", "PATCH",
+        path_params={"namespace": namespace, "name": body["metadata"]["name"]},
+        query_params=query_params,
+        header_params={"Accept": "application/json", "Content-Type": "application/apply-patch+yaml"},
+        body=body,
+        response_type="object",
+        auth_settings=["BearerToken"],
+        _return_http_data_only=True,
+    )
+
+
+def to_apply_body(api_client: ApiClient, plural: str, body) -> dict:
+    _, api_version, kind = APPLY_RESOURCES[plural]
+    body = api_client.sanitize_for_serialization(body)
+    body.update(apiVersion=api_version, kind=kind)
+    return body
+
+
+def diff_fields(desired, live, path: str = '') -> list:
+    """
+    desired 에 지정된 필드 중 live 와 값이 다른 필드의 경로 목록을 반환한다.
+    API 서버가 채운 기본값 등 desired 에 없는 필드는 비교하지 않는다.
+    containers, ports, volumes 같은 list 는 name 이 있으면 name 으로, 없으면 순서대로 원소를 짝지어 비교한다.
+    """
+    if isinstance(desired, dict) and isinstance(live, dict):
+        changed = []
+        for key, value in desired.items():
+            changed.extend(diff_fields(value, live.get(key), f"{path}.{key}" if path else key))
+        return changed
+    if isinstance(desired, list) and isinstance(live, list):
+        if len(desired) != len(live):
+            return [path]
+        if all(isinstance(item, dict) and 'name' in item for item in desired):
+            live_by_name = {item.get('name'): item for item in live if isinstance(item, dict)}
+            changed = []
+            for item in desired:
+                if item['name'] not in live_by_name:
+                    changed.append(f"{path}[{item['name']}]")
+                else:
+                    changed.extend(diff_fields(item, live_by_name[item['name']], f"{path}[{item['name']}]"))
+            return changed
+        changed = []
+        for index, (item, live_item) in enumerate(zip(desired, live)):
+            changed.extend(diff_fields(item, live_item, f"{path}[{index}]"))
+        return changed
+    return [] if desired == live else [path]
@@ -1,23 +1,88 @@
+import socket
+import threading
+
+import httpx
 from kubernetes import client
+from urllib3 import Retry
+from urllib3.connection import HTTPConnection
+
+from src.kubernetes_module.config import load_cluster_config, get_connection_pool_config
 
 
 class ClientFactory:
+    """
+    프로세스 전체에서 kubeconfig 를 한 번만 읽고 하나의 ApiClient(urllib3 connection pool)를 공유한다.
+    KFP, KServe, Kubernetes 모듈의 모든 API 객체는 이 ApiClient 를 사용한다.
+    """
+    _lock = threading.Lock()
+    _configuration = None
+    _api_client = None
+    _async_http_client = None
+
+    @staticmethod
+    def get_configuration(config_file: str = None) -> client.Configuration:
+        with ClientFactory._lock:
+            if ClientFactory._configuration is None:
+                configuration = client.Configuration()
+                load_cluster_config(config_file=config_file, client_configuration=configuration)
+                pool_maxsize, retries = get_connection_pool_config()
+                configuration.connection_pool_maxsize = pool_maxsize
+                # 연결 실패만 재시도 (POST 등 비멱등 요청이 중복 실행되지 않도록 read/status 재시도는 하지 않음)
+                configuration.retries = Retry(total=retries, connect=retries, read=0, status=0, backoff_factor=0.2)
+                configuration.socket_options = HTTPConnection.default_socket_options + [
+                    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                ]
+                client.Configuration.set_default(configuration)
+                ClientFactory._configuration = configuration
+            return ClientFactory._configuration
+
+    @staticmethod
+    def get_api_client() -> client.ApiClient:
+        configuration = ClientFactory.get_configuration()
+        with ClientFactory._lock:
+            if ClientFactory._api_client is None:
+                ClientFactory._api_client = client.ApiClient(configuration=configuration)
+            return ClientFactory._api_client
+
     @staticmethod
     def get_core_client():
-        return client.CoreV1Api()
+        return client.CoreV1Api(ClientFactory.get_api_client())
 
     @staticmethod
     def get_deployment_client():
-        return client.AppsV1Api()
+        return client.AppsV1Api(ClientFactory.get_api_client())
 
     @staticmethod
     def get_networking_client():
-        return client.NetworkingV1Api()
+        return client.NetworkingV1Api(ClientFactory.get_api_client())
 
     @staticmethod
-    def get_api_client():
-        return client.ApiClient()
+    def create_crd_client():
+        return client.CustomObjectsApi(ClientFactory.get_api_client())
 
     @staticmethod
-    def create_crd_client():
-        return client.CustomObjectsApi()
+    def get_async_http_client() -> httpx.AsyncClient:
+        """
+        follow 로그처럼 오래 열려 있는 요청용 httpx.AsyncClient.
+        스레드풀을 점유하지 않고, 클라이언트 연결이 끊기면 읽기 대기 중에도 바로 취소된다.
+        """
+        configuration = ClientFactory.get_configuration()
+        with ClientFactory._lock:
+            if ClientFactory._async_http_client is None or ClientFactory._async_http_client.is_closed:
+                verify = (configuration.ssl_ca_cert or True) if configuration.verify_ssl else False
+                cert = (configuration.cert_file, configuration.key_file) if configuration.cert_file else None
+                ClientFactory._async_http_client = httpx.AsyncClient(base_url=configuration.host, verify=verify,
+                                                                     cert=cert)
+            return ClientFactory._async_http_client
+
+    @staticmethod
+    def get_auth_headers() -> dict:
+        # exec / oidc 인증은 refresh_api_key_hook 으로 만료 전에 token 이 갱신된다.
+        token = ClientFactory.get_configuration().get_api_key_with_prefix('authorization')
+        return {"Authorization": token} if token else {}
+
+    @staticmethod
+    async def close_async_http_client():
+        if ClientFactory._async_http_client is not None:
+            await ClientFactory._async_http_client.aclose()
+            ClientFactory._async_http_client = None
@@ -0,0 +1,237 @@
+import logging
+import re
+import threading
+import time
+from types import SimpleNamespace
+from typing import Callable, Dict, Optional
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+
+_SELECTOR_TERM = re.compile(r'^\s*(!?)([\w./-]+)\s*(?:(==|=|!=)\s*([\w.-]*))?\s*$')
+
+
+def match_label_selector(labels: Optional[dict], label_selector: Optional[str]) -> Optional[bool]:
+    """
+    equality-based label selector (a=b, a==b, a!=b, a, !a) 만 로컬에서 판별한다.
+    set-based selector (in, notin) 등 해석할 수 없는 경우 None 을 반환한다.
+    """
+    if not label_selector:
+        return True
+    labels = labels or {}
+    for term in label_selector.split(','):
+        matched = _SELECTOR_TERM.match(term)
+        if matched is None:
+            return None
+        negate, key, operator, value = matched.groups()
+        if operator is None:
+            if (key in labels) == bool(negate):
+                return False
+        elif negate:
+            return None
+        elif operator == '!=':
+            if labels.get(key) == value:
+                return False
+        elif labels.get(key) != value:
+            return False
+    return True
+
+
+def _metadata_of(item, key: str, attribute: str):
+    # 커스텀 리소스는 dict, 그 외에는 kubernetes 모델 객체로 전달된다.
+    if isinstance(item, dict):
+        return item['metadata'].get(key)
+    return getattr(item.metadata, attribute)
+
+
+def name_of(item):
+    return _metadata_of(item, 'name', 'name')
+
+
+def resource_version_of(item):
+    return _metadata_of(item, 'resourceVersion', 'resource_version')
+
+
+def labels_of(item):
+    return _metadata_of(item, 'labels', 'labels')
+
+
+class Informer:
+    """
+    하나의 (kind, namespace) 에 대해 list + watch 로 로컬 저장소를 유지한다.
+    - watch 는 마지막 resourceVersion 부터 이어서 받고, bookmark 이벤트로 resourceVersion 을 갱신
+    - 410 Gone 이면 다시 list, resync_seconds 마다 전체 list 로 재동기화
+    - idle_seconds 동안 조회가 없으면 스스로 종료
+    """
+
+    def __init__(self, kind: str, namespace: str, list_func: Callable, resync_seconds: int = 300,
+                 idle_seconds: int = 600, retry_seconds: int = 5):
+        self.kind = kind
+        self.namespace = namespace
+        self.list_func = list_func
+        self.resync_seconds = resync_seconds
+        self.idle_seconds = idle_seconds
+        self.retry_seconds = retry_seconds
+        self.resource_version = None
+        self.synced = threading.Event()
+        # 첫 list 를 시도했으면(성공 또는 실패) set. 실패가 반복되면 요청마다 sync_timeout 을 기다리지 않도록 한다.
+        self.list_attempted = threading.Event()
+        self.last_error = None
+        self.last_access = time.time()
+        self._store = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._next_resync = 0.0
+        self._thread = threading.Thread(target=self._run, name=f"informer-{kind}-{namespace}", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def is_alive(self):
+        return self._thread.is_alive() and not self._stop_event.is_set()
+
+    def is_idle(self):
+        return time.time() - self.last_access > self.idle_seconds
+
+    def items(self):
+        self.last_access = time.time()
+        with self._lock:
+            return [self._store[name] for name in sorted(self._store)]
+
+    def get(self, name: str):
+        self.last_access = time.time()
+        with self._lock:
+            return self._store.get(name)
+
+    def _list(self):
+        result = self.list_func(namespace=self.namespace)
+        items = result['items'] if isinstance(result, dict) else result.items
+        with self._lock:
+            self._store = {name_of(item): item for item in items}
+        self.resource_version = resource_version_of(result)
+        self._next_resync = time.time() + self.resync_seconds
+        self.last_error = None
+        self.synced.set()
+        self.list_attempted.set()
+
+    def _watch(self):
+        watcher = watch.Watch()
+        timeout_seconds = max(int(self._next_resync - time.time()), 1)
+        for event in watcher.stream(self.list_func, namespace=self.namespace,
+                                    resource_version=self.resource_version,
+                                    allow_watch_bookmarks=True,
+                                    timeout_seconds=timeout_seconds):
+            if self._stop_event.is_set():
+                watcher.stop()
+                return
+            if event['type'] == 'ERROR':
+                raw_object = event.get('raw_object') or {}
+                raise ApiException(status=raw_object.get('code'), reason=raw_object.get('message'))
+            item = event['object']
+            if event['type'] == 'DELETED':
+                with self._lock:
+                    self._store.pop(name_of(item), None)
+            elif event['type'] in ('ADDED', 'MODIFIED'):
+                with self._lock:
+                    self._store[name_of(item)] = item
+            self.resource_version = resource_version_of(item)
+
+    def _fail(self, error: str):
+        self.last_error = error
+        self.list_attempted.set()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                if self.resource_version is None or time.time() >= self._next_resync:
+                    self._list()
+                self._watch()
+            except ApiException as e:
+                if e.status != 410:
+                    logging.warning(f"{self.kind} informer for {self.namespace} failed: {e.status} {e.reason}")
+                    self._fail(f"{e.status} {e.reason}")
+                    self._stop_event.wait(timeout=self.retry_seconds)
+                self.resource_version = None
+            except Exception as e:
+                logging.warning(f"{self.kind} informer for {self.namespace} failed: {e}")
+                self._fail(str(e))
+                self.resource_version = None
+                self._stop_event.wait(timeout=self.retry_seconds)
+            if self.is_idle():
+                self._stop_event.set()
+
+
+class WatchCache:
+    """네임스페이스별 Informer 를 필요할 때 생성하여 목록 조회를 메모리에서 처리한다."""
+
+    def __init__(self, resync_seconds: int = 300, idle_seconds: int = 600, sync_timeout: float = 5.0):
+        self.resync_seconds = resync_seconds
+        self.idle_seconds = idle_seconds
+        self.sync_timeout = sync_timeout
+        self._informers: Dict[tuple, Informer] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get_informer(self, kind: str, namespace: str, list_func: Callable) -> Informer:
+        key = (kind, namespace)
+        with self._lock:
+            informer = self._informers.get(key)
+            if informer is None or not informer.is_alive():
+                informer = Informer(kind, namespace, list_func, resync_seconds=self.resync_seconds,
+                                    idle_seconds=self.idle_seconds)
+                informer.start()
+                self._informers[key] = informer
+            return informer
+
+    def list_items(self, kind: str, namespace: str, list_func: Callable, label_selector: Optional[str] = None):
+        """
+        캐시된 객체 목록을 반환한다. 동기화 전이거나 selector 를 해석할 수 없으면 None
+        list 가 실패하고 있는 Informer 는 기다리지 않고 바로 None 을 반환하여 호출한 쪽이 직접 LIST 하게 한다.
+        """
+        if match_label_selector({}, label_selector) is None:
+            self.misses += 1
+            return None
+        informer = self._get_informer(kind, namespace, list_func)
+        informer.list_attempted.wait(timeout=self.sync_timeout)
+        if not informer.synced.is_set():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return [item for item in informer.items() if match_label_selector(labels_of(item), label_selector)]
+
+    def list(self, kind: str, namespace: str, list_func: Callable, label_selector: Optional[str] = None):
+        """list_namespaced_* 응답처럼 items, metadata 를 가진 객체로 반환한다."""
+        items = self.list_items(kind, namespace, list_func, label_selector=label_selector)
+        if items is None:
+            return None
+        informer = self._informers.get((kind, namespace))
+        resource_version = informer.resource_version if informer is not None else None
+        return SimpleNamespace(items=items, metadata=SimpleNamespace(resource_version=resource_version,
+                                                                     _continue=None))
+
+    def get(self, kind: str, namespace: str, name: str):
+        """이미 동기화된 Informer 가 있을 때만 캐시된 객체를 반환한다. 없거나 동기화 전이면 None"""
+        with self._lock:
+            informer = self._informers.get((kind, namespace))
+        if informer is None or not informer.is_alive() or not informer.synced.is_set():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return informer.get(name)
+
+    def stop(self):
+        with self._lock:
+            for informer in self._informers.values():
+                informer.stop()
+            self._informers.clear()
+
+    def get_metrics(self):
+        with self._lock:
+            informers = [{"kind": kind, "namespace": namespace, "synced": informer.synced.is_set(),
+                          "resource_version": informer.resource_version, "last_error": informer.last_error}
+                         for (kind, namespace), informer in self._informers.items() if informer.is_alive()]
+        return {"hits": self.hits, "misses": self.misses, "informers": informers}
@@ -0,0 +1,52 @@
+from typing import AsyncIterator
+
+import httpx
+
+from src.kubernetes_module.exceptions import KubernetesHttpError, KubernetesConnectionError
+
+
+async def open_log_stream(http_client: httpx.AsyncClient, headers: dict, namespace: str, name: str, params: dict,
+                          timeout: httpx.Timeout) -> httpx.Response:
+    """
+    pod 로그 요청을 보내고 응답 헤더까지만 받는다.
+    요청 자체의 오류(404 등)는 스트리밍을 시작하기 전에 예외로 전달된다.
+    """
+    params = {key: value for key, value in params.items() if value is not None}
+    request = http_client.build_request("GET", f"/api/v1/namespaces/{namespace}/pods/{name}/log", params=params,
+                                        headers=headers, timeout=timeout)
+    try:
+        response = await http_client.send(request, stream=True)
+    except httpx.RequestError as e:
+        raise KubernetesConnectionError(e)
+    if response.is_error:
+        body = await response.aread()
+        await response.aclose()
+        raise KubernetesHttpError(response.status_code, response.reason_phrase, body)
+    return response
+
+
+async def aiter_log_chunks(response: httpx.Response) -> AsyncIterator[bytes]:
+    """
+    로그 응답을 받은 순서대로 chunk 단위로 반환한다. 메모리에는 현재 chunk 만 유지한다.
+    클라이언트 연결이 끊겨 generator 가 취소되거나 닫히면 upstream 연결도 닫는다.
+    """
+    try:
+        async for chunk in response.aiter_raw():
+            yield chunk
+    finally:
+        await response.aclose()
+
+
+async def aiter_log_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """chunk 경계에서 잘린 줄을 이어 붙여 한 줄씩 반환한다."""
+    buffer = b''
+    try:
+        async for chunk in chunks:
+            buffer += chunk
+            *lines, buffer = buffer.split(b'\n')
+            for line in lines:
+                yield line.decode('utf-8', errors='replace')
+        if buffer:
+            yield buffer.decode('utf-8', errors='replace')
+    finally:
+        await chunks.aclose()
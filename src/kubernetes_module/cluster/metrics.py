@@ -0,0 +1,223 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from kubernetes.client import ApiClient, CoreV1Api, CustomObjectsApi
+from kubernetes.client.rest import ApiException
+from kubernetes.utils import parse_quantity
+
+from src.kubernetes_module.exceptions import KubernetesApiError
+from src.kubernetes_module.utils import load_json
+
+GPU_RESOURCE = 'nvidia.com/gpu'
+
+
+def _to_resources(values: dict):
+    """cpu 는 core, memory 는 byte, gpu 는 개수로 변환한다."""
+    values = values or {}
+    return {
+        "cpu": float(parse_quantity(values.get('cpu', 0))),
+        "memory": int(parse_quantity(values.get('memory', 0))),
+        "gpu": int(parse_quantity(values.get(GPU_RESOURCE, 0))),
+    }
+
+
+def _to_usage(values: dict):
+    # metrics.k8s.io 는 cpu, memory 사용량만 제공한다.
+    usage = _to_resources(values)
+    del usage["gpu"]
+    return usage
+
+
+def _add(total: dict, values: dict):
+    for key, value in values.items():
+        total[key] = total.get(key, 0) + value
+    return total
+
+
+def pod_requests(spec: dict):
+    """
+    scheduler 가 pod 에 예약하는 자원량.
+    init container 는 순서대로 하나씩 실행되므로 max(container 합계, 가장 큰 init container) 에 pod overhead 를 더한다.
+    """
+    requests = {"cpu": 0.0, "memory": 0, "gpu": 0}
+    for container in spec.get('containers') or []:
+        _add(requests, _to_resources((container.get('resources') or {}).get('requests')))
+    for container in spec.get('initContainers') or []:
+        init_requests = _to_resources((container.get('resources') or {}).get('requests'))
+        requests = {key: max(value, init_requests[key]) for key, value in requests.items()}
+    return _add(requests, _to_resources(spec.get('overhead')))
+
+
+def _ratio(used, capacity):
+    return round(used / capacity, 4) if used is not None and capacity else None
+
+
+class ResourceUsageCollector:
+    """
+    metrics.k8s.io 의 node/pod 사용량을 node allocatable, pod requests 와 합쳐 주기적으로 snapshot 을 만든다.
+    조회 요청은 마지막 snapshot 만 반환하므로 요청마다 클러스터 전체를 조회하지 않는다.
+    start() 로 주기 수집을 시작하지 않으면 조회 시 snapshot 이 interval 보다 오래된 경우에만 다시 수집한다.
+    수집에 실패하면 이전 snapshot 을 반환하며 응답의 collected_at, last_error 로 오래된 결과임을 알 수 있다.
+    metrics-server 가 없으면 usage 없이 allocatable / requests 만 집계한다.
+    """
+
+    def __init__(self, api_client: ApiClient, interval: float = 30.0):
+        self.core_client = CoreV1Api(api_client)
+        self.crd_client = CustomObjectsApi(api_client)
+        self.interval = interval
+        self._snapshot = None
+        self._collect_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.collected_count = 0
+        self.last_error = None
+        # 마지막 수집 시도 시각. 실패한 경우에도 interval 동안은 다시 수집하지 않는다.
+        self._attempted_at = 0.0
+
+    def _list_metrics(self, plural: str):
+        try:
+            return self.crd_client.list_cluster_custom_object(
+                group="metrics.k8s.io", version="v1beta1",
+                plural=plural
+            )['items']
+        except ApiException as e:
+            if e.status in (403, 404, 503):
+                return None
+            raise
+
+    def collect(self):
+        started = time.monotonic()
+        self._attempted_at = time.time()
+        nodes = load_json(self.core_client.list_node(_preload_content=False).data)['items']
+        # node 에 배정된 pod 는 Pending(이미지 pull, init container 실행 중)이어도 이미 자원을 예약하고 있다.
+        pods = load_json(self.core_client.list_pod_for_all_namespaces(
+            field_selector="spec.nodeName!=,status.phase!=Succeeded,status.phase!=Failed",
+            _preload_content=False
+        ).data)['items']
+        node_metrics = self._list_metrics("nodes")
+        pod_metrics = self._list_metrics("pods")
+
+        node_usage = {item['metadata']['name']: _to_usage(item['usage']) for item in node_metrics or []}
+        pod_usage = {}
+        for item in pod_metrics or []:
+            usage = {}
+            for container in item['containers']:
+                _add(usage, _to_usage(container['usage']))
+            pod_usage[(item['metadata']['namespace'], item['metadata']['name'])] = usage
+
+        node_requests = defaultdict(dict)
+        namespaces = defaultdict(lambda: {"pods": [], "requests": {}, "usage": {}})
+        for pod in pods:
+            namespace, name = pod['metadata']['namespace'], pod['metadata']['name']
+            requests = pod_requests(pod['spec'])
+            usage = pod_usage.get((namespace, name))
+            _add(node_requests[pod['spec'].get('nodeName')], requests)
+            _add(namespaces[namespace]["requests"], requests)
+            if usage is not None:
+                _add(namespaces[namespace]["usage"], usage)
+            namespaces[namespace]["pods"].append({
+                "name": name,
+                "node": pod['spec'].get('nodeName'),
+                "requests": requests,
+                "usage": usage,
+            })
+
+        node_status = []
+        for node in nodes:
+            name = node['metadata']['name']
+            allocatable = _to_resources(node['status'].get('allocatable'))
+            requests = _add({"cpu": 0.0, "memory": 0, "gpu": 0}, node_requests.get(name, {}))
+            usage = node_usage.get(name)
+            node_status.append({
+                "name": name,
+                "allocatable": allocatable,
+                "requests": requests,
+                "usage": usage,
+                "requested_ratio": {key: _ratio(requests[key], allocatable[key]) for key in allocatable},
+                "usage_ratio": {key: _ratio(usage.get(key), allocatable[key]) for key in ("cpu", "memory")}
+                if usage is not None else None,
+            })
+
+        self._snapshot = {
+            "collected_at": time.time(),
+            "elapsed_ms": round((time.monotonic() - started) * 1000, 1),
+            "metrics_available": node_metrics is not None and pod_metrics is not None,
+            "nodes": node_status,
+            "namespaces": dict(namespaces),
+        }
+        self.collected_count += 1
+        self.last_error = None
+        return self._snapshot
+
+    def _record_error(self, message: str):
+        self.last_error = {"message": message, "at": time.time()}
+
+    def _is_stale(self):
+        if self._snapshot is None:
+            return True
+        running = self._thread is not None and self._thread.is_alive()
+        return not running and time.time() - self._attempted_at > self.interval
+
+    def get_snapshot(self):
+        if self._is_stale():
+            # 동시에 들어온 요청은 한 번만 수집하고 나머지는 그 결과를 기다린다.
+            with self._collect_lock:
+                if self._is_stale():
+                    try:
+                        self.collect()
+                    except ApiException as e:
+                        self._record_error(f"{e.status} {e.reason}")
+                        if self._snapshot is None:
+                            raise KubernetesApiError(e)
+        return self._snapshot
+
+    def get_cluster_usage(self):
+        snapshot = self.get_snapshot()
+        return {
+            "collected_at": snapshot["collected_at"],
+            "last_error": self.last_error,
+            "metrics_available": snapshot["metrics_available"],
+            "nodes": snapshot["nodes"],
+            "namespaces": [{"namespace": namespace, "pods": len(usage["pods"]), "requests": usage["requests"],
+                            "usage": usage["usage"] if snapshot["metrics_available"] else None}
+                           for namespace, usage in sorted(snapshot["namespaces"].items())],
+        }
+
+    def get_namespace_usage(self, namespace: str):
+        snapshot = self.get_snapshot()
+        usage = snapshot["namespaces"].get(namespace, {"pods": [], "requests": {}, "usage": {}})
+        return {
+            "collected_at": snapshot["collected_at"],
+            "last_error": self.last_error,
+            "metrics_available": snapshot["metrics_available"],
+            "namespace": namespace,
+            "requests": usage["requests"],
+            "usage": usage["usage"] if snapshot["metrics_available"] else None,
+            "pods": usage["pods"],
+        }
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                with self._collect_lock:
+                    self.collect()
+            except Exception as e:
+                logging.warning(f"Cluster resource usage collection failed: {e}")
+                self._record_error(str(e))
+            self._stop_event.wait(timeout=self.interval)
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="cluster-usage-collector", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
@@ -9,6 +9,14 @@ class Render:
             result.append(to_each_shape(item))
         return result
 
+    @staticmethod
+    def to_page(model, to_status_list: callable):
+        return {
+            "items": to_status_list(model),
+            "continue": model.metadata._continue,
+            "remaining_item_count": model.metadata.remaining_item_count,
+        }
+
     @staticmethod
     def to_name_list(model):
         return [item.metadata.name for item in model.items]
@@ -111,15 +119,17 @@ class Render:
     @staticmethod
     def to_pod_status(item):
         metadata = Render.metadata_of(item)
-        ready = sum(1 for status in item.status.container_statuses if status.ready)
-        total = len(item.status.container_statuses)
+        # 스케줄링 전 Pending pod 는 container_statuses 가 None 이다.
+        container_statuses = item.status.container_statuses or []
+        ready = sum(1 for status in container_statuses if status.ready)
+        total = len(container_statuses)
         return {
             "name": metadata.name,
             # ready인 pod 수/total
             "ready": f"{ready}/{total}",
             "containers": [container.name for container in item.spec.containers],
             "status": item.status.phase,
-            "restarts": item.status.container_statuses[0].restart_count,
+            "restarts": container_statuses[0].restart_count if container_statuses else 0,
             "create_date": metadata.create_date,
         }
 
@@ -200,3 +210,144 @@ class Render:
             "hosts": [rule.host for rule in item.spec.rules],
             "create_date": metadata.create_date,
         }
+
+
+class RawRender:
+    """
+    _preload_content=False 로 받은 JSON(dict) 목록을 kubernetes 모델로 변환하지 않고 필요한 필드만 꺼내는 Render.
+    반환 형태는 Render 의 같은 이름 함수와 동일하다.
+    """
+
+    @staticmethod
+    def _to_status_list(model: dict, to_each_shape: callable):
+        return [to_each_shape(item) for item in model.get('items') or []]
+
+    @staticmethod
+    def to_page(model: dict, to_status_list: callable):
+        return {
+            "items": to_status_list(model),
+            "continue": model['metadata'].get('continue'),
+            "remaining_item_count": model['metadata'].get('remainingItemCount'),
+        }
+
+    @staticmethod
+    def metadata_of(item: dict):
+        return Metadata(
+            name=item['metadata']['name'],
+            labels=item['metadata'].get('labels'),
+            annotations=item['metadata'].get('annotations'),
+            create_date=item['metadata'].get('creationTimestamp'),
+        )
+
+    @staticmethod
+    def to_volume_claim_status_list(model: dict):
+        return RawRender._to_status_list(model, RawRender.to_volume_claim_status)
+
+    @staticmethod
+    def to_volume_claim_status(item: dict):
+        metadata = RawRender.metadata_of(item)
+        return {
+            "name": metadata.name,
+            "status": item['status'].get('phase'),
+            "volume": item['spec'].get('volumeName'),
+            # 아직 bind 되지 않은 PVC 는 capacity 가 없다.
+            "capacity": (item['status'].get('capacity') or {}).get('storage'),
+            "access_mode": item['spec']['accessModes'][0],
+            "storage_class": item['spec'].get('storageClassName'),
+            "create_date": metadata.create_date,
+        }
+
+    @staticmethod
+    def to_configmap_status_list(model: dict):
+        return RawRender._to_status_list(model, RawRender.to_configmap_status)
+
+    @staticmethod
+    def to_configmap_status(item: dict):
+        metadata = RawRender.metadata_of(item)
+        return {
+            "name": metadata.name,
+            "data": item.get('data'),
+            "create_date": metadata.create_date,
+        }
+
+    @staticmethod
+    def to_secret_status_list(model: dict):
+        return RawRender._to_status_list(model, RawRender.to_secret_status)
+
+    @staticmethod
+    def to_secret_status(item: dict):
+        metadata = RawRender.metadata_of(item)
+        return {
+            "name": metadata.name,
+            "type": item.get('type'),
+            "data": item.get('data'),
+            "create_date": metadata.create_date,
+        }
+
+    @staticmethod
+    def to_pod_status_list(model: dict):
+        return RawRender._to_status_list(model, RawRender.to_pod_status)
+
+    @staticmethod
+    def to_pod_status(item: dict):
+        metadata = RawRender.metadata_of(item)
+        # 스케줄링 전 Pending pod 는 containerStatuses 가 없다.
+        container_statuses = item['status'].get('containerStatuses') or []
+        ready = sum(1 for status in container_statuses if status['ready'])
+        total = len(container_statuses)
+        return {
+            "name": metadata.name,
+            # ready인 pod 수/total
+            "ready": f"{ready}/{total}",
+            "containers": [container['name'] for container in item['spec']['containers']],
+            "status": item['status'].get('phase'),
+            "restarts": container_statuses[0]['restartCount'] if container_statuses else 0,
+            "create_date": metadata.create_date,
+        }
+
+    @staticmethod
+    def to_deployment_status_list(model: dict):
+        return RawRender._to_status_list(model, RawRender.to_deployment_status)
+
+    @staticmethod
+    def to_deployment_status(item: dict):
+        metadata = RawRender.metadata_of(item)
+        status = item['status']
+        return {
+            "name": metadata.name,
+            "ready": f"{status.get('readyReplicas')}/{status.get('replicas')}",
+            "up_to_date": status.get('updatedReplicas'),
+            "available": status.get('availableReplicas'),
+            "create_date": metadata.create_date,
+        }
+
+    @staticmethod
+    def to_service_status_list(model: dict):
+        return RawRender._to_status_list(model, RawRender.to_service_status)
+
+    @staticmethod
+    def to_service_status(item: dict):
+        metadata = RawRender.metadata_of(item)
+        spec = item['spec']
+        return {
+            "name": metadata.name,
+            "type": spec.get('type'),
+            "cluster_ip": spec.get('clusterIP'),
+            "external_ip": spec.get('externalIPs'),
+            "ports": [f"{port['port']}:{port.get('nodePort')}/{port.get('protocol')}" for port in spec['ports']],
+            "create_date": metadata.create_date,
+        }
+
+    @staticmethod
+    def to_ingress_status_list(model: dict):
+        return RawRender._to_status_list(model, RawRender.to_ingress_status)
+
+    @staticmethod
+    def to_ingress_status(item: dict):
+        metadata = RawRender.metadata_of(item)
+        return {
+            "name": metadata.name,
+            "class": item['spec'].get('ingressClassName'),
+            "hosts": [rule.get('host') for rule in item['spec']['rules']],
+            "create_date": metadata.create_date,
+        }
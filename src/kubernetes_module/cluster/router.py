@@ -1,13 +1,20 @@
-from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+import asyncio
+import json
+from typing import List, Optional
 
-from src.kubernetes_module import cluster_service
+from fastapi import APIRouter, Header, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from src.kubernetes_module import cluster_service, resource_usage, event_hub
+from src.kubernetes_module.cluster.logs import aiter_log_lines
 from src.kubernetes_module.config import MODULE_CODE
+from src.kubernetes_module.exceptions import KubernetesUnsupportedKindError
 from src.kubernetes_module.schemas import \
     Volume, VolumeClaim, \
     ConfigMap, Secret, \
     Pod, Deployment, \
-    Service, Ingress, Metadata
+    Service, Ingress, Metadata, BulkApply
 from src.response import Response
 
 router = APIRouter(
@@ -17,6 +24,69 @@ router = APIRouter(
 )
 
 
+@router.get("/watch-cache", tags=["cluster"], response_model=Response)
+async def get_watch_cache_metrics():
+    return Response.from_result(MODULE_CODE, cluster_service.get_watch_cache_metrics())
+
+
+@router.post("/namespaces/{namespace}/apply", tags=["cluster"], response_model=Response)
+async def apply_resources(namespace: str, bulk: BulkApply):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(cluster_service.apply_resources, namespace, bulk))
+
+
+@router.get("/usage", tags=["cluster"], response_model=Response)
+async def get_cluster_usage():
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(resource_usage.get_cluster_usage))
+
+
+@router.get("/namespaces/{namespace}/usage", tags=["cluster"], response_model=Response)
+async def get_namespace_usage(namespace: str):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(resource_usage.get_namespace_usage, namespace))
+
+
+@router.get("/events", tags=["cluster"], response_model=Response)
+async def get_event_streams():
+    return Response.from_result(MODULE_CODE, event_hub.get_metrics())
+
+
+@router.get("/namespaces/{namespace}/events/{kind}", tags=["cluster"])
+async def watch_events(namespace: str, kind: str, resource_version: Optional[str] = None,
+                       last_event_id: Optional[str] = Header(default=None)):
+    if not event_hub.supports(kind):
+        raise KubernetesUnsupportedKindError(kind)
+
+    async def event_stream():
+        # id 에 resourceVersion 을 담아 재연결한 EventSource 가 Last-Event-ID 로 이어서 받을 수 있게 한다.
+        async for event in event_hub.subscribe(kind, namespace, resource_version or last_event_id):
+            event_id = ((event['object'] or {}).get('metadata') or {}).get('resourceVersion')
+            yield (f"id: {event_id}\n" if event_id else "") + \
+                f"event: {event['type']}\ndata: {json.dumps(event['object'], default=str)}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+@router.websocket("/namespaces/{namespace}/events/{kind}")
+async def watch_events_websocket(websocket: WebSocket, namespace: str, kind: str,
+                                 resource_version: Optional[str] = None):
+    await websocket.accept()
+    if not event_hub.supports(kind):
+        await websocket.close(code=1008)
+        return
+    try:
+        async for event in event_hub.subscribe(kind, namespace, resource_version):
+            await websocket.send_json(event)
+    except WebSocketDisconnect:
+        pass
+
+
+@router.delete("/namespaces/{namespace}/collections/{kind}", tags=["cluster"], response_model=Response)
+async def delete_collection(namespace: str, kind: str, label_selector: str = None, field_selector: str = None,
+                            propagation_policy: str = 'Background', dry_run: bool = False):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(
+        cluster_service.delete_collection, namespace, kind, label_selector=label_selector,
+        field_selector=field_selector, propagation_policy=propagation_policy, dry_run=dry_run))
+
+
 @router.get("/nodes", tags=["node"], response_model=Response)
 async def get_nodes():
     return Response.from_result(MODULE_CODE, cluster_service.get_nodes())
@@ -57,9 +127,17 @@ async def delete_volume(name: str):
     return Response.from_result(MODULE_CODE, cluster_service.delete_volume(name))
 
 
+@router.get("/volumeclaims", tags=["volumeclaim"], response_model=Response)
+async def get_all_volume_claims(namespaces: Optional[List[str]] = Query(default=None)):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(cluster_service.get_all_volume_claims, namespaces))
+
+
 @router.get("/namespaces/{namespace}/volumeclaims", tags=["volumeclaim"], response_model=Response)
-async def get_volume_claims(namespace: str = 'default'):
-    return Response.from_result(MODULE_CODE, cluster_service.get_volume_claims(namespace))
+async def get_volume_claims(namespace: str = 'default', label_selector: str = None, field_selector: str = None,
+                            limit: Optional[int] = None,
+                            continue_token: Optional[str] = Query(default=None, alias="continue")):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(
+        cluster_service.get_volume_claims, namespace, label_selector, field_selector, limit, continue_token))
 
 
 @router.post("/namespaces/{namespace}/volumeclaims", tags=["volumeclaim"], response_model=Response)
@@ -73,8 +151,11 @@ async def delete_volume_claim(namespace: str, name: str):
 
 
 @router.get("/namespaces/{namespace}/configmaps", tags=["configmap"], response_model=Response)
-async def get_config_maps(namespace: str = 'default'):
-    return Response.from_result(MODULE_CODE, cluster_service.get_config_maps(namespace))
+async def get_config_maps(namespace: str = 'default', label_selector: str = None, field_selector: str = None,
+                          limit: Optional[int] = None,
+                          continue_token: Optional[str] = Query(default=None, alias="continue")):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(
+        cluster_service.get_config_maps, namespace, label_selector, field_selector, limit, continue_token))
 
 
 @router.post("/namespaces/{namespace}/configmaps", tags=["configmap"], response_model=Response)
@@ -87,9 +168,20 @@ async def delete_config_map(namespace: str, name: str):
     return Response.from_result(MODULE_CODE, cluster_service.delete_config_map(namespace, name))
 
 
+@router.patch("/namespaces/{namespace}/configmaps/{name}", tags=["configmap"], response_model=Response)
+async def update_config_map(namespace: str, name: str, config_map: ConfigMap, field_manager: str = 'mlops-api',
+                            force: bool = True, dry_run: bool = False):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(
+        cluster_service.update_config_map, namespace, name, config_map, field_manager=field_manager, force=force,
+        dry_run=dry_run))
+
+
 @router.get("/namespaces/{namespace}/secrets", tags=["secret"], response_model=Response)
-async def get_secrets(namespace: str = 'default'):
-    return Response.from_result(MODULE_CODE, cluster_service.get_secrets(namespace))
+async def get_secrets(namespace: str = 'default', label_selector: str = None, field_selector: str = None,
+                      limit: Optional[int] = None,
+                      continue_token: Optional[str] = Query(default=None, alias="continue")):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(
+        cluster_service.get_secrets, namespace, label_selector, field_selector, limit, continue_token))
 
 
 @router.post("/namespaces/{namespace}/secrets", tags=["secret"], response_model=Response)
@@ -102,24 +194,102 @@ async def delete_secret(namespace: str, name: str):
     return Response.from_result(MODULE_CODE, cluster_service.delete_secret(namespace, name))
 
 
+@router.patch("/namespaces/{namespace}/secrets/{name}", tags=["secret"], response_model=Response)
+async def update_secret(namespace: str, name: str, secret: Secret, field_manager: str = 'mlops-api',
+                        force: bool = True, dry_run: bool = False):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(
+        cluster_service.update_secret, namespace, name, secret, field_manager=field_manager, force=force,
+        dry_run=dry_run))
+
+
+@router.get("/pods", tags=["pod"], response_model=Response)
+async def get_all_pods(namespaces: Optional[List[str]] = Query(default=None), label_selector: str = None):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(
+        cluster_service.get_all_pods, namespaces, label_selector))
+
+
 @router.get("/namespaces/{namespace}/pods", tags=["pod"], response_model=Response)
-async def get_pods(namespace: str = 'default', label_selector: str = None):
-    return Response.from_result(MODULE_CODE, cluster_service.get_pods(namespace, label_selector))
+async def get_pods(namespace: str = 'default', label_selector: str = None, field_selector: str = None,
+                   limit: Optional[int] = None,
+                   continue_token: Optional[str] = Query(default=None, alias="continue")):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(
+        cluster_service.get_pods, namespace, label_selector, field_selector, limit, continue_token))
 
 
 @router.post("/namespaces/{namespace}/logs", tags=["pod"], response_model=Response)
-async def find_specific_pod_logs(namespace: str, label_selector: str = None):
-    return Response.from_result(MODULE_CODE, cluster_service.find_specific_pod_logs(namespace, label_selector))
+async def find_specific_pod_logs(namespace: str, label_selector: str = None, tail_lines: Optional[int] = None,
+                                 since_seconds: Optional[int] = None, limit_bytes: Optional[int] = None):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(
+        cluster_service.find_specific_pod_logs, namespace, label_selector, tail_lines=tail_lines,
+        since_seconds=since_seconds, limit_bytes=limit_bytes))
 
 
 @router.get("/namespaces/{namespace}/pods/{name}/logs", tags=["pod"], response_model=Response)
-async def get_pod_logs(namespace: str, name: str):
-    return Response.from_result(MODULE_CODE, cluster_service.get_pod_logs(namespace, name))
+async def get_pod_logs(namespace: str, name: str, tail_lines: Optional[int] = None,
+                       since_seconds: Optional[int] = None, limit_bytes: Optional[int] = None):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(
+        cluster_service.get_pod_logs, namespace, name, tail_lines=tail_lines, since_seconds=since_seconds,
+        limit_bytes=limit_bytes))
 
 
 @router.get("/namespaces/{namespace}/pods/{name}/logs/{container}", tags=["pod"], response_model=Response)
-async def get_container_logs(namespace: str, name: str, container: str):
-    return Response.from_result(MODULE_CODE, cluster_service.get_container_logs(namespace, name, container))
+async def get_container_logs(namespace: str, name: str, container: str, tail_lines: Optional[int] = None,
+                             since_seconds: Optional[int] = None, limit_bytes: Optional[int] = None):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(
+        cluster_service.get_container_logs, namespace, name, container, tail_lines=tail_lines,
+        since_seconds=since_seconds, limit_bytes=limit_bytes))
+
+
+@router.get("/namespaces/{namespace}/pods/{name}/logs/{container}/stream", tags=["pod"])
+async def stream_container_logs(namespace: str, name: str, container: str, follow: bool = True,
+                                tail_lines: Optional[int] = None, since_seconds: Optional[int] = None,
+                                limit_bytes: Optional[int] = None, timestamps: bool = False, sse: bool = False):
+    # StreamingResponse 는 클라이언트 연결이 끊기면 generator 를 취소하고, 이때 upstream 로그 연결도 닫힌다.
+    chunks = await cluster_service.stream_container_logs(namespace, name, container, follow=follow,
+                                                         tail_lines=tail_lines, since_seconds=since_seconds,
+                                                         limit_bytes=limit_bytes, timestamps=timestamps)
+    if not sse:
+        return StreamingResponse(chunks, media_type="text/plain")
+
+    async def event_stream():
+        async for line in aiter_log_lines(chunks):
+            yield f"data: {line}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+async def _wait_for_disconnect(websocket: WebSocket):
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+
+
+@router.websocket("/namespaces/{namespace}/pods/{name}/logs/{container}/stream")
+async def stream_container_logs_websocket(websocket: WebSocket, namespace: str, name: str, container: str,
+                                          follow: bool = True, tail_lines: Optional[int] = None,
+                                          since_seconds: Optional[int] = None, limit_bytes: Optional[int] = None,
+                                          timestamps: bool = False):
+    await websocket.accept()
+    chunks = await cluster_service.stream_container_logs(namespace, name, container, follow=follow,
+                                                         tail_lines=tail_lines, since_seconds=since_seconds,
+                                                         limit_bytes=limit_bytes, timestamps=timestamps)
+    lines = aiter_log_lines(chunks)
+
+    async def forward():
+        async for line in lines:
+            await websocket.send_text(line)
+        await websocket.close()
+
+    # 새 로그를 기다리는 중에 연결이 끊겨도 바로 upstream 로그 연결을 닫는다.
+    forward_task = asyncio.ensure_future(forward())
+    disconnect_task = asyncio.ensure_future(_wait_for_disconnect(websocket))
+    try:
+        await asyncio.wait({forward_task, disconnect_task}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in (forward_task, disconnect_task):
+            task.cancel()
+        # 끊긴 연결로 보내다 난 WebSocketDisconnect 등은 여기서 회수한다.
+        await asyncio.gather(forward_task, disconnect_task, return_exceptions=True)
+        await lines.aclose()
 
 
 @router.post("/namespaces/{namespace}/pods", tags=["pod"], response_model=Response)
@@ -132,9 +302,17 @@ async def delete_namespaced_pod(namespace: str, name: str):
     return Response.from_result(MODULE_CODE, cluster_service.delete_pod(namespace, name))
 
 
+@router.get("/deployments", tags=["deployment"], response_model=Response)
+async def get_all_deployments(namespaces: Optional[List[str]] = Query(default=None)):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(cluster_service.get_all_deployments, namespaces))
+
+
 @router.get("/namespaces/{namespace}/deployments", tags=["deployment"], response_model=Response)
-async def get_deployments(namespace: str = 'default'):
-    return Response.from_result(MODULE_CODE, cluster_service.get_deployments(namespace))
+async def get_deployments(namespace: str = 'default', label_selector: str = None, field_selector: str = None,
+                          limit: Optional[int] = None,
+                          continue_token: Optional[str] = Query(default=None, alias="continue")):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(
+        cluster_service.get_deployments, namespace, label_selector, field_selector, limit, continue_token))
 
 
 @router.post("/namespaces/{namespace}/deployments", tags=["deployment"], response_model=Response)
@@ -147,9 +325,25 @@ async def delete_deployment(namespace: str, name: str):
     return Response.from_result(MODULE_CODE, cluster_service.delete_deployment(namespace, name))
 
 
+@router.patch("/namespaces/{namespace}/deployments/{name}", tags=["deployment"], response_model=Response)
+async def update_deployment(namespace: str, name: str, deployment: Deployment, field_manager: str = 'mlops-api',
+                            force: bool = True, dry_run: bool = False):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(
+        cluster_service.update_deployment, namespace, name, deployment, field_manager=field_manager, force=force,
+        dry_run=dry_run))
+
+
+@router.get("/services", tags=["service"], response_model=Response)
+async def get_all_services(namespaces: Optional[List[str]] = Query(default=None)):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(cluster_service.get_all_services, namespaces))
+
+
 @router.get("/namespaces/{namespace}/services", tags=["service"], response_model=Response)
-async def get_services(namespace: str = 'default'):
-    return Response.from_result(MODULE_CODE, cluster_service.get_services(namespace))
+async def get_services(namespace: str = 'default', label_selector: str = None, field_selector: str = None,
+                       limit: Optional[int] = None,
+                       continue_token: Optional[str] = Query(default=None, alias="continue")):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(
+        cluster_service.get_services, namespace, label_selector, field_selector, limit, continue_token))
 
 
 @router.get("/namespaces/{namespace}/services/{name}", tags=["service"], response_model=Response)
@@ -167,9 +361,20 @@ async def delete_service(namespace: str, name: str):
     return Response.from_result(MODULE_CODE, cluster_service.delete_service(namespace, name))
 
 
+@router.patch("/namespaces/{namespace}/services/{name}", tags=["service"], response_model=Response)
+async def update_service(namespace: str, name: str, service: Service, field_manager: str = 'mlops-api',
+                         force: bool = True, dry_run: bool = False):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(
+        cluster_service.update_service, namespace, name, service, field_manager=field_manager, force=force,
+        dry_run=dry_run))
+
+
 @router.get("/namespaces/{namespace}/ingresses", tags=["ingress"], response_model=Response)
-async def get_ingresses(namespace: str = 'default'):
-    return Response.from_result(MODULE_CODE, cluster_service.get_ingresses(namespace))
+async def get_ingresses(namespace: str = 'default', label_selector: str = None, field_selector: str = None,
+                        limit: Optional[int] = None,
+                        continue_token: Optional[str] = Query(default=None, alias="continue")):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(
+        cluster_service.get_ingresses, namespace, label_selector, field_selector, limit, continue_token))
 
 
 @router.post("/namespaces/{namespace}/ingresses", tags=["ingress"], response_model=Response)
@@ -180,3 +385,11 @@ async def create_ingress(namespace: str, ingress: Ingress):
 @router.delete("/namespaces/{namespace}/ingresses/{name}", tags=["ingress"], response_model=Response)
 async def delete_ingress(namespace: str, name: str):
     return Response.from_result(MODULE_CODE, cluster_service.delete_ingress(namespace, name))
+
+
+@router.patch("/namespaces/{namespace}/ingresses/{name}", tags=["ingress"], response_model=Response)
+async def update_ingress(namespace: str, name: str, ingress: Ingress, field_manager: str = 'mlops-api',
+                         force: bool = True, dry_run: bool = False):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(
+        cluster_service.update_ingress, namespace, name, ingress, field_manager=field_manager, force=force,
+        dry_run=dry_run))
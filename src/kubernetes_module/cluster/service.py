@@ -1,25 +1,87 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+import httpx
 from kubernetes.client import CoreV1Api, AppsV1Api, NetworkingV1Api
 from kubernetes.client.rest import ApiException
 
-from src.kubernetes_module.cluster.render import Render
-from src.kubernetes_module.exceptions import KubernetesApiError
+from src.kubernetes_module.aggregate import list_across_namespaces, to_aggregated_list
+from src.kubernetes_module.apply import server_side_apply, to_apply_body, diff_fields
+from src.kubernetes_module.client import ClientFactory
+from src.kubernetes_module.cluster.informer import WatchCache
+from src.kubernetes_module.cluster.logs import open_log_stream, aiter_log_chunks
+from src.kubernetes_module.cluster.render import Render, RawRender
+from src.kubernetes_module.exceptions import KubernetesApiError, KubernetesUnsupportedKindError, \
+    RequestValidationError
 from src.kubernetes_module.resource import ResourceFactory as Factory
 from src.kubernetes_module.schemas import Volume, VolumeClaim, ConfigMap, Secret, \
-    Pod, Deployment, Service, Ingress, Metadata
-from src.kubernetes_module.utils import render, encode_to_base64
+    Pod, Deployment, Service, Ingress, Metadata, BulkApply
+from src.kubernetes_module.utils import render, encode_to_base64, load_json
 
 
 class ClusterService:
     def __init__(self,
                  cluster_client: CoreV1Api,
                  deployment_client: AppsV1Api,
-                 network_client: NetworkingV1Api):
+                 network_client: NetworkingV1Api,
+                 watch_cache: Optional[WatchCache] = None):
         # Kubernetes API 클라이언트 생성
         self.cluster_client = cluster_client
         self.deployment_client = deployment_client
         self.network_client = network_client
+        # watch_cache 가 있으면 namespaced 목록 조회를 list + watch 로 유지되는 메모리 캐시에서 처리
+        self.watch_cache = watch_cache
         pass
 
+    def _list_namespaced(self, kind: str, list_func: callable, namespace: str, label_selector: str = None,
+                         field_selector: str = None, limit: int = None, continue_token: str = None,
+                         raw: bool = False, cached: bool = True):
+        """
+        캐시에서 조회되면 kubernetes 모델 목록을, 그렇지 않으면 API 서버에서 조회한다.
+        raw=True 이면 모델 역직렬화를 생략하고 응답 JSON 을 dict 로 반환한다.
+        """
+        # 캐시는 전체 목록만 보관하므로 field selector 나 페이지 요청은 API 서버에서 처리
+        if cached and self.watch_cache is not None and field_selector is None and limit is None \
+                and continue_token is None:
+            result = self.watch_cache.list(kind, namespace, list_func, label_selector=label_selector)
+            if result is not None:
+                return result
+        result = list_func(namespace=namespace, label_selector=label_selector, field_selector=field_selector,
+                           limit=limit, _continue=continue_token, _preload_content=not raw)
+        return load_json(result.data) if raw else result
+
+    @staticmethod
+    def _render_list(result, to_status_list: callable, to_raw_status_list: callable, limit: int = None):
+        # dict 는 _preload_content=False 로 받은 응답이므로 RawRender 로 변환
+        if isinstance(result, dict):
+            to_page, to_status_list = RawRender.to_page, to_raw_status_list
+        else:
+            to_page = Render.to_page
+        # limit 를 지정한 경우에만 다음 페이지 조회를 위한 continue 토큰을 함께 반환
+        if limit is None:
+            return render(result, to_status_list)
+        return render(result, lambda model: to_page(model, to_status_list))
+
+    def _list_all_namespaces(self, list_all: callable, list_func: callable,
+                             namespaces: Optional[List[str]] = None, label_selector: str = None):
+        """
+        여러 namespace 의 목록을 응답 JSON(dict) 그대로 모은다.
+        namespace 마다 informer 를 띄우지 않도록 watch cache 는 사용하지 않는다.
+        """
+        return list_across_namespaces(
+            list_all=lambda: load_json(list_all(label_selector=label_selector, _preload_content=False).data)['items'],
+            list_namespaced=lambda namespace: self._list_namespaced(
+                None, list_func, namespace, label_selector, cached=False, raw=True)['items'],
+            get_namespaces=lambda: [item.metadata.name for item in self.cluster_client.list_namespace().items],
+            namespace_of=lambda item: item['metadata']['namespace'],
+            namespaces=namespaces,
+        )
+
+    def get_watch_cache_metrics(self):
+        if self.watch_cache is None:
+            return {"enabled": False}
+        return dict(self.watch_cache.get_metrics(), enabled=True)
+
     def get_nodes(self):
         try:
             result = self.cluster_client.list_node()
@@ -79,10 +141,23 @@ class ClusterService:
         except ApiException as e:
             raise KubernetesApiError(e)
 
-    def get_volume_claims(self, namespace: str = 'default'):
+    def get_volume_claims(self, namespace: str = 'default', label_selector: str = None, field_selector: str = None,
+                          limit: int = None, continue_token: str = None):
         try:
-            result = self.cluster_client.list_namespaced_persistent_volume_claim(namespace=namespace)
-            return render(result, Render.to_volume_claim_status_list)
+            result = self._list_namespaced('persistentvolumeclaims',
+                                           self.cluster_client.list_namespaced_persistent_volume_claim, namespace,
+                                           label_selector, field_selector, limit, continue_token, raw=True)
+            return self._render_list(result, Render.to_volume_claim_status_list,
+                                     RawRender.to_volume_claim_status_list, limit)
+        except ApiException as e:
+            raise KubernetesApiError(e)
+
+    def get_all_volume_claims(self, namespaces: Optional[List[str]] = None):
+        try:
+            result = self._list_all_namespaces(
+                self.cluster_client.list_persistent_volume_claim_for_all_namespaces,
+                self.cluster_client.list_namespaced_persistent_volume_claim, namespaces)
+            return to_aggregated_list(result, RawRender.to_volume_claim_status)
         except ApiException as e:
             raise KubernetesApiError(e)
 
@@ -101,10 +176,12 @@ class ClusterService:
         except ApiException as e:
             raise KubernetesApiError(e)
 
-    def get_config_maps(self, namespace: str = 'default'):
+    def get_config_maps(self, namespace: str = 'default', label_selector: str = None, field_selector: str = None,
+                        limit: int = None, continue_token: str = None):
         try:
-            result = self.cluster_client.list_namespaced_config_map(namespace=namespace)
-            return render(result, Render.to_configmap_status_list)
+            result = self._list_namespaced('configmaps', self.cluster_client.list_namespaced_config_map, namespace,
+                                           label_selector, field_selector, limit, continue_token, raw=True)
+            return self._render_list(result, Render.to_configmap_status_list, RawRender.to_configmap_status_list, limit)
         except ApiException as e:
             raise KubernetesApiError(e)
 
@@ -123,10 +200,12 @@ class ClusterService:
         except ApiException as e:
             raise KubernetesApiError(e)
 
-    def get_secrets(self, namespace: str = 'default'):
+    def get_secrets(self, namespace: str = 'default', label_selector: str = None, field_selector: str = None,
+                    limit: int = None, continue_token: str = None):
         try:
-            result = self.cluster_client.list_namespaced_secret(namespace=namespace)
-            return render(result, Render.to_secret_status_list)
+            result = self._list_namespaced('secrets', self.cluster_client.list_namespaced_secret, namespace,
+                                           label_selector, field_selector, limit, continue_token, raw=True)
+            return self._render_list(result, Render.to_secret_status_list, RawRender.to_secret_status_list, limit)
         except ApiException as e:
             raise KubernetesApiError(e)
 
@@ -146,13 +225,20 @@ class ClusterService:
         except ApiException as e:
             raise KubernetesApiError(e)
 
-    def get_pods(self, namespace: str = 'default', label_selector: str = None):
+    def get_pods(self, namespace: str = 'default', label_selector: str = None, field_selector: str = None,
+                 limit: int = None, continue_token: str = None):
         try:
-            result = self.cluster_client.list_namespaced_pod(
-                namespace=namespace,
-                label_selector=label_selector
-            )
-            return render(result, Render.to_pod_status_list)
+            result = self._list_namespaced('pods', self.cluster_client.list_namespaced_pod, namespace,
+                                           label_selector, field_selector, limit, continue_token, raw=True)
+            return self._render_list(result, Render.to_pod_status_list, RawRender.to_pod_status_list, limit)
+        except ApiException as e:
+            raise KubernetesApiError(e)
+
+    def get_all_pods(self, namespaces: Optional[List[str]] = None, label_selector: str = None):
+        try:
+            result = self._list_all_namespaces(self.cluster_client.list_pod_for_all_namespaces,
+                                               self.cluster_client.list_namespaced_pod, namespaces, label_selector)
+            return to_aggregated_list(result, RawRender.to_pod_status)
         except ApiException as e:
             raise KubernetesApiError(e)
 
@@ -171,58 +257,117 @@ class ClusterService:
         except ApiException as e:
             raise KubernetesApiError(e)
 
-    def find_specific_pod_logs(self, namespace: str = 'default', label_selector: str = None):
-        try:
-            read_pod_result = self.cluster_client.list_namespaced_pod(
+    def _read_pod_logs(self, namespace: str, pod, tail_lines: int = None, since_seconds: int = None,
+                       limit_bytes: int = None, max_workers: int = 8):
+        """
+        init container 를 포함한 모든 container 의 로그를 동시에 조회한다.
+        일부 container 조회가 실패하면 해당 container 에는 오류 메시지를 담아 나머지 결과와 함께 반환하고,
+        모두 실패한 경우에만 예외를 발생시킨다.
+        """
+        containers = [container.name for container in (pod.spec.init_containers or []) + pod.spec.containers]
+
+        def read_log(container: str):
+            return self.cluster_client.read_namespaced_pod_log(
                 namespace=namespace,
-                label_selector=label_selector,
+                name=pod.metadata.name,
+                container=container,
+                tail_lines=tail_lines,
+                since_seconds=since_seconds,
+                limit_bytes=limit_bytes,
             )
+
+        result = {}
+        errors = []
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(containers)))) as executor:
+            futures = {container: executor.submit(read_log, container) for container in containers}
+            for container, future in futures.items():
+                try:
+                    result[container] = future.result()
+                except ApiException as e:
+                    errors.append(e)
+                    result[container] = f"Failed to read logs: ({e.status}) {e.reason}"
+        if errors and len(errors) == len(containers):
+            raise errors[0]
+        return result
+
+    def find_specific_pod_logs(self, namespace: str = 'default', label_selector: str = None,
+                               tail_lines: int = None, since_seconds: int = None, limit_bytes: int = None):
+        try:
+            read_pod_result = self._list_namespaced('pods', self.cluster_client.list_namespaced_pod, namespace,
+                                                   label_selector)
             result = {}
             if len(read_pod_result.items) == 0:
                 return render(result, Render.to_no_content)
 
             pod = read_pod_result.items[0]
-            for container in pod.spec.containers:
-                logs = self.cluster_client.read_namespaced_pod_log(
-                    namespace=namespace,
-                    name=pod.metadata.name,
-                    container=container.name,
-                )
-                result[container.name] = logs
+            result = self._read_pod_logs(namespace, pod, tail_lines=tail_lines, since_seconds=since_seconds,
+                                         limit_bytes=limit_bytes)
             return render(result, Render.to_pod_logs)
         except ApiException as e:
             raise KubernetesApiError(e)
 
-    def get_pod_logs(self, namespace: str = 'default', name: str = ''):
+    def get_pod_logs(self, namespace: str = 'default', name: str = '',
+                     tail_lines: int = None, since_seconds: int = None, limit_bytes: int = None):
         try:
             read_pod_result = self.cluster_client.read_namespaced_pod(namespace=namespace, name=name)
-            result = {}
-            for container in read_pod_result.spec.containers:
-                logs = self.cluster_client.read_namespaced_pod_log(
-                    namespace=namespace,
-                    name=name,
-                    container=container.name,
-                )
-                result[container.name] = logs
+            result = self._read_pod_logs(namespace, read_pod_result, tail_lines=tail_lines,
+                                         since_seconds=since_seconds, limit_bytes=limit_bytes)
             return render(result, Render.to_pod_logs)
         except ApiException as e:
             raise KubernetesApiError(e)
 
-    def get_container_logs(self, namespace: str = 'default', name: str = '', container: str = ''):
+    def get_container_logs(self, namespace: str = 'default', name: str = '', container: str = '',
+                           tail_lines: int = None, since_seconds: int = None, limit_bytes: int = None):
         try:
             result = self.cluster_client.read_namespaced_pod_log(
                 namespace=namespace,
                 name=name,
                 container=container,
+                tail_lines=tail_lines,
+                since_seconds=since_seconds,
+                limit_bytes=limit_bytes,
             )
             return render(result, Render.to_container_logs)
         except ApiException as e:
             raise KubernetesApiError(e)
 
-    def get_deployments(self, namespace: str = 'default'):
+    async def stream_container_logs(self, namespace: str = 'default', name: str = '', container: str = '',
+                                    follow: bool = False, tail_lines: int = None, since_seconds: int = None,
+                                    limit_bytes: int = None, timestamps: bool = False, read_timeout: float = 30.0):
+        """
+        로그를 메모리에 모두 올리지 않고 chunk 단위로 반환하는 async generator 를 생성한다.
+        httpx.AsyncClient 로 읽으므로 새 로그가 없는 follow 스트림도 스레드풀을 점유하지 않는다.
+        요청 자체의 오류(404 등)는 스트리밍을 시작하기 전에 예외로 전달된다.
+        """
+        response = await open_log_stream(
+            ClientFactory.get_async_http_client(), ClientFactory.get_auth_headers(), namespace, name,
+            params={
+                "container": container,
+                "follow": "true" if follow else None,
+                "tailLines": tail_lines,
+                "sinceSeconds": since_seconds,
+                "limitBytes": limit_bytes,
+                "timestamps": "true" if timestamps else None,
+            },
+            # follow 는 새 로그가 없을 수 있으므로 읽기 timeout 을 두지 않는다. (연결이 끊기면 취소됨)
+            timeout=httpx.Timeout(read_timeout, read=None if follow else read_timeout)
+        )
+        return aiter_log_chunks(response)
+
+    def get_deployments(self, namespace: str = 'default', label_selector: str = None, field_selector: str = None,
+                        limit: int = None, continue_token: str = None):
         try:
-            result = self.deployment_client.list_namespaced_deployment(namespace=namespace)
-            return render(result, Render.to_deployment_status_list)
+            result = self._list_namespaced('deployments', self.deployment_client.list_namespaced_deployment, namespace,
+                                           label_selector, field_selector, limit, continue_token, raw=True)
+            return self._render_list(result, Render.to_deployment_status_list, RawRender.to_deployment_status_list, limit)
+        except ApiException as e:
+            raise KubernetesApiError(e)
+
+    def get_all_deployments(self, namespaces: Optional[List[str]] = None):
+        try:
+            result = self._list_all_namespaces(self.deployment_client.list_deployment_for_all_namespaces,
+                                               self.deployment_client.list_namespaced_deployment, namespaces)
+            return to_aggregated_list(result, RawRender.to_deployment_status)
         except ApiException as e:
             raise KubernetesApiError(e)
 
@@ -241,10 +386,20 @@ class ClusterService:
         except ApiException as e:
             raise KubernetesApiError(e)
 
-    def get_services(self, namespace: str = 'default'):
+    def get_services(self, namespace: str = 'default', label_selector: str = None, field_selector: str = None,
+                     limit: int = None, continue_token: str = None):
+        try:
+            result = self._list_namespaced('services', self.cluster_client.list_namespaced_service, namespace,
+                                           label_selector, field_selector, limit, continue_token, raw=True)
+            return self._render_list(result, Render.to_service_status_list, RawRender.to_service_status_list, limit)
+        except ApiException as e:
+            raise KubernetesApiError(e)
+
+    def get_all_services(self, namespaces: Optional[List[str]] = None):
         try:
-            result = self.cluster_client.list_namespaced_service(namespace=namespace)
-            return render(result, Render.to_service_status_list)
+            result = self._list_all_namespaces(self.cluster_client.list_service_for_all_namespaces,
+                                               self.cluster_client.list_namespaced_service, namespaces)
+            return to_aggregated_list(result, RawRender.to_service_status)
         except ApiException as e:
             raise KubernetesApiError(e)
 
@@ -270,10 +425,12 @@ class ClusterService:
         except ApiException as e:
             raise KubernetesApiError(e)
 
-    def get_ingresses(self, namespace: str = 'default'):
+    def get_ingresses(self, namespace: str = 'default', label_selector: str = None, field_selector: str = None,
+                      limit: int = None, continue_token: str = None):
         try:
-            result = self.network_client.list_namespaced_ingress(namespace=namespace)
-            return render(result, Render.to_ingress_status_list)
+            result = self._list_namespaced('ingresses', self.network_client.list_namespaced_ingress, namespace,
+                                           label_selector, field_selector, limit, continue_token, raw=True)
+            return self._render_list(result, Render.to_ingress_status_list, RawRender.to_ingress_status_list, limit)
         except ApiException as e:
             raise KubernetesApiError(e)
 
@@ -291,3 +448,213 @@ class ClusterService:
             return render(result, Render.to_no_content)
         except ApiException as e:
             raise KubernetesApiError(e)
+
+    @staticmethod
+    def _apply_outcome(plural: str, item, status: str):
+        # VolumeClaim 만 metadata 없이 name 을 가진다.
+        name = getattr(item, 'metadata', item).name
+        return {"kind": plural, "name": name, "status": status, "resource_version": None, "error": None}
+
+    def _apply_resource(self, namespace: str, plural: str, build: callable, item, field_manager: str,
+                        dry_run: bool = False):
+        outcome = self._apply_outcome(plural, item, "applied")
+        try:
+            result = server_side_apply(self.cluster_client.api_client, plural, namespace, build(item),
+                                       field_manager=field_manager, dry_run=dry_run)
+            outcome["resource_version"] = result['metadata'].get('resourceVersion')
+        except ApiException as e:
+            outcome.update(status="failed", error=KubernetesApiError(e).result)
+        except Exception as e:
+            outcome.update(status="failed", error=str(e))
+        return outcome
+
+    def apply_resources(self, namespace: str, bulk: BulkApply):
+        """
+        여러 리소스를 server-side apply 로 한 번에 적용한다.
+        참조 관계에 따라 (ConfigMap, Secret, PVC) -> Deployment -> Service -> Ingress 순서로 적용하며
+        같은 단계의 리소스는 동시에 적용한다. stop_on_error 이면 실패가 있는 단계 이후는 건너뛴다.
+        """
+        def build_secret(secret: Secret):
+            return Factory.build_secret(secret.copy(update={"data": encode_to_base64(secret.data)}))
+
+        tiers = [
+            [("configmaps", Factory.build_configmap, item) for item in bulk.config_maps]
+            + [("secrets", build_secret, item) for item in bulk.secrets]
+            + [("persistentvolumeclaims", Factory.build_pvc, item) for item in bulk.volume_claims],
+            [("deployments", Factory.build_deployment, item) for item in bulk.deployments],
+            [("services", Factory.build_service, item) for item in bulk.services],
+            [("ingresses", Factory.build_ingress, item) for item in bulk.ingresses],
+        ]
+        results = []
+        failed = False
+        for tier in tiers:
+            if not tier:
+                continue
+            if failed and bulk.stop_on_error:
+                results.extend(self._apply_outcome(plural, item, "skipped") for plural, _, item in tier)
+                continue
+            with ThreadPoolExecutor(max_workers=max(1, min(bulk.max_workers, len(tier)))) as executor:
+                outcomes = list(executor.map(
+                    lambda entry: self._apply_resource(namespace, *entry, field_manager=bulk.field_manager,
+                                                       dry_run=bulk.dry_run), tier))
+            failed = failed or any(outcome["status"] == "failed" for outcome in outcomes)
+            results.extend(outcomes)
+        return {
+            "total": len(results),
+            "applied": sum(1 for outcome in results if outcome["status"] == "applied"),
+            "failed": sum(1 for outcome in results if outcome["status"] == "failed"),
+            "skipped": sum(1 for outcome in results if outcome["status"] == "skipped"),
+            "results": results,
+        }
+
+    def _read_live(self, plural: str, read_func: callable, namespace: str, name: str) -> dict:
+        if self.watch_cache is not None:
+            cached = self.watch_cache.get(plural, namespace, name)
+            if cached is not None:
+                return self.cluster_client.api_client.sanitize_for_serialization(cached)
+        return load_json(read_func(name=name, namespace=namespace, _preload_content=False).data)
+
+    def _update_resource(self, namespace: str, plural: str, read_func: callable, body, field_manager: str,
+                         force: bool = True, dry_run: bool = False):
+        """
+        현재 객체(watch cache 또는 API 서버)와 비교하여 바뀐 필드가 있을 때만 server-side apply 로 갱신한다.
+        apply 요청에는 field_manager 가 관리할 전체 설정을 보내며, 생략된 필드는 해당 manager 의 소유에서 제외된다.
+        """
+        api_client = self.cluster_client.api_client
+        desired = to_apply_body(api_client, plural, body)
+        name = desired['metadata']['name']
+        live = self._read_live(plural, read_func, namespace, name)
+        changed = diff_fields({key: value for key, value in desired.items() if key not in ('apiVersion', 'kind')},
+                              live)
+        result = {"name": name, "changed": changed, "applied": False,
+                  "resource_version": live['metadata'].get('resourceVersion')}
+        if changed:
+            applied = server_side_apply(api_client, plural, namespace, desired, field_manager=field_manager,
+                                        force=force, dry_run=dry_run)
+            result.update(applied=True, resource_version=applied['metadata'].get('resourceVersion'))
+        return result
+
+    def update_config_map(self, namespace: str, name: str, config_map: ConfigMap, field_manager: str = 'mlops-api',
+                          force: bool = True, dry_run: bool = False):
+        try:
+            # 요청 모델을 재사용하거나 재시도해도 값이 바뀌지 않도록 복사본으로 body 를 만든다.
+            config_map = config_map.copy(deep=True)
+            config_map.metadata.name = name
+            body = Factory.build_configmap(config_map)
+            return self._update_resource(namespace, 'configmaps', self.cluster_client.read_namespaced_config_map,
+                                         body, field_manager, force, dry_run)
+        except ApiException as e:
+            raise KubernetesApiError(e)
+
+    def update_secret(self, namespace: str, name: str, secret: Secret, field_manager: str = 'mlops-api',
+                      force: bool = True, dry_run: bool = False):
+        try:
+            secret = secret.copy(deep=True)
+            secret.metadata.name = name
+            secret.data = encode_to_base64(secret.data)
+            body = Factory.build_secret(secret)
+            return self._update_resource(namespace, 'secrets', self.cluster_client.read_namespaced_secret,
+                                         body, field_manager, force, dry_run)
+        except ApiException as e:
+            raise KubernetesApiError(e)
+
+    def update_deployment(self, namespace: str, name: str, deployment: Deployment, field_manager: str = 'mlops-api',
+                          force: bool = True, dry_run: bool = False):
+        try:
+            deployment = deployment.copy(deep=True)
+            deployment.metadata.name = name
+            body = Factory.build_deployment(deployment)
+            return self._update_resource(namespace, 'deployments', self.deployment_client.read_namespaced_deployment,
+                                         body, field_manager, force, dry_run)
+        except ApiException as e:
+            raise KubernetesApiError(e)
+
+    def update_service(self, namespace: str, name: str, service: Service, field_manager: str = 'mlops-api',
+                       force: bool = True, dry_run: bool = False):
+        try:
+            service = service.copy(deep=True)
+            service.metadata.name = name
+            body = Factory.build_service(service)
+            return self._update_resource(namespace, 'services', self.cluster_client.read_namespaced_service,
+                                         body, field_manager, force, dry_run)
+        except ApiException as e:
+            raise KubernetesApiError(e)
+
+    def update_ingress(self, namespace: str, name: str, ingress: Ingress, field_manager: str = 'mlops-api',
+                       force: bool = True, dry_run: bool = False):
+        try:
+            ingress = ingress.copy(deep=True)
+            ingress.metadata.name = name
+            body = Factory.build_ingress(ingress)
+            return self._update_resource(namespace, 'ingresses', self.network_client.read_namespaced_ingress,
+                                         body, field_manager, force, dry_run)
+        except ApiException as e:
+            raise KubernetesApiError(e)
+
+    def _collection_api(self, kind: str):
+        # kind: (API 클라이언트, 메서드 이름의 리소스 부분)
+        apis = {
+            'pods': (self.cluster_client, 'namespaced_pod'),
+            'configmaps': (self.cluster_client, 'namespaced_config_map'),
+            'secrets': (self.cluster_client, 'namespaced_secret'),
+            'persistentvolumeclaims': (self.cluster_client, 'namespaced_persistent_volume_claim'),
+            'services': (self.cluster_client, 'namespaced_service'),
+            'deployments': (self.deployment_client, 'namespaced_deployment'),
+            'ingresses': (self.network_client, 'namespaced_ingress'),
+        }
+        if kind not in apis:
+            raise KubernetesUnsupportedKindError(kind)
+        return apis[kind]
+
+    def _delete_each(self, api_client, resource: str, namespace: str, label_selector: str, field_selector: str,
+                     options: dict, max_workers: int):
+        items = load_json(getattr(api_client, f"list_{resource}")(
+            namespace=namespace, label_selector=label_selector, field_selector=field_selector,
+            _preload_content=False).data)['items']
+        names = [item['metadata']['name'] for item in items]
+
+        def delete(name: str):
+            try:
+                getattr(api_client, f"delete_{resource}")(name=name, namespace=namespace, **options)
+                return name, None
+            except ApiException as e:
+                return name, None if e.status == 404 else KubernetesApiError(e).result
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(names)))) as executor:
+            results = list(executor.map(delete, names))
+        return [name for name, error in results if error is None], \
+            [{"name": name, "error": error} for name, error in results if error is not None]
+
+    def delete_collection(self, namespace: str, kind: str, label_selector: str = None, field_selector: str = None,
+                          propagation_policy: str = 'Background', dry_run: bool = False, max_workers: int = 8):
+        """
+        selector 에 해당하는 리소스를 deletecollection 한 번으로 삭제한다.
+        deletecollection 을 지원하지 않는 경우(405 또는 클라이언트에 메서드 없음) 목록을 조회하여 개별 삭제를 동시에 실행한다.
+        """
+        if not label_selector and not field_selector:
+            raise RequestValidationError(message="label_selector or field_selector is required.",
+                                         result={"kind": kind, "namespace": namespace})
+        api_client, resource = self._collection_api(kind)
+        options = {"propagation_policy": propagation_policy, "dry_run": 'All' if dry_run else None}
+        try:
+            delete_collection = getattr(api_client, f"delete_collection_{resource}", None)
+            if delete_collection is not None:
+                try:
+                    result = load_json(delete_collection(namespace=namespace, label_selector=label_selector,
+                                                         field_selector=field_selector, _preload_content=False,
+                                                         **options).data)
+                    return {
+                        "kind": kind,
+                        "mode": "collection",
+                        "dry_run": dry_run,
+                        "deleted": [item['metadata']['name'] for item in result.get('items') or []],
+                        "failed": [],
+                    }
+                except ApiException as e:
+                    if e.status != 405:
+                        raise
+            deleted, failed = self._delete_each(api_client, resource, namespace, label_selector, field_selector,
+                                                options, max_workers)
+            return {"kind": kind, "mode": "each", "dry_run": dry_run, "deleted": deleted, "failed": failed}
+        except ApiException as e:
+            raise KubernetesApiError(e)
@@ -5,8 +5,31 @@ from src import app_config
 MODULE_CODE = 103
 
 
-def load_cluster_config():
-    config.load_kube_config(config_file=app_config.CLUSTER_KUBE_CONFIG_PATH)
+def load_cluster_config(config_file: str = None, client_configuration=None):
+    config.load_kube_config(config_file=config_file or app_config.CLUSTER_KUBE_CONFIG_PATH,
+                            client_configuration=client_configuration)
+
+
+def get_connection_pool_config():
+    return app_config.CLUSTER_CONNECTION_POOL_MAXSIZE, app_config.CLUSTER_CONNECTION_RETRIES
+
+
+def get_watch_cache_config():
+    return app_config.CLUSTER_WATCH_CACHE_ENABLED, app_config.CLUSTER_WATCH_CACHE_RESYNC_SECONDS
+
+
+def get_usage_config():
+    return app_config.CLUSTER_USAGE_COLLECTOR_ENABLED, app_config.CLUSTER_USAGE_INTERVAL_SECONDS
+
+
+def get_notebook_culling_config():
+    return app_config.CLUSTER_NOTEBOOK_CULLING_ENABLED, app_config.CLUSTER_NOTEBOOK_IDLE_SECONDS, \
+        app_config.CLUSTER_NOTEBOOK_CULLING_INTERVAL_SECONDS
+
+
+def get_warm_pool_config():
+    return app_config.CLUSTER_WARM_POOL_ENABLED, app_config.CLUSTER_WARM_POOL_NAMESPACE, \
+        app_config.CLUSTER_WARM_POOL_INTERVAL_SECONDS
 
 
 def get_nfs_config():
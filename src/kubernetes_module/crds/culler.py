@@ -0,0 +1,155 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Optional
+
+import httpx
+from kubernetes.client import CustomObjectsApi
+from kubernetes.client.rest import ApiException
+
+STOP_ANNOTATION = 'kubeflow-resource-stopped'
+LAST_ACTIVITY_ANNOTATION = 'notebooks.kubeflow.org/last-activity'
+
+
+def _now():
+    return datetime.now(timezone.utc)
+
+
+def _to_timestamp(value: datetime):
+    return value.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def is_stopped(item: dict):
+    return STOP_ANNOTATION in (item['metadata'].get('annotations') or {})
+
+
+def to_stop_patch(stopped: bool):
+    """notebook 을 중지(annotation 추가)하거나 다시 시작(annotation 제거)하는 merge patch"""
+    now = _to_timestamp(_now())
+    if stopped:
+        return {"metadata": {"annotations": {STOP_ANNOTATION: now}}}
+    # 다시 시작한 notebook 이 바로 중지되지 않도록 last-activity 도 현재 시각으로 갱신
+    return {"metadata": {"annotations": {STOP_ANNOTATION: None, LAST_ACTIVITY_ANNOTATION: now}}}
+
+
+class NotebookCuller:
+    """
+    주기적으로 notebook 의 마지막 활동 시각을 확인하여 idle_seconds 이상 사용하지 않은 notebook 을 중지한다.
+    - 활동 시각은 Jupyter kernel API(/api/kernels) 의 last_activity 와 실행 중인 kernel 여부로 판단
+    - kernel API 에 접근할 수 없으면 notebook controller 가 기록한 last-activity annotation 을 사용하고,
+      둘 다 없으면 활동 여부를 알 수 없으므로 중지하지 않는다. (클러스터 밖에서 실행하면 kernel API 에 접근할 수 없음)
+    - 중지는 kubeflow-resource-stopped annotation 을 추가하여 notebook controller 가 StatefulSet 을 0 으로 줄이게 한다.
+      GPU 등 요청한 자원은 pod 가 삭제되면서 반환된다.
+    """
+
+    def __init__(self, crd_client: CustomObjectsApi, idle_seconds: int = 3600, interval: float = 300.0,
+                 kernel_timeout: float = 5.0, max_workers: int = 16):
+        self.crd_client = crd_client
+        self.idle_seconds = idle_seconds
+        self.interval = interval
+        self.kernel_timeout = kernel_timeout
+        self.max_workers = max_workers
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.culled_count = 0
+        self.last_run = None
+
+    @staticmethod
+    def kernel_api_url(namespace: str, name: str):
+        return f"http://{name}.{namespace}.svc.cluster.local/notebook/{namespace}/{name}/api/kernels"
+
+    def _get_kernel_activity(self, http_client: httpx.Client, namespace: str, name: str) -> Optional[datetime]:
+        """실행 중인 kernel 이 있으면 현재 시각, 아니면 kernel 의 마지막 활동 시각. 조회할 수 없으면 None"""
+        try:
+            response = http_client.get(self.kernel_api_url(namespace, name))
+            response.raise_for_status()
+            kernels = response.json()
+        except (httpx.HTTPError, ValueError):
+            return None
+        if any(kernel.get('execution_state') == 'busy' for kernel in kernels):
+            return _now()
+        activities = [_parse_timestamp(kernel.get('last_activity')) for kernel in kernels]
+        activities = [activity for activity in activities if activity is not None]
+        return max(activities) if activities else None
+
+    def get_last_activity(self, http_client: httpx.Client, item: dict) -> Optional[datetime]:
+        metadata = item['metadata']
+        return (self._get_kernel_activity(http_client, metadata['namespace'], metadata['name'])
+                or _parse_timestamp((metadata.get('annotations') or {}).get(LAST_ACTIVITY_ANNOTATION)))
+
+    def _cull_one(self, http_client: httpx.Client, item: dict):
+        """idle 상태이면 notebook 을 중지하고 True 를 반환한다."""
+        last_activity = self.get_last_activity(http_client, item)
+        if last_activity is None or (_now() - last_activity).total_seconds() < self.idle_seconds:
+            return False
+        namespace, name = item['metadata']['namespace'], item['metadata']['name']
+        try:
+            self.crd_client.patch_namespaced_custom_object(
+                group="kubeflow.org", version="v1alpha1",
+                plural="notebooks",
+                namespace=namespace,
+                name=name,
+                body=to_stop_patch(stopped=True)
+            )
+        except ApiException as e:
+            logging.warning(f"Failed to stop idle notebook {namespace}/{name}: {e.status} {e.reason}")
+            return False
+        logging.info(f"Notebook {namespace}/{name} stopped after idle since {_to_timestamp(last_activity)}")
+        return True
+
+    def cull(self):
+        """idle 상태인 notebook 을 중지하고 중지한 notebook 의 (namespace, name) 목록을 반환한다."""
+        items = self.crd_client.list_cluster_custom_object(
+            group="kubeflow.org", version="v1alpha1",
+            plural="notebooks"
+        )['items']
+        items = [item for item in items if not is_stopped(item)]
+        # 응답하지 않는 notebook 마다 kernel_timeout 만큼 기다리지 않도록 동시에 확인한다.
+        with httpx.Client(timeout=self.kernel_timeout) as http_client, \
+                ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(items)))) as executor:
+            stopped = list(executor.map(lambda item: self._cull_one(http_client, item), items))
+        culled = [(item['metadata']['namespace'], item['metadata']['name'])
+                  for item, is_culled in zip(items, stopped) if is_culled]
+        self.culled_count += len(culled)
+        self.last_run = time.time()
+        return culled
+
+    def _run(self):
+        while not self._stop_event.wait(timeout=self.interval):
+            try:
+                self.cull()
+            except Exception as e:
+                logging.warning(f"Notebook culling failed: {e}")
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="notebook-culler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def get_metrics(self):
+        return {
+            "running": self._thread is not None and self._thread.is_alive(),
+            "idle_seconds": self.idle_seconds,
+            "interval": self.interval,
+            "culled": self.culled_count,
+            "last_run": self.last_run,
+        }
@@ -1,5 +1,6 @@
+from src.kubernetes_module.crds.culler import is_stopped
 from src.kubernetes_module.schemas import Metadata
-from src.kubernetes_module.utils import to_yaml, get_status_uri, get_overview_uri, get_logs_uri, get_connect_uri, \
+from src.kubernetes_module.utils import get_status_uri, get_overview_uri, get_logs_uri, get_connect_uri, \
     get_delete_uri
 
 
@@ -36,15 +37,13 @@ class Render:
         containers = item['spec']['template']['spec']['containers']
         notebook = containers[0]
 
-        if 'nvidia.com/gpu' not in notebook['resources']['limits']:
-            notebook['resources']['limits']['nvidia.com/gpu'] = 0
-
         return {
             "status": item['status']['containerState'] if 'status' in item else {},
+            "stopped": is_stopped(item),
             "name": metadata.name,
             "created_at": metadata.create_date,
             "image": notebook['image'],
-            "gpus": notebook['resources']['limits']['nvidia.com/gpu'],
+            "gpus": notebook['resources']['limits'].get('nvidia.com/gpu', 0),
             "cpus": notebook['resources']['limits']['cpu'],
             "memory": notebook['resources']['limits']['memory'],
             "connect": get_connect_uri(namespace, metadata.name),
@@ -52,7 +51,7 @@ class Render:
         }
 
     @staticmethod
-    def to_notebook_details(model):
+    def to_notebook_details(model, yaml: list = None):
         label_selector = f"notebook-name={model['metadata']['name']}"
         namespace = model['metadata']['namespace']
         name = model['metadata']['name']
@@ -62,7 +61,7 @@ class Render:
             "logs": get_logs_uri(namespace, label_selector),
             "connect": get_connect_uri(namespace, name),
             "delete": get_delete_uri(namespace, name),
-            "yaml": to_yaml(model),
+            "yaml": yaml,
         }
 
     @staticmethod
@@ -90,3 +89,19 @@ class Render:
             "volumes": volumes,
             "conditions": conditions,
         }
+
+    @staticmethod
+    def to_event(item: dict):
+        return {
+            "type": item.get('type'),
+            "reason": item.get('reason'),
+            "message": item.get('message'),
+            "count": item.get('count'),
+            "object": f"{item['involvedObject'].get('kind')}/{item['involvedObject'].get('name')}",
+            "last_timestamp": item.get('lastTimestamp') or item.get('eventTime'),
+        }
+
+    @staticmethod
+    def to_recent_events(items: list, limit: int = 20):
+        events = sorted(items, key=lambda item: item.get('lastTimestamp') or item.get('eventTime') or '', reverse=True)
+        return [Render.to_event(item) for item in events[:limit]]
@@ -1,9 +1,13 @@
-from fastapi import APIRouter
+from typing import List, Optional
+
+from fastapi import APIRouter, Header, Query
+from fastapi import Response as HttpResponse
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 
-from src.kubernetes_module import crd_service
+from src.kubernetes_module import crd_service, notebook_culler, notebook_templates
 from src.kubernetes_module.config import MODULE_CODE
-from src.kubernetes_module.schemas import Notebook
+from src.kubernetes_module.schemas import Notebook, NotebookTemplate, NotebookFromTemplate
 from src.response import Response
 
 router = APIRouter(
@@ -13,9 +17,18 @@ router = APIRouter(
 )
 
 
+@router.get("/notebooks", tags=["notebook"], response_model=Response)
+async def get_all_notebooks(namespaces: Optional[List[str]] = Query(default=None)):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(crd_service.get_all_notebooks, namespaces))
+
+
 @router.get("/namespaces/{namespace}/notebooks", tags=["notebook"], response_model=Response)
-async def get_notebooks(namespace: str):
-    return Response.from_result(MODULE_CODE, crd_service.get_notebooks(namespace))
+async def get_notebooks(namespace: str, response: HttpResponse, if_none_match: Optional[str] = Header(default=None)):
+    etag, result = await run_in_threadpool(crd_service.get_notebooks, namespace, if_none_match)
+    if result is None:
+        return HttpResponse(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return Response.from_result(MODULE_CODE, result)
 
 
 @router.post("/namespaces/{namespace}/notebooks", tags=["notebook"], response_model=Response)
@@ -29,10 +42,58 @@ async def delete_notebook(namespace: str, name: str = ''):
 
 
 @router.get("/namespaces/{namespace}/notebooks/{name}", tags=["notebook"], response_model=Response)
-async def get_notebook(namespace: str, name: str):
-    return Response.from_result(MODULE_CODE, crd_service.get_notebook(namespace, name))
+async def get_notebook(namespace: str, name: str, include_yaml: bool = False):
+    return Response.from_result(MODULE_CODE, crd_service.get_notebook(namespace, name, include_yaml=include_yaml))
+
+
+@router.get("/namespaces/{namespace}/notebooks/{name}/yaml", tags=["notebook"], response_model=Response)
+async def get_notebook_yaml(namespace: str, name: str):
+    return Response.from_result(MODULE_CODE, crd_service.get_notebook_yaml(namespace, name))
 
 
 @router.get("/namespaces/{namespace}/notebooks/{name}/overview", tags=["notebook"], response_model=Response)
 async def get_notebook_overview(namespace: str, name: str):
     return Response.from_result(MODULE_CODE, crd_service.get_notebook_overview(namespace, name))
+
+
+@router.get("/namespaces/{namespace}/notebooks/{name}/summary", tags=["notebook"], response_model=Response)
+async def get_notebook_summary(namespace: str, name: str, tail_lines: int = 100):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(
+        crd_service.get_notebook_summary, namespace, name, tail_lines=tail_lines))
+
+
+@router.post("/namespaces/{namespace}/notebooks/{name}/stop", tags=["notebook"], response_model=Response)
+async def stop_notebook(namespace: str, name: str):
+    return Response.from_result(MODULE_CODE, crd_service.set_notebook_stopped(namespace, name, stopped=True))
+
+
+@router.post("/namespaces/{namespace}/notebooks/{name}/start", tags=["notebook"], response_model=Response)
+async def start_notebook(namespace: str, name: str):
+    return Response.from_result(MODULE_CODE, crd_service.set_notebook_stopped(namespace, name, stopped=False))
+
+
+@router.get("/notebook-culler", tags=["notebook"], response_model=Response)
+async def get_notebook_culler():
+    return Response.from_result(MODULE_CODE, notebook_culler.get_metrics())
+
+
+@router.get("/notebook-templates", tags=["notebook"], response_model=Response)
+async def get_notebook_templates():
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(notebook_templates.get_templates))
+
+
+@router.put("/notebook-templates", tags=["notebook"], response_model=Response)
+async def put_notebook_template(template: NotebookTemplate):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(notebook_templates.put_template, template))
+
+
+@router.delete("/notebook-templates/{name}", tags=["notebook"], response_model=Response)
+async def delete_notebook_template(name: str):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(notebook_templates.delete_template, name))
+
+
+@router.post("/namespaces/{namespace}/notebook-templates/{template}/notebooks", tags=["notebook"],
+             response_model=Response)
+async def create_notebook_from_template(namespace: str, template: str, notebook: NotebookFromTemplate):
+    return Response.from_result(MODULE_CODE, await run_in_threadpool(
+        notebook_templates.create_notebook, namespace, template, notebook))
@@ -1,27 +1,122 @@
-from kubernetes.client import ApiClient, CustomObjectsApi
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Optional
+
+from kubernetes.client import ApiClient, CoreV1Api, CustomObjectsApi
 from kubernetes.client.rest import ApiException
 
+from src.kubernetes_module.aggregate import list_across_namespaces, to_aggregated_list
+from src.kubernetes_module.cluster.informer import WatchCache, name_of, resource_version_of
+from src.kubernetes_module.cluster.render import RawRender
+from src.kubernetes_module.crds.culler import to_stop_patch
 from src.kubernetes_module.crds.render import Render
 from src.kubernetes_module.exceptions import KubernetesApiError
 from src.kubernetes_module.resource import ResourceFactory
 from src.kubernetes_module.schemas import Notebook
-from src.kubernetes_module.utils import render
+from src.kubernetes_module.utils import render, load_json, to_yaml, etag_matches
 
 
 class CrdService:
-    def __init__(self, api_client: ApiClient, crd_client: CustomObjectsApi):
+    NOTEBOOK_STATUS_CACHE_SIZE = 1024
+    NOTEBOOK_YAML_CACHE_SIZE = 256
+
+    def __init__(self, api_client: ApiClient, crd_client: CustomObjectsApi, watch_cache: Optional[WatchCache] = None):
         self.api_client = api_client
         self.crd_client = crd_client
+        # watch_cache 가 있으면 notebook 목록을 list + watch 로 유지되는 메모리 캐시에서 조회
+        self.watch_cache = watch_cache
+        self.list_notebooks_func = partial(self.crd_client.list_namespaced_custom_object,
+                                           group="kubeflow.org", version="v1alpha1", plural="notebooks")
+        # (namespace, name): (resourceVersion, 변환 결과), 최근 변환한 NOTEBOOK_STATUS_CACHE_SIZE 개만 유지 (LRU)
+        self._notebook_status = OrderedDict()
+        self._notebook_status_lock = threading.Lock()
+        # (namespace, name): (resourceVersion, yaml 줄 목록), 최근 조회한 NOTEBOOK_YAML_CACHE_SIZE 개만 유지 (LRU)
+        self._notebook_yaml = OrderedDict()
+        self._notebook_yaml_lock = threading.Lock()
         pass
 
-    def get_notebooks(self, namespace: str):
+    def _list_notebooks(self, namespace: str):
+        if self.watch_cache is not None:
+            items = self.watch_cache.list_items('notebooks', namespace, self.list_notebooks_func)
+            if items is not None:
+                return items
+        return self.list_notebooks_func(namespace=namespace)['items']
+
+    def _to_notebook_status(self, namespace: str, item: dict):
+        # 같은 resourceVersion 의 notebook 은 다시 변환하지 않는다.
+        key = (namespace, name_of(item))
+        with self._notebook_status_lock:
+            cached = self._notebook_status.get(key)
+            if cached is not None and cached[0] == resource_version_of(item):
+                self._notebook_status.move_to_end(key)
+                return cached[1]
+        status = Render.to_notebook_status(item)
+        with self._notebook_status_lock:
+            self._notebook_status[key] = (resource_version_of(item), status)
+            self._notebook_status.move_to_end(key)
+            while len(self._notebook_status) > self.NOTEBOOK_STATUS_CACHE_SIZE:
+                self._notebook_status.popitem(last=False)
+        return status
+
+    def _to_notebook_yaml(self, item: dict):
+        # yaml.dump 는 느리므로 같은 resourceVersion 이면 이전 결과를 재사용한다.
+        key = (item['metadata']['namespace'], name_of(item))
+        with self._notebook_yaml_lock:
+            cached = self._notebook_yaml.get(key)
+            if cached is not None and cached[0] == resource_version_of(item):
+                self._notebook_yaml.move_to_end(key)
+                return cached[1]
+        lines = to_yaml(item)
+        with self._notebook_yaml_lock:
+            self._notebook_yaml[key] = (resource_version_of(item), lines)
+            self._notebook_yaml.move_to_end(key)
+            while len(self._notebook_yaml) > self.NOTEBOOK_YAML_CACHE_SIZE:
+                self._notebook_yaml.popitem(last=False)
+        return lines
+
+    @staticmethod
+    def notebook_list_etag(items: list):
+        versions = sorted(f"{name_of(item)}:{resource_version_of(item)}" for item in items)
+        return '"' + hashlib.sha1("|".join(versions).encode()).hexdigest() + '"'
+
+    def get_notebooks(self, namespace: str, if_none_match: Optional[str] = None):
+        """
+        (ETag, notebook 목록) 을 반환한다.
+        ETag 는 notebook 이름과 resourceVersion 으로 계산하며 if_none_match 와 일치하면 목록 대신 None 을 반환한다.
+        """
         try:
-            result = self.crd_client.list_namespaced_custom_object(
-                group="kubeflow.org", version="v1alpha1",
-                plural="notebooks",
-                namespace=namespace
+            items = self._list_notebooks(namespace)
+            etag = self.notebook_list_etag(items)
+            if etag_matches(if_none_match, etag):
+                return etag, None
+            names = {name_of(item) for item in items}
+            with self._notebook_status_lock:
+                for key in [key for key in self._notebook_status if key[0] == namespace and key[1] not in names]:
+                    del self._notebook_status[key]
+            return etag, [self._to_notebook_status(namespace, item) for item in items]
+        except ApiException as e:
+            raise KubernetesApiError(e)
+
+    def get_all_notebooks(self, namespaces: Optional[List[str]] = None):
+        try:
+            result = list_across_namespaces(
+                list_all=lambda: self.crd_client.list_cluster_custom_object(
+                    group="kubeflow.org", version="v1alpha1",
+                    plural="notebooks"
+                )['items'],
+                list_namespaced=lambda namespace: self.crd_client.list_namespaced_custom_object(
+                    group="kubeflow.org", version="v1alpha1",
+                    plural="notebooks",
+                    namespace=namespace
+                )['items'],
+                get_namespaces=lambda: [item.metadata.name for item in CoreV1Api(self.api_client).list_namespace().items],
+                namespace_of=lambda item: item['metadata']['namespace'],
+                namespaces=namespaces,
             )
-            return render(result, Render.to_notebook_status_list)
+            return to_aggregated_list(result, Render.to_notebook_status)
         except ApiException as e:
             raise KubernetesApiError(e)
 
@@ -46,22 +141,47 @@ class CrdService:
                 namespace=namespace,
                 name=name
             )
+            with self._notebook_yaml_lock:
+                self._notebook_yaml.pop((namespace, name), None)
             return render(result, Render.to_no_content)
         except ApiException as e:
             raise KubernetesApiError(e)
 
-    def get_notebook(self, namespace: str, name: str):
+    def set_notebook_stopped(self, namespace: str, name: str, stopped: bool):
+        """
+        kubeflow-resource-stopped annotation 으로 notebook 을 중지하거나 다시 시작한다.
+        notebook controller 가 StatefulSet replicas 를 0 / 1 로 조정하며 PVC 와 notebook 설정은 유지된다.
+        """
         try:
-            result = self.crd_client.get_namespaced_custom_object(
+            result = self.crd_client.patch_namespaced_custom_object(
+                group="kubeflow.org", version="v1alpha1",
+                plural="notebooks",
+                namespace=namespace,
+                name=name,
+                body=to_stop_patch(stopped)
+            )
+            return render(result, Render.to_notebook_status)
+        except ApiException as e:
+            raise KubernetesApiError(e)
+
+    def _get_notebook(self, namespace: str, name: str):
+        try:
+            return self.crd_client.get_namespaced_custom_object(
                 group="kubeflow.org", version="v1alpha1",
                 plural="notebooks",
                 namespace=namespace,
                 name=name
             )
-            return render(result, Render.to_notebook_details)
         except ApiException as e:
             raise KubernetesApiError(e)
 
+    def get_notebook(self, namespace: str, name: str, include_yaml: bool = False):
+        result = self._get_notebook(namespace, name)
+        return Render.to_notebook_details(result, yaml=self._to_notebook_yaml(result) if include_yaml else None)
+
+    def get_notebook_yaml(self, namespace: str, name: str):
+        return self._to_notebook_yaml(self._get_notebook(namespace, name))
+
     def get_notebook_overview(self, namespace: str, name: str):
         try:
             result = self.crd_client.get_namespaced_custom_object(
@@ -73,3 +193,61 @@ class CrdService:
             return render(result, Render.to_notebook_overview)
         except ApiException as e:
             raise KubernetesApiError(e)
+
+    def get_notebook_summary(self, namespace: str, name: str, tail_lines: int = 100, event_limit: int = 20):
+        """
+        notebook 상세 화면에 필요한 notebook, pod 상태, 최근 이벤트, 마지막 로그를 동시에 조회하여 한 번에 반환한다.
+        notebook 외의 항목은 실패해도 errors 에 기록하고 나머지 결과를 반환한다.
+        notebook controller 가 만드는 StatefulSet 의 pod 이름({name}-0)과 container 이름({name})을 사용한다.
+        """
+        core_client = CoreV1Api(self.api_client)
+        pod_name = f"{name}-0"
+
+        def list_events(object_name: str):
+            return load_json(core_client.list_namespaced_event(
+                namespace=namespace,
+                field_selector=f"involvedObject.name={object_name}",
+                _preload_content=False
+            ).data)['items']
+
+        tasks = {
+            "notebook": lambda: self.crd_client.get_namespaced_custom_object(
+                group="kubeflow.org", version="v1alpha1",
+                plural="notebooks",
+                namespace=namespace,
+                name=name
+            ),
+            "pods": lambda: load_json(core_client.list_namespaced_pod(
+                namespace=namespace,
+                label_selector=f"notebook-name={name}",
+                _preload_content=False
+            ).data),
+            "notebook_events": lambda: list_events(name),
+            "pod_events": lambda: list_events(pod_name),
+            "logs": lambda: core_client.read_namespaced_pod_log(
+                namespace=namespace,
+                name=pod_name,
+                container=name,
+                tail_lines=tail_lines
+            ),
+        }
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {key: executor.submit(task) for key, task in tasks.items()}
+        results, errors = {}, {}
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except ApiException as e:
+                results[key] = None
+                errors[key] = KubernetesApiError(e).result
+        if results["notebook"] is None:
+            raise KubernetesApiError(futures["notebook"].exception())
+
+        return {
+            "notebook": render(results["notebook"], Render.to_notebook_overview),
+            "pods": RawRender.to_pod_status_list(results["pods"]) if results["pods"] is not None else None,
+            "events": Render.to_recent_events((results["notebook_events"] or []) + (results["pod_events"] or []),
+                                              limit=event_limit),
+            "logs": results["logs"].split("\n") if results["logs"] is not None else None,
+            "errors": errors,
+        }
@@ -0,0 +1,274 @@
+import hashlib
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from kubernetes.client import ApiClient, AppsV1Api, CoreV1Api, CustomObjectsApi
+from kubernetes.client.rest import ApiException
+
+from src.kubernetes_module.crds.render import Render
+from src.kubernetes_module.exceptions import KubernetesApiError, NotebookTemplateNotFoundError, RequestValidationError
+from src.kubernetes_module.resource import ResourceFactory
+from src.kubernetes_module.schemas import NotebookTemplate, NotebookFromTemplate, NOTEBOOK_WARM_POOL_PREFIX
+from src.kubernetes_module.utils import render
+
+TEMPLATE_CONFIG_MAP = 'notebook-templates'
+TEMPLATE_LABEL = 'notebook-template'
+MANAGED_BY_LABELS = {"app.kubernetes.io/managed-by": "mlops-api", "app.kubernetes.io/component": "notebook-warm-pool"}
+TEMPLATE_HASH_ANNOTATION = 'mlops-api/template-hash'
+
+
+def _percentile(samples: list, ratio: float):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return round(ordered[min(int(len(ordered) * ratio), len(ordered) - 1)], 1)
+
+
+def _template_hash(template: NotebookTemplate):
+    return hashlib.sha1(template.json(sort_keys=True).encode()).hexdigest()
+
+
+class NotebookTemplateService:
+    """
+    notebook template(이미지, 자원, volume) 을 관리하고 template 별 warm pool DaemonSet 을 유지한다.
+    - template 은 namespace 의 notebook-templates ConfigMap 에 JSON 으로 저장
+    - warm_pool 이 켜진 template 은 이미지를 노드에 미리 받아두는 DaemonSet 을 만들고, 삭제된 template 의 DaemonSet 은 정리
+    - template 으로 만든 notebook 이 ready 가 될 때까지 걸린 시간을 template 별로 집계
+    enabled 가 False 이면 template 저장과 notebook 생성만 하고 DaemonSet 관리와 time-to-ready 집계는 하지 않는다.
+    """
+
+    def __init__(self, api_client: ApiClient, crd_client: CustomObjectsApi, namespace: str, enabled: bool = False,
+                 interval: float = 60.0, ready_poll_seconds: float = 5.0, ready_timeout_seconds: float = 3600.0,
+                 sample_size: int = 100):
+        self.core_client = CoreV1Api(api_client)
+        self.apps_client = AppsV1Api(api_client)
+        self.crd_client = crd_client
+        self.namespace = namespace
+        self.enabled = enabled
+        self.interval = interval
+        self.ready_poll_seconds = ready_poll_seconds
+        self.ready_timeout_seconds = ready_timeout_seconds
+        self.sample_size = sample_size
+        self._lock = threading.Lock()
+        # (namespace, name): (template 이름, 생성 요청 시각)
+        self._pending: Dict[tuple, tuple] = {}
+        self._ready_seconds: Dict[str, deque] = {}
+        self._timed_out: Dict[str, int] = {}
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def warm_pool_name(template_name: str):
+        return f"{NOTEBOOK_WARM_POOL_PREFIX}{template_name}"
+
+    def _read_templates(self) -> Dict[str, NotebookTemplate]:
+        try:
+            config_map = self.core_client.read_namespaced_config_map(TEMPLATE_CONFIG_MAP, self.namespace)
+        except ApiException as e:
+            if e.status == 404:
+                return {}
+            raise
+        templates = {}
+        for name, value in (config_map.data or {}).items():
+            # 직접 수정된 ConfigMap 등 잘못된 항목 때문에 나머지 template 까지 사용할 수 없게 되지 않도록 건너뛴다.
+            try:
+                templates[name] = NotebookTemplate.parse_raw(value)
+            except (ValueError, RequestValidationError) as e:
+                logging.warning(f"Ignoring invalid notebook template {name}: {e}")
+        return templates
+
+    def _write_template(self, name: str, value: Optional[str]):
+        # value 가 None 이면 strategic merge patch 로 해당 key 를 삭제한다.
+        body = {"data": {name: value}}
+        try:
+            self.core_client.patch_namespaced_config_map(TEMPLATE_CONFIG_MAP, self.namespace, body)
+        except ApiException as e:
+            if e.status != 404 or value is None:
+                raise
+            self.core_client.create_namespaced_config_map(self.namespace, {
+                "metadata": {"name": TEMPLATE_CONFIG_MAP, "labels": MANAGED_BY_LABELS},
+                "data": {name: value},
+            })
+
+    def get_template(self, name: str) -> NotebookTemplate:
+        try:
+            template = self._read_templates().get(name)
+        except ApiException as e:
+            raise KubernetesApiError(e)
+        if template is None:
+            raise NotebookTemplateNotFoundError(name)
+        return template
+
+    def get_templates(self):
+        try:
+            templates = self._read_templates()
+            pools = self._list_warm_pools()
+        except ApiException as e:
+            raise KubernetesApiError(e)
+        return [dict(template.dict(), warm_pool_status=self._to_warm_pool_status(pools.get(name)),
+                     time_to_ready=self._to_time_to_ready(name))
+                for name, template in sorted(templates.items())]
+
+    def put_template(self, template: NotebookTemplate):
+        try:
+            self._write_template(template.name, template.json())
+            if self.enabled:
+                self._reconcile_template(template, self._list_warm_pools().get(template.name))
+        except ApiException as e:
+            raise KubernetesApiError(e)
+        return template.dict()
+
+    def delete_template(self, name: str):
+        self.get_template(name)
+        try:
+            self._write_template(name, None)
+            if self.enabled:
+                self._delete_warm_pool(name)
+        except ApiException as e:
+            raise KubernetesApiError(e)
+        return None
+
+    def create_notebook(self, namespace: str, template_name: str, request: NotebookFromTemplate):
+        template = self.get_template(template_name)
+        try:
+            result = self.crd_client.create_namespaced_custom_object(
+                group="kubeflow.org", version="v1alpha1",
+                plural="notebooks",
+                namespace=namespace,
+                body=ResourceFactory.build_template_notebook(template, request)
+            )
+        except ApiException as e:
+            raise KubernetesApiError(e)
+        if self.enabled:
+            with self._lock:
+                self._pending[(namespace, request.metadata.name)] = (template_name, time.time())
+        return render(result, Render.to_no_content)
+
+    def _list_warm_pools(self):
+        selector = ",".join(f"{key}={value}" for key, value in MANAGED_BY_LABELS.items())
+        items = self.apps_client.list_namespaced_daemon_set(self.namespace, label_selector=selector).items
+        return {item.metadata.labels.get(TEMPLATE_LABEL): item for item in items}
+
+    @staticmethod
+    def _to_warm_pool_status(daemon_set):
+        if daemon_set is None:
+            return None
+        status = daemon_set.status
+        return {
+            "name": daemon_set.metadata.name,
+            "desired": status.desired_number_scheduled if status else 0,
+            "ready": (status.number_ready or 0) if status else 0,
+        }
+
+    def _delete_warm_pool(self, template_name: str):
+        try:
+            self.apps_client.delete_namespaced_daemon_set(self.warm_pool_name(template_name), self.namespace)
+        except ApiException as e:
+            if e.status != 404:
+                raise
+
+    def _reconcile_template(self, template: NotebookTemplate, daemon_set):
+        if not template.warm_pool:
+            if daemon_set is not None:
+                self._delete_warm_pool(template.name)
+            return
+        template_hash = _template_hash(template)
+        current_hash = (daemon_set.metadata.annotations or {}).get(TEMPLATE_HASH_ANNOTATION) if daemon_set else None
+        if current_hash == template_hash:
+            return
+        name = self.warm_pool_name(template.name)
+        body = ResourceFactory.build_warm_pool_daemonset(name, template, dict(MANAGED_BY_LABELS, **{
+            TEMPLATE_LABEL: template.name
+        }))
+        body.metadata.annotations = {TEMPLATE_HASH_ANNOTATION: template_hash}
+        if daemon_set is None:
+            self.apps_client.create_namespaced_daemon_set(self.namespace, body)
+        else:
+            self.apps_client.replace_namespaced_daemon_set(name, self.namespace, body)
+
+    def reconcile(self):
+        """template 별 warm pool DaemonSet 을 만들거나 갱신하고, template 이 없는 DaemonSet 은 삭제한다."""
+        templates = self._read_templates()
+        pools = self._list_warm_pools()
+        # 한 template 의 실패가 다른 template 과 남은 DaemonSet 정리를 막지 않도록 항목별로 처리
+        for name, template in templates.items():
+            try:
+                self._reconcile_template(template, pools.get(name))
+            except ApiException as e:
+                logging.warning(f"Notebook warm pool for template {name} failed: {e.status} {e.reason}")
+        for name in pools.keys() - templates.keys():
+            try:
+                self._delete_warm_pool(name)
+            except ApiException as e:
+                logging.warning(f"Orphaned notebook warm pool {name} could not be deleted: {e.status} {e.reason}")
+
+    def check_pending(self):
+        """생성 요청한 notebook 이 ready 상태가 되었는지 확인하여 time-to-ready 를 기록한다."""
+        with self._lock:
+            pending = list(self._pending.items())
+        for (namespace, name), (template_name, started) in pending:
+            elapsed = time.time() - started
+            try:
+                item = self.crd_client.get_namespaced_custom_object(
+                    group="kubeflow.org", version="v1alpha1",
+                    plural="notebooks",
+                    namespace=namespace,
+                    name=name
+                )
+            except ApiException as e:
+                if e.status == 404:
+                    with self._lock:
+                        self._pending.pop((namespace, name), None)
+                continue
+            ready = (item.get('status') or {}).get('readyReplicas', 0) >= 1
+            if not ready and elapsed < self.ready_timeout_seconds:
+                continue
+            with self._lock:
+                self._pending.pop((namespace, name), None)
+                if ready:
+                    self._ready_seconds.setdefault(template_name, deque(maxlen=self.sample_size)).append(elapsed)
+                else:
+                    self._timed_out[template_name] = self._timed_out.get(template_name, 0) + 1
+
+    def _to_time_to_ready(self, template_name: str):
+        with self._lock:
+            samples = list(self._ready_seconds.get(template_name, []))
+            pending = sum(1 for template, _ in self._pending.values() if template == template_name)
+            timed_out = self._timed_out.get(template_name, 0)
+        return {
+            "count": len(samples),
+            "p50_seconds": _percentile(samples, 0.5),
+            "p90_seconds": _percentile(samples, 0.9),
+            "max_seconds": round(max(samples), 1) if samples else None,
+            "pending": pending,
+            "timed_out": timed_out,
+        }
+
+    def _run(self):
+        next_reconcile = 0.0
+        while not self._stop_event.is_set():
+            try:
+                if time.time() >= next_reconcile:
+                    self.reconcile()
+                    next_reconcile = time.time() + self.interval
+                self.check_pending()
+            except Exception as e:
+                logging.warning(f"Notebook warm pool reconcile failed: {e}")
+                next_reconcile = time.time() + self.interval
+            self._stop_event.wait(timeout=self.ready_poll_seconds)
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="notebook-warm-pool", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
@@ -0,0 +1,221 @@
+import asyncio
+import functools
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+
+from src.kubernetes_module.utils import load_json
+
+
+def _resource_version_of(item: dict):
+    return item['metadata'].get('resourceVersion')
+
+
+def _is_newer(resource_version: str, than: str):
+    try:
+        return int(resource_version) > int(than)
+    except (TypeError, ValueError):
+        return False
+
+
+class EventStream:
+    """
+    하나의 (kind, namespace) 에 대한 upstream watch 를 유지하고 이벤트를 모든 구독자 queue 로 전달한다.
+    - 현재 객체와 최근 이벤트(history)를 보관하여 새 구독자에게 현재 상태 또는 resourceVersion 이후 이벤트를 재전송
+    - watch 가 끊기거나 410 Gone 이면 다시 list 하여 바뀐 부분만 ADDED / MODIFIED / DELETED 로 전달
+    - 구독자가 없는 상태가 idle_seconds 동안 지속되면 upstream watch 를 종료
+    """
+
+    def __init__(self, hub: 'EventHub', kind: str, namespace: str, list_func: Callable):
+        self.hub = hub
+        self.kind = kind
+        self.namespace = namespace
+        self.list_func = list_func
+        self.resource_version = None
+        self.subscribers = set()
+        self.event_count = 0
+        self._objects: Dict[str, dict] = {}
+        self._history = deque(maxlen=hub.history_size)
+        self._idle_since = time.time()
+        self._thread = threading.Thread(target=self._run, name=f"event-stream-{kind}-{namespace}", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def snapshot(self, resource_version: Optional[str] = None):
+        """구독 시작 시 전달할 이벤트 목록. hub lock 안에서 호출된다."""
+        if resource_version and self._history and (
+                resource_version == self._history[0][0] or _is_newer(resource_version, self._history[0][0])):
+            return [event for version, event in self._history if _is_newer(version, resource_version)]
+        events = [{"type": "ADDED", "object": item} for item in self._objects.values()]
+        if resource_version:
+            # 요청한 resourceVersion 이 history 보다 오래되면 클라이언트가 상태를 비우도록 알린다.
+            events.insert(0, {"type": "RESYNC", "object": None})
+        return events
+
+    def _publish(self, event_type: str, item: dict):
+        event = {"type": event_type, "object": item}
+        with self.hub.lock:
+            name = item['metadata']['name']
+            if event_type == 'DELETED':
+                self._objects.pop(name, None)
+            else:
+                self._objects[name] = item
+            self.resource_version = _resource_version_of(item)
+            self._history.append((self.resource_version, event))
+            subscribers = list(self.subscribers)
+        self.event_count += 1
+        for subscriber in subscribers:
+            subscriber.put(event)
+
+    def _list(self):
+        result = load_json(self.list_func(namespace=self.namespace, _preload_content=False).data)
+        items = {item['metadata']['name']: item for item in result.get('items') or []}
+        for name, item in items.items():
+            current = self._objects.get(name)
+            if current is None:
+                self._publish('ADDED', item)
+            elif _resource_version_of(current) != _resource_version_of(item):
+                self._publish('MODIFIED', item)
+        for name, item in list(self._objects.items()):
+            if name not in items:
+                self._publish('DELETED', item)
+        self.resource_version = result['metadata'].get('resourceVersion')
+
+    def _watch(self):
+        watcher = watch.Watch()
+        for event in watcher.stream(self.list_func, namespace=self.namespace,
+                                    resource_version=self.resource_version,
+                                    allow_watch_bookmarks=True,
+                                    timeout_seconds=self.hub.watch_timeout_seconds):
+            if event['type'] == 'ERROR':
+                raw_object = event.get('raw_object') or {}
+                raise ApiException(status=raw_object.get('code'), reason=raw_object.get('message'))
+            if event['type'] == 'BOOKMARK':
+                self.resource_version = _resource_version_of(event['object'])
+            else:
+                self._publish(event['type'], event['object'])
+            if self._should_stop():
+                watcher.stop()
+                return
+
+    def _should_stop(self):
+        with self.hub.lock:
+            if self.subscribers and not self.hub.stopped:
+                self._idle_since = time.time()
+                return False
+            if time.time() - self._idle_since < self.hub.idle_seconds and not self.hub.stopped:
+                return False
+            self.hub.streams.pop((self.kind, self.namespace), None)
+            return True
+
+    def _run(self):
+        while not self._should_stop():
+            try:
+                if self.resource_version is None:
+                    self._list()
+                self._watch()
+            except ApiException as e:
+                if e.status != 410:
+                    logging.warning(f"{self.kind} event stream for {self.namespace} failed: {e.status} {e.reason}")
+                    time.sleep(self.hub.retry_seconds)
+                self.resource_version = None
+            except Exception as e:
+                logging.warning(f"{self.kind} event stream for {self.namespace} failed: {e}")
+                self.resource_version = None
+                time.sleep(self.hub.retry_seconds)
+
+
+class Subscriber:
+    def __init__(self, queue_size: int):
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.resyncing = False
+
+    def _put(self, event: dict):
+        if self.resyncing:
+            # RESYNC 뒤에 보낼 현재 상태 snapshot 에 이미 반영되어 있다.
+            return
+        if self.queue.full():
+            # 느린 구독자는 밀린 이벤트를 버리고 RESYNC 와 현재 상태로 다시 동기화하도록 한다.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.resyncing = True
+            event = {"type": "RESYNC", "object": None}
+        self.queue.put_nowait(event)
+
+    def put(self, event: dict):
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # 이벤트 루프가 이미 종료된 경우
+            pass
+
+
+class EventHub:
+    """
+    (kind, namespace) 별 upstream watch 하나를 여러 SSE / WebSocket 구독자가 공유하도록 관리한다.
+    list_funcs 의 함수는 kubernetes 모델로 역직렬화하지 않도록 functools.partial 로 감싸서 watch 에 전달한다.
+    """
+
+    def __init__(self, list_funcs: Dict[str, Callable], idle_seconds: float = 30.0, history_size: int = 500,
+                 queue_size: int = 256, watch_timeout_seconds: int = 60, retry_seconds: float = 5.0):
+        # watch.Watch 는 함수 docstring 에서 반환 타입을 찾아 역직렬화하므로 partial 로 감싸 dict 그대로 받는다.
+        self.list_funcs = {kind: functools.partial(func) for kind, func in list_funcs.items()}
+        self.idle_seconds = idle_seconds
+        self.history_size = history_size
+        self.queue_size = queue_size
+        self.watch_timeout_seconds = watch_timeout_seconds
+        self.retry_seconds = retry_seconds
+        self.lock = threading.Lock()
+        self.streams: Dict[tuple, EventStream] = {}
+        self.stopped = False
+
+    def supports(self, kind: str):
+        return kind in self.list_funcs
+
+    async def subscribe(self, kind: str, namespace: str, resource_version: Optional[str] = None):
+        """현재 상태(또는 resource_version 이후 이벤트)를 먼저 보내고 이후 이벤트를 계속 전달하는 async generator"""
+        subscriber = Subscriber(self.queue_size)
+        with self.lock:
+            stream = self.streams.get((kind, namespace))
+            created = stream is None
+            if created:
+                stream = EventStream(self, kind, namespace, self.list_funcs[kind])
+                self.streams[(kind, namespace)] = stream
+            backlog = stream.snapshot(resource_version)
+            stream.subscribers.add(subscriber)
+        if created:
+            stream.start()
+        try:
+            for event in backlog:
+                yield event
+            while True:
+                event = await subscriber.queue.get()
+                yield event
+                if subscriber.resyncing and event['type'] == 'RESYNC':
+                    with self.lock:
+                        backlog = stream.snapshot()
+                        subscriber.resyncing = False
+                    for event in backlog:
+                        yield event
+        finally:
+            with self.lock:
+                stream.subscribers.discard(subscriber)
+
+    def stop(self):
+        with self.lock:
+            self.stopped = True
+
+    def get_metrics(self):
+        with self.lock:
+            return {
+                "streams": [{"kind": kind, "namespace": namespace, "subscribers": len(stream.subscribers),
+                             "resource_version": stream.resource_version, "events": stream.event_count}
+                            for (kind, namespace), stream in self.streams.items()],
+            }
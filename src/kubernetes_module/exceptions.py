@@ -1,6 +1,8 @@
 import json
 
+import httpx
 from kubernetes.client import ApiException
+from starlette import status
 
 from src.kubernetes_module.config import MODULE_CODE
 
@@ -26,3 +28,42 @@ class KubernetesApiError(KubernetesException):
         self.code = int(f"{MODULE_CODE}{e.status}")
         self.message = e.reason
         self.result = body['message']
+
+
+class KubernetesHttpError(KubernetesException):
+    def __init__(self, status_code: int, reason: str, body: bytes):
+        self.code = int(f"{MODULE_CODE}{status_code}")
+        self.message = reason
+        try:
+            body = json.loads(body)
+            self.result = body.get('message', body) if isinstance(body, dict) else body
+        except ValueError:
+            self.result = body.decode('utf-8', errors='replace')
+
+
+class KubernetesConnectionError(KubernetesException):
+    def __init__(self, e: httpx.RequestError):
+        self.code = int(f"{MODULE_CODE}{status.HTTP_503_SERVICE_UNAVAILABLE}")
+        self.message = "Kubernetes API server is unavailable"
+        self.result = str(e)
+
+
+class KubernetesUnsupportedKindError(KubernetesException):
+    def __init__(self, kind: str):
+        self.code = int(f"{MODULE_CODE}404")
+        self.message = "Unsupported kind"
+        self.result = kind
+
+
+class NotebookTemplateNotFoundError(KubernetesException):
+    def __init__(self, name: str):
+        self.code = int(f"{MODULE_CODE}404")
+        self.message = "Notebook template not found"
+        self.result = name
+
+
+class RequestValidationError(KubernetesException):
+    def __init__(self, message, result):
+        self.code = int(f"{MODULE_CODE}{status.HTTP_400_BAD_REQUEST}")
+        self.message = message
+        self.result = result
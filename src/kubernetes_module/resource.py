@@ -3,7 +3,13 @@ from kubernetes import client
 from src.kubernetes_module.config import get_nfs_config
 from src.kubernetes_module.schemas import Volume, VolumeClaim, ConfigMap, Secret, \
     Container, ContainerVolume, ContainerVolumeType, \
-    Pod, Deployment, Service, Ingress, Metadata, Notebook
+    Pod, Deployment, Service, Ingress, Metadata, Notebook, NotebookTemplate, NotebookFromTemplate
+
+WARM_POOL_PAUSE_IMAGE = 'registry.k8s.io/pause:3.9'
+# template 이미지에 shell 이 없어도(distroless, scratch) 실행할 수 있도록 정적 링크된 busybox 를 복사해서 사용
+WARM_POOL_NOOP_IMAGE = 'busybox:1.36-musl'
+WARM_POOL_NOOP_PATH = '/warm-pool'
+WARM_POOL_RESOURCES = {'cpu': '10m', 'memory': '16Mi'}
 
 
 class ResourceFactory:
@@ -214,3 +220,78 @@ class ResourceFactory:
                 "template": ResourceFactory.build_pod(notebook.template_pod)
             }
         }
+
+    @staticmethod
+    def build_template_notebook(template: NotebookTemplate, request: NotebookFromTemplate):
+        metadata = request.metadata.copy(deep=True)
+        metadata.labels = dict(metadata.labels or {}, **{"notebook-template": template.name})
+        metadata.annotations = metadata.annotations or {}
+        return ResourceFactory.build_notebook(Notebook(
+            metadata=metadata,
+            template_pod=Pod(
+                metadata=Metadata(name=metadata.name),
+                containers=[Container(
+                    name=metadata.name,
+                    image=template.image,
+                    image_pull_policy=template.image_pull_policy,
+                    env=dict(template.env, **request.env),
+                    volume_mounts=template.volume_mounts + request.volume_mounts,
+                    cpu=template.cpu,
+                    memory=template.memory,
+                    gpu=template.gpu
+                )],
+                image_pull_secrets=template.image_pull_secrets,
+                volumes=template.volumes + request.volumes
+            )
+        ))
+
+    @staticmethod
+    def build_warm_pool_daemonset(name: str, template: NotebookTemplate, labels: dict):
+        """
+        template 이미지를 노드에 미리 받아두는 DaemonSet.
+        init container 로 이미지를 pull 하고 종료한 뒤 pause container 만 남겨 노드 자원을 거의 사용하지 않는다.
+        pull 용 init container 는 template 이미지의 shell 대신 emptyDir 로 복사한 정적 busybox 의 true 를 실행한다.
+        """
+        noop_mount = client.V1VolumeMount(name="warm-pool-noop", mount_path=WARM_POOL_NOOP_PATH)
+        tolerations = None
+        if template.gpu not in ('0', ''):
+            tolerations = [client.V1Toleration(key='nvidia.com/gpu', operator='Exists', effect='NoSchedule')]
+        return client.V1DaemonSet(
+            metadata=client.V1ObjectMeta(name=name, labels=labels),
+            spec=client.V1DaemonSetSpec(
+                selector=client.V1LabelSelector(match_labels={"app": name}),
+                template=client.V1PodTemplateSpec(
+                    metadata=client.V1ObjectMeta(labels=dict(labels, app=name),
+                                                 annotations={"sidecar.istio.io/inject": "false"}),
+                    spec=client.V1PodSpec(
+                        init_containers=[client.V1Container(
+                            name="install-noop",
+                            image=WARM_POOL_NOOP_IMAGE,
+                            image_pull_policy='IfNotPresent',
+                            command=["cp", "/bin/busybox", f"{WARM_POOL_NOOP_PATH}/busybox"],
+                            volume_mounts=[noop_mount],
+                            resources=client.V1ResourceRequirements(requests=WARM_POOL_RESOURCES,
+                                                                    limits=WARM_POOL_RESOURCES)
+                        ), client.V1Container(
+                            name="pre-pull",
+                            image=template.image,
+                            image_pull_policy='IfNotPresent',
+                            command=[f"{WARM_POOL_NOOP_PATH}/busybox", "true"],
+                            volume_mounts=[noop_mount],
+                            resources=client.V1ResourceRequirements(requests=WARM_POOL_RESOURCES,
+                                                                    limits=WARM_POOL_RESOURCES)
+                        )],
+                        containers=[client.V1Container(
+                            name="pause",
+                            image=WARM_POOL_PAUSE_IMAGE,
+                            resources=client.V1ResourceRequirements(requests=WARM_POOL_RESOURCES,
+                                                                    limits=WARM_POOL_RESOURCES)
+                        )],
+                        volumes=[client.V1Volume(name="warm-pool-noop", empty_dir=client.V1EmptyDirVolumeSource())],
+                        image_pull_secrets=ResourceFactory.build_image_pull_secrets(template.image_pull_secrets),
+                        node_selector=template.node_selector,
+                        tolerations=tolerations
+                    )
+                )
+            )
+        )
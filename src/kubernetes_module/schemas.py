@@ -1,9 +1,17 @@
+import re
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, validator
 from pydantic.schema import datetime
 
+from src.kubernetes_module.exceptions import RequestValidationError
+
+DNS_1123_LABEL = re.compile(r'^[a-z0-9]([-a-z0-9]*[a-z0-9])?$')
+NOTEBOOK_WARM_POOL_PREFIX = "notebook-warm-pool-"
+# warm pool 접두사를 붙여도 63자를 넘지 않도록 제한
+NOTEBOOK_TEMPLATE_NAME_MAX_LENGTH = 63 - len(NOTEBOOK_WARM_POOL_PREFIX)
+
 
 class Metadata(BaseModel):
     name: str
@@ -124,6 +132,52 @@ class Ingress(BaseModel):
     rules: List[IngressRule]
 
 
+class BulkApply(BaseModel):
+    config_maps: List[ConfigMap] = []
+    secrets: List[Secret] = []
+    volume_claims: List[VolumeClaim] = []
+    deployments: List[Deployment] = []
+    services: List[Service] = []
+    ingresses: List[Ingress] = []
+    field_manager: str = 'mlops-api'
+    dry_run: bool = False
+    stop_on_error: bool = True
+    max_workers: int = 8
+
+
 class Notebook(BaseModel):
     metadata: Metadata
     template_pod: Pod
+
+
+class NotebookTemplate(BaseModel):
+    name: str
+    image: str
+    image_pull_policy: str = 'IfNotPresent'
+    image_pull_secrets: Optional[List[str]] = None
+    cpu: str = '0.5'
+    memory: str = '1Gi'
+    gpu: str = '0'
+    env: dict = {}
+    volumes: List[ContainerVolume] = []
+    volume_mounts: List[ContainerVolumeMounts] = []
+    node_selector: Optional[dict] = None
+    warm_pool: bool = True
+
+    @validator('name')
+    def validate_name(cls, v):
+        # ConfigMap key 와 warm pool DaemonSet 이름(notebook-warm-pool-{name}, label 값 63자 제한)에 사용된다.
+        if len(v) > NOTEBOOK_TEMPLATE_NAME_MAX_LENGTH or not DNS_1123_LABEL.match(v):
+            raise RequestValidationError(
+                message=f"Template name must be a DNS-1123 label of at most {NOTEBOOK_TEMPLATE_NAME_MAX_LENGTH} "
+                        f"characters (lowercase alphanumerics and '-').",
+                result={"current_name": v}
+            )
+        return v
+
+
+class NotebookFromTemplate(BaseModel):
+    metadata: Metadata
+    env: dict = {}
+    volumes: List[ContainerVolume] = []
+    volume_mounts: List[ContainerVolumeMounts] = []
@@ -1,20 +1,51 @@
 import base64
+import json
+import re
+from typing import Optional
 
 import yaml
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.kubernetes_module.config import get_cluster_host
 
+# libyaml 이 설치되어 있으면 C 구현 Dumper 사용
+YamlDumper = getattr(yaml, 'CDumper', yaml.Dumper)
+
+_ENTITY_TAG = re.compile(r'(?:W/)?("[^"]*")')
+
 
 def render(model, shape_callable: callable):
     return shape_callable(model)
 
 
+def load_json(data: bytes):
+    # orjson 이 설치되어 있으면 표준 json 보다 빠르게 디코딩
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str):
+    """If-None-Match 헤더(*, 여러 ETag, W/ weak ETag)를 RFC 9110 의 weak comparison 으로 비교한다."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    opaque_tag = _ENTITY_TAG.fullmatch(etag.strip())
+    opaque_tag = opaque_tag.group(1) if opaque_tag else etag
+    return opaque_tag in _ENTITY_TAG.findall(if_none_match)
+
+
 def encode_to_base64(dict_data: dict):
     return {key: base64.b64encode(value.encode('utf-8')).decode('utf-8') for key, value in dict_data.items()}
 
 
 def to_yaml(item: dict):
-    return yaml.dump(item).split('\n')
+    return yaml.dump(item, Dumper=YamlDumper).split('\n')
 
 
 def get_connect_uri(namespace: str, name: str):
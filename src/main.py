@@ -16,10 +16,14 @@ from uvicorn import Config, Server
 from src import app_config
 from src.common_module import router as common_router
 from src.exceptions import MLOpsAPIException
+from src.kfp_module import kfp_service, kfp_async_service, kfp_run_watcher
 from src.kfp_module import router as kfp_router
 from src.kfp_module.exceptions import KFPException
 from src.kserve_module import router as kserve_router
 from src.kserve_module.exceptions import KServeException
+from src.kubernetes_module import cluster_service, resource_usage, event_hub, notebook_culler, \
+    notebook_culling_enabled, notebook_templates, usage_collector_enabled
+from src.kubernetes_module.client import ClientFactory
 from src.kubernetes_module.cluster import router as cluster_router
 from src.kubernetes_module.crds import router as crd_router
 from src.kubernetes_module.exceptions import KubernetesException
@@ -90,8 +94,26 @@ async def lifespan(lifespan_app: FastAPI):
     # logging.info("Check env exist ...")
     # check_env_exist()
     write_version_py()
+    kfp_service.start_token_refresher()
+    kfp_run_watcher.start()
+    if usage_collector_enabled:
+        resource_usage.start()
+    if notebook_culling_enabled:
+        notebook_culler.start()
+    if notebook_templates.enabled:
+        notebook_templates.start()
     yield
     # shutdown event
+    await kfp_run_watcher.stop()
+    await kfp_async_service.close()
+    kfp_service.stop_token_refresher()
+    event_hub.stop()
+    notebook_culler.stop()
+    notebook_templates.stop()
+    resource_usage.stop()
+    if cluster_service.watch_cache is not None:
+        cluster_service.watch_cache.stop()
+    await ClientFactory.close_async_http_client()
     logging.info("Shut down Python FastAPI Template")
 
 
@@ -16,3 +16,15 @@ class Pipeline(Base):
     zoom = Column(Integer)
     created_at = Column(DateTime)
     updated_at = Column(DateTime)
+
+
+class PipelinePackage(Base):
+    __tablename__ = "pipeline_package"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    package_hash = Column(String, index=True)
+    resource_type = Column(String, index=True)
+    target = Column(String)
+    pipeline_id = Column(String, index=True)
+    pipeline_version_id = Column(String, index=True)
+    result = Column(JSON)
+    created_at = Column(DateTime)
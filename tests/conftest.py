@@ -0,0 +1,29 @@
+import os
+import tempfile
+
+from src import app_config
+
+# 모듈 import 시 kubeconfig 를 읽으므로 테스트에서는 접속하지 않는 임시 kubeconfig 를 사용
+KUBE_CONFIG = """
+apiVersion: v1
+kind: Config
+clusters:
+- name: test
+  cluster:
+    server: https://127.0.0.1:6443
+contexts:
+- name: test
+  context:
+    cluster: test
+    user: test
+current-context: test
+users:
+- name: test
+  user:
+    token: test-token
+"""
+
+_kube_config_file = os.path.join(tempfile.mkdtemp(), 'kubeconfig')
+with open(_kube_config_file, 'w') as f:
+    f.write(KUBE_CONFIG)
+app_config.CLUSTER_KUBE_CONFIG_PATH = _kube_config_file
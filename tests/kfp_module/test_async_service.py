@@ -0,0 +1,59 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from src.kfp_module.async_service import AsyncKfpService
+from src.kfp_module.exceptions import KFPHttpError
+
+
+def service_with(handler):
+    token_manager = SimpleNamespace(needs_refresh=lambda: False, get_token=lambda: "token")
+    service = AsyncKfpService(SimpleNamespace(host="http://kfp", namespace="user", token_manager=token_manager))
+    service._http_client = httpx.AsyncClient(base_url="http://kfp", transport=httpx.MockTransport(handler))
+    return service
+
+
+def paged_handler(pages: dict):
+    def handler(request: httpx.Request):
+        response = pages[request.url.params.get("page_token", "")]
+        return response if isinstance(response, httpx.Response) else httpx.Response(200, json=response)
+    return handler
+
+
+async def collect(service: AsyncKfpService):
+    items = await service.iter_all("/runs", "runs", page_size=2)
+    return [item["id"] async for item in items]
+
+
+def test_iter_all_follows_page_tokens():
+    service = service_with(paged_handler({
+        "": {"runs": [{"id": 1}, {"id": 2}], "next_page_token": "b"},
+        "b": {"runs": [{"id": 3}]},
+    }))
+    assert asyncio.run(collect(service)) == [1, 2, 3]
+
+
+def test_iter_all_raises_first_page_error_before_iterating():
+    service = service_with(paged_handler({"": httpx.Response(403, json={"message": "denied"})}))
+    with pytest.raises(KFPHttpError) as e:
+        asyncio.run(service.iter_all("/runs", "runs"))
+    assert e.value.result == "denied"
+
+
+def test_iter_all_raises_later_page_error_after_yielding_earlier_items():
+    service = service_with(paged_handler({
+        "": {"runs": [{"id": 1}], "next_page_token": "b"},
+        "b": httpx.Response(500, text="upstream failed"),
+    }))
+    received = []
+
+    async def run():
+        items = await service.iter_all("/runs", "runs")
+        async for item in items:
+            received.append(item["id"])
+
+    with pytest.raises(KFPHttpError):
+        asyncio.run(run())
+    assert received == [1]
@@ -0,0 +1,29 @@
+from src.kfp_module.cache import KfpListCache
+
+
+def test_get_returns_a_copy_of_the_cached_value():
+    cache = KfpListCache()
+    value = {"runs": [{"id": "a"}]}
+    cache.set(("runs", "user"), value)
+    value["runs"].append({"id": "b"})
+    cache.get(("runs", "user"))["runs"].clear()
+    assert cache.get(("runs", "user")) == {"runs": [{"id": "a"}]}
+
+
+def test_set_skips_results_loaded_before_invalidation():
+    cache = KfpListCache()
+    generation = cache.generation("runs")
+    cache.invalidate("runs")
+    cache.set(("runs", "user"), {"runs": []}, generation)
+    assert cache.get(("runs", "user")) is None
+
+
+def test_expired_and_evicted_entries_are_misses():
+    cache = KfpListCache(ttl_seconds=0)
+    cache.set(("runs", "user"), {})
+    assert cache.get(("runs", "user")) is None
+    cache = KfpListCache(max_size=1)
+    cache.set(("runs", "a"), {})
+    cache.set(("runs", "b"), {})
+    assert cache.get(("runs", "a")) is None and cache.get(("runs", "b")) == {}
+    assert cache.get_metrics()["evictions"] == 1
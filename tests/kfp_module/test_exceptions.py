@@ -0,0 +1,18 @@
+import httpx
+import pytest
+
+from src.kfp_module.exceptions import KFPHttpError
+
+
+@pytest.mark.parametrize("response, result", [
+    (httpx.Response(404, json={"error": "not found", "message": "Run abc not found"}), "Run abc not found"),
+    (httpx.Response(500, json={"error": "internal"}), '{"error": "internal"}'),
+    (httpx.Response(502, json=["upstream", "failed"]), '["upstream", "failed"]'),
+    (httpx.Response(503, json="unavailable"), '"unavailable"'),
+    (httpx.Response(403, text="RBAC: access denied"), "RBAC: access denied"),
+])
+def test_kfp_http_error_accepts_any_body(response, result):
+    error = KFPHttpError(response)
+    assert error.code == int(f"101{response.status_code}")
+    assert error.message == response.reason_phrase
+    assert error.result == result
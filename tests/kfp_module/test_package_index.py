@@ -0,0 +1,50 @@
+import hashlib
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.kfp_module.package_index import PipelinePackageIndex
+from src.workflow_pipeline_module import models
+
+
+def create_index():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    models.Base.metadata.create_all(bind=engine)
+    return PipelinePackageIndex(session_factory=sessionmaker(bind=engine), chunk_size=4)
+
+
+def test_hash_package_reads_in_chunks(tmp_path):
+    package = tmp_path / "pipeline.yaml"
+    package.write_bytes(b"pipelineSpec: {}\n")
+    index = create_index()
+    assert index.hash_package(str(package)) == hashlib.sha256(b"pipelineSpec: {}\n").hexdigest()
+
+
+def test_find_matches_hash_type_and_target():
+    index = create_index()
+    target = PipelinePackageIndex.target_of("train")
+    index.save("hash", PipelinePackageIndex.PIPELINE, {"pipeline_id": "p1"}, target)
+
+    assert index.find("hash", PipelinePackageIndex.PIPELINE, target)["pipeline_id"] == "p1"
+    # 같은 패키지라도 이름이 다르면 새로 업로드해야 한다.
+    assert index.find("hash", PipelinePackageIndex.PIPELINE, PipelinePackageIndex.target_of("other")) is None
+    assert index.find("hash", PipelinePackageIndex.PIPELINE_VERSION, target) is None
+    assert index.get_metrics() == {"hits": 1, "misses": 2}
+
+
+def test_version_target_includes_version_name():
+    assert PipelinePackageIndex.target_of("p1", "v1") != PipelinePackageIndex.target_of("p1", "v2")
+    # 구분자가 이름에 포함되어도 서로 다른 key 가 되어야 한다.
+    assert PipelinePackageIndex.target_of("a/b", "c") != PipelinePackageIndex.target_of("a", "b/c")
+
+
+def test_remove_by_pipeline_or_version():
+    index = create_index()
+    index.save("h1", PipelinePackageIndex.PIPELINE_VERSION, {"pipeline_id": "p", "pipeline_version_id": "v1"}, "t1")
+    index.save("h2", PipelinePackageIndex.PIPELINE_VERSION, {"pipeline_id": "p", "pipeline_version_id": "v2"}, "t2")
+    index.remove("p", "v1")
+    assert index.find("h1", PipelinePackageIndex.PIPELINE_VERSION, "t1") is None
+    assert index.find("h2", PipelinePackageIndex.PIPELINE_VERSION, "t2") is not None
+    index.remove("p")
+    assert index.find("h2", PipelinePackageIndex.PIPELINE_VERSION, "t2") is None
@@ -0,0 +1,47 @@
+import pytest
+
+from src import app_config
+from src.kfp_module.exceptions import RequestValidationError
+from src.kfp_module.schemas import Run, RunBatch
+from src.kfp_module.service import KfpService
+
+
+def test_expand_runs_returns_explicit_runs():
+    runs = [Run(experiment_id="e", job_name="a"), Run(experiment_id="e", job_name="b")]
+    assert KfpService.expand_runs(RunBatch(runs=runs)) == runs
+
+
+def test_expand_runs_expands_parameter_grid_over_template_params():
+    batch = RunBatch(run_template=Run(experiment_id="e", job_name="train", params={"epochs": 5, "lr": 0.1}),
+                     parameter_grid={"lr": [0.1, 0.01], "batch": [32, 64]})
+    runs = KfpService.expand_runs(batch)
+    assert [run.job_name for run in runs] == [f"train_{index}" for index in range(4)]
+    assert [run.params for run in runs] == [
+        {"epochs": 5, "lr": 0.1, "batch": 32},
+        {"epochs": 5, "lr": 0.1, "batch": 64},
+        {"epochs": 5, "lr": 0.01, "batch": 32},
+        {"epochs": 5, "lr": 0.01, "batch": 64},
+    ]
+    assert batch.run_template.params == {"epochs": 5, "lr": 0.1}
+
+
+def test_run_batch_requires_runs_or_parameter_grid():
+    with pytest.raises(RequestValidationError):
+        RunBatch(run_template=Run(experiment_id="e", job_name="train"))
+
+
+def test_run_batch_rejects_runs_combined_with_parameter_grid():
+    with pytest.raises(RequestValidationError):
+        RunBatch(runs=[Run(experiment_id="e", job_name="a")],
+                 run_template=Run(experiment_id="e", job_name="train"), parameter_grid={"lr": [0.1]})
+
+
+def test_run_batch_rejects_grids_over_the_run_limit(monkeypatch):
+    monkeypatch.setattr(app_config, "KUBEFLOW_PIPELINES_MAX_BATCH_RUNS", 4)
+    template = Run(experiment_id="e", job_name="train")
+    assert len(KfpService.expand_runs(RunBatch(run_template=template,
+                                               parameter_grid={"lr": [0.1, 0.01], "batch": [32, 64]}))) == 4
+    with pytest.raises(RequestValidationError):
+        RunBatch(run_template=template, parameter_grid={"lr": [0.1, 0.01, 0.001], "batch": [32, 64]})
+    with pytest.raises(RequestValidationError):
+        RunBatch(runs=[Run(experiment_id="e", job_name=str(index)) for index in range(5)])
@@ -0,0 +1,84 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.kfp_module.exceptions import KFPConnectionError, KFPHttpError
+from src.kfp_module.run_watcher import RunWatcher
+
+
+class FlakyKfpService:
+    def __init__(self, error: Exception):
+        self.error = error
+        self.get_run_calls = 0
+
+    async def get_run(self, run_id: str):
+        self.get_run_calls += 1
+        raise self.error
+
+    async def list_runs_by_ids(self, run_ids: list):
+        return [{"run_id": run_id, "state": "SUCCEEDED"} for run_id in run_ids]
+
+
+def test_wait_retries_failed_first_fetch_in_poll():
+    service = FlakyKfpService(KFPConnectionError(httpx.ConnectError("refused")))
+
+    async def run():
+        watcher = RunWatcher(service, interval=0.01)
+        watcher.start()
+        try:
+            return await asyncio.gather(watcher.wait("run-1", timeout=1), watcher.wait("run-1", timeout=1))
+        finally:
+            await watcher.stop()
+
+    first, joined = asyncio.run(run())
+    assert first == joined == {"run_id": "run-1", "state": "SUCCEEDED"}
+    assert service.get_run_calls == 1
+
+
+def test_wait_raises_when_run_does_not_exist():
+    service = FlakyKfpService(KFPHttpError(httpx.Response(404, json={"message": "run not found"})))
+
+    async def run():
+        watcher = RunWatcher(service, interval=0.01)
+        return await watcher.wait("missing", timeout=1)
+
+    with pytest.raises(KFPHttpError):
+        asyncio.run(run())
+
+
+class ProgressingKfpService:
+    def __init__(self, states: list):
+        self.states = states
+
+    async def get_run(self, run_id: str):
+        return {"run_id": run_id, "state": self.states[0]}
+
+    async def list_runs_by_ids(self, run_ids: list):
+        state = self.states.pop(0) if len(self.states) > 1 else self.states[0]
+        return [{"run_id": run_id, "state": state} for run_id in run_ids]
+
+
+def test_subscribe_yields_state_changes_until_terminal():
+    service = ProgressingKfpService(["PENDING", "RUNNING", "RUNNING", "SUCCEEDED"])
+
+    async def run():
+        watcher = RunWatcher(service, interval=0.01)
+        watcher.start()
+        try:
+            return [run["state"] async for run in await watcher.subscribe("run-1")]
+        finally:
+            await watcher.stop()
+
+    assert asyncio.run(run()) == ["PENDING", "RUNNING", "SUCCEEDED"]
+
+
+def test_subscribe_raises_before_streaming_when_run_does_not_exist():
+    service = FlakyKfpService(KFPHttpError(httpx.Response(404, json={"message": "run not found"})))
+
+    async def run():
+        watcher = RunWatcher(service, interval=0.01)
+        await watcher.subscribe("missing")
+
+    with pytest.raises(KFPHttpError):
+        asyncio.run(run())
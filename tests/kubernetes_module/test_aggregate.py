@@ -0,0 +1,57 @@
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+
+from src.kubernetes_module.aggregate import list_across_namespaces, to_aggregated_list
+from src.kubernetes_module.cluster.render import Render, RawRender
+
+
+def pod(namespace: str, name: str):
+    return {"metadata": {"namespace": namespace, "name": name}}
+
+
+def test_list_all_groups_by_namespace():
+    result = list_across_namespaces(
+        list_all=lambda: [pod("a", "p1"), pod("b", "p2"), pod("a", "p3")],
+        list_namespaced=None,
+        get_namespaces=None,
+        namespace_of=lambda item: item['metadata']['namespace'],
+    )
+    assert result["source"] == "all_namespaces"
+    assert {namespace: [item['metadata']['name'] for item in listing["items"]]
+            for namespace, listing in result["namespaces"].items()} == {"a": ["p1", "p3"], "b": ["p2"]}
+
+
+def test_fan_out_on_forbidden_records_per_namespace_errors():
+    def list_all():
+        raise ApiException(status=403, reason="Forbidden")
+
+    def list_namespaced(namespace: str):
+        if namespace == "locked":
+            raise ApiException(status=403, reason="Forbidden")
+        return [pod(namespace, "p")]
+
+    result = list_across_namespaces(list_all, list_namespaced, get_namespaces=lambda: ["a", "locked"],
+                                    namespace_of=lambda item: item['metadata']['namespace'])
+    assert result["source"] == "fan_out"
+    aggregated = to_aggregated_list(result, lambda item: {"name": item['metadata']['name']})
+    assert aggregated["items"] == [{"name": "p", "namespace": "a"}]
+    assert [(item["namespace"], item["count"], item["error"]) for item in aggregated["namespaces"]] == [
+        ("a", 1, None), ("locked", 0, "(403) Forbidden")]
+
+
+def test_pending_pod_status():
+    raw = {"metadata": {"name": "p", "creationTimestamp": "2023-01-01T00:00:00Z"},
+           "spec": {"containers": [{"name": "app"}]}, "status": {"phase": "Pending"}}
+    assert RawRender.to_pod_status(raw)["ready"] == "0/0"
+    assert RawRender.to_pod_status(raw)["restarts"] == 0
+
+    model = client.V1Pod(metadata=client.V1ObjectMeta(name="p"),
+                         spec=client.V1PodSpec(containers=[client.V1Container(name="app")]),
+                         status=client.V1PodStatus(phase="Pending"))
+    assert Render.to_pod_status(model)["ready"] == "0/0"
+    assert Render.to_pod_status(model)["restarts"] == 0
+
+
+def test_unbound_volume_claim_status():
+    raw = {"metadata": {"name": "claim"}, "spec": {"accessModes": ["ReadWriteOnce"]}, "status": {"phase": "Pending"}}
+    assert RawRender.to_volume_claim_status(raw)["capacity"] is None
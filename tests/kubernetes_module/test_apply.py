@@ -0,0 +1,59 @@
+from kubernetes import client
+
+from src.kubernetes_module import cluster_service
+from src.kubernetes_module.apply import diff_fields, to_apply_body
+from src.kubernetes_module.schemas import Metadata, Secret
+
+
+def test_diff_fields_ignores_server_defaults():
+    desired = {"spec": {"replicas": 1, "template": {"spec": {"containers": [
+        {"name": "app", "image": "nginx:1.25", "ports": [{"containerPort": 80}]}
+    ]}}}}
+    live = {"metadata": {"resourceVersion": "10"}, "spec": {"replicas": 1, "template": {"spec": {"containers": [
+        {"name": "app", "image": "nginx:1.25", "imagePullPolicy": "IfNotPresent",
+         "terminationMessagePath": "/dev/termination-log", "ports": [{"containerPort": 80, "protocol": "TCP"}]}
+    ]}}}}
+    assert diff_fields(desired, live) == []
+
+
+def test_diff_fields_matches_list_items_by_name():
+    desired = {"containers": [{"name": "b", "image": "b:2"}, {"name": "a", "image": "a:1"}]}
+    live = {"containers": [{"name": "a", "image": "a:1"}, {"name": "b", "image": "b:1"}]}
+    assert diff_fields(desired, live) == ["containers[b].image"]
+
+
+def test_diff_fields_reports_added_or_removed_items():
+    assert diff_fields({"ports": [{"port": 80}, {"port": 443}]}, {"ports": [{"port": 80}]}) == ["ports"]
+    assert diff_fields({"containers": [{"name": "c"}]}, {"containers": [{"name": "d"}]}) == ["containers[c]"]
+
+
+def test_diff_fields_compares_unnamed_items_by_index():
+    desired = {"ports": [{"port": 80}, {"port": 443}]}
+    live = {"ports": [{"port": 80, "protocol": "TCP"}, {"port": 8443, "protocol": "TCP"}]}
+    assert diff_fields(desired, live) == ["ports[1].port"]
+
+
+def test_diff_fields_reports_changed_scalars():
+    assert diff_fields({"data": {"key": "new"}}, {"data": {"key": "old", "other": "x"}}) == ["data.key"]
+    assert diff_fields({"data": {"key": "value"}}, {}) == ["data"]
+
+
+def test_to_apply_body_sets_type_and_drops_none():
+    body = client.V1ConfigMap(metadata=client.V1ObjectMeta(name="config"), data={"key": "value"})
+    assert to_apply_body(client.ApiClient(), "configmaps", body) == {
+        "apiVersion": "v1",
+        "kind": "ConfigMap",
+        "metadata": {"name": "config"},
+        "data": {"key": "value"},
+    }
+
+
+def test_update_secret_does_not_modify_request_model(monkeypatch):
+    bodies = []
+    monkeypatch.setattr(cluster_service, "_update_resource",
+                        lambda namespace, plural, read_func, body, *args: bodies.append(body) or {})
+    secret = Secret(metadata=Metadata(name="ignored"), data={"token": "abc"})
+    cluster_service.update_secret("user", "creds", secret)
+    cluster_service.update_secret("user", "creds", secret)
+    assert secret.metadata.name == "ignored" and secret.data == {"token": "abc"}
+    assert [(body.metadata.name, body.data) for body in bodies] == [("creds", {"token": "YWJj"})] * 2
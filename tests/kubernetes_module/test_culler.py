@@ -0,0 +1,64 @@
+from datetime import datetime, timezone, timedelta
+
+import httpx
+
+from src.kubernetes_module.crds.culler import NotebookCuller, LAST_ACTIVITY_ANNOTATION, STOP_ANNOTATION, \
+    is_stopped, to_stop_patch
+
+
+def notebook(annotations: dict = None, created: str = '2020-01-01T00:00:00Z'):
+    return {"metadata": {"namespace": "user", "name": "nb", "annotations": annotations,
+                         "creationTimestamp": created}}
+
+
+def kernel_client(status_code: int = 200, kernels=None):
+    def handler(request: httpx.Request):
+        assert request.url.path == "/notebook/user/nb/api/kernels"
+        return httpx.Response(status_code, json=kernels if kernels is not None else [])
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def unreachable_client():
+    def handler(request: httpx.Request):
+        raise httpx.ConnectError("name resolution failed", request=request)
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+culler = NotebookCuller(crd_client=None, idle_seconds=60)
+
+
+def test_busy_kernel_is_active_now():
+    last_activity = culler.get_last_activity(kernel_client(kernels=[
+        {"execution_state": "idle", "last_activity": "2020-01-01T00:00:00Z"},
+        {"execution_state": "busy", "last_activity": "2020-01-01T00:00:00Z"},
+    ]), notebook())
+    assert datetime.now(timezone.utc) - last_activity < timedelta(seconds=5)
+
+
+def test_latest_kernel_activity_is_used():
+    last_activity = culler.get_last_activity(kernel_client(kernels=[
+        {"execution_state": "idle", "last_activity": "2023-05-01T10:00:00.123456Z"},
+        {"execution_state": "idle", "last_activity": "2023-05-02T10:00:00Z"},
+    ]), notebook())
+    assert last_activity == datetime(2023, 5, 2, 10, tzinfo=timezone.utc)
+
+
+def test_falls_back_to_last_activity_annotation():
+    item = notebook({LAST_ACTIVITY_ANNOTATION: "2023-05-03T00:00:00Z"})
+    assert culler.get_last_activity(unreachable_client(), item) == datetime(2023, 5, 3, tzinfo=timezone.utc)
+    assert culler.get_last_activity(kernel_client(status_code=503), item) == datetime(2023, 5, 3, tzinfo=timezone.utc)
+
+
+def test_unknown_activity_is_not_culled():
+    # creationTimestamp 만으로는 사용 중인지 알 수 없으므로 중지 대상이 아니다.
+    assert culler.get_last_activity(unreachable_client(), notebook()) is None
+    assert culler.get_last_activity(kernel_client(kernels=[]), notebook({})) is None
+    assert culler._cull_one(unreachable_client(), notebook()) is False
+
+
+def test_stop_patch():
+    assert is_stopped({"metadata": to_stop_patch(stopped=True)["metadata"]})
+    start = to_stop_patch(stopped=False)["metadata"]["annotations"]
+    assert start[STOP_ANNOTATION] is None
+    assert LAST_ACTIVITY_ANNOTATION in start
+    assert not is_stopped(notebook())
@@ -0,0 +1,71 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from src.kubernetes_module.event_hub import EventHub, EventStream
+
+
+def pod(name: str, resource_version: str):
+    return {"metadata": {"name": name, "resourceVersion": resource_version}}
+
+
+def stream_with(*events, history_size: int = 3):
+    stream = EventStream(EventHub({}, history_size=history_size), "pods", "user", list_func=None)
+    for event_type, item in events:
+        stream._publish(event_type, item)
+    return stream
+
+
+def test_snapshot_without_resource_version_returns_current_objects():
+    stream = stream_with(("ADDED", pod("a", "1")), ("ADDED", pod("b", "2")), ("DELETED", pod("a", "3")))
+    assert stream.snapshot() == [{"type": "ADDED", "object": pod("b", "2")}]
+
+
+def test_snapshot_replays_events_after_resource_version_in_history():
+    stream = stream_with(("ADDED", pod("a", "1")), ("MODIFIED", pod("a", "2")), ("DELETED", pod("a", "3")))
+    assert stream.snapshot("1") == [{"type": "MODIFIED", "object": pod("a", "2")},
+                                    {"type": "DELETED", "object": pod("a", "3")}]
+    assert stream.snapshot("3") == []
+
+
+def test_snapshot_resyncs_when_resource_version_is_older_than_history():
+    stream = stream_with(*[("MODIFIED", pod("a", str(version))) for version in range(1, 6)])
+    assert stream.snapshot("1") == [{"type": "RESYNC", "object": None},
+                                    {"type": "ADDED", "object": pod("a", "5")}]
+
+
+def test_list_publishes_only_changes():
+    stream = stream_with(("ADDED", pod("a", "1")), ("ADDED", pod("b", "2")))
+    listed = {"metadata": {"resourceVersion": "10"}, "items": [pod("a", "1"), pod("b", "9"), pod("c", "10")]}
+    stream.list_func = lambda namespace, _preload_content: SimpleNamespace(data=json.dumps(listed).encode())
+    stream._list()
+    assert [(event["type"], event["object"]["metadata"]["name"]) for _, event in stream._history] == [
+        ("ADDED", "b"), ("MODIFIED", "b"), ("ADDED", "c")]
+    assert stream.resource_version == "10"
+
+
+def test_overflowed_subscriber_receives_resync_and_current_objects():
+    async def run():
+        hub = EventHub({}, queue_size=2)
+        stream = EventStream(hub, "pods", "user", list_func=None)
+        hub.streams[("pods", "user")] = stream
+        stream._publish("ADDED", pod("a", "1"))
+        events = hub.subscribe("pods", "user")
+        received = [await events.__anext__()]
+        for version in range(2, 7):
+            stream._publish("MODIFIED", pod("a", str(version)))
+        stream._publish("ADDED", pod("b", "7"))
+        await asyncio.sleep(0)
+        received += [await events.__anext__() for _ in range(3)]
+        stream._publish("DELETED", pod("b", "8"))
+        received.append(await events.__anext__())
+        await events.aclose()
+        return received
+
+    assert asyncio.run(run()) == [
+        {"type": "ADDED", "object": pod("a", "1")},
+        {"type": "RESYNC", "object": None},
+        {"type": "ADDED", "object": pod("a", "6")},
+        {"type": "ADDED", "object": pod("b", "7")},
+        {"type": "DELETED", "object": pod("b", "8")},
+    ]
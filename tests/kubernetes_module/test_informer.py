@@ -0,0 +1,47 @@
+import time
+
+from kubernetes.client.rest import ApiException
+
+from src.kubernetes_module.cluster.informer import WatchCache, match_label_selector
+
+
+def test_match_label_selector():
+    labels = {"app": "nb", "tier": "web"}
+    assert match_label_selector(labels, "app=nb,tier==web") is True
+    assert match_label_selector(labels, "app!=nb") is False
+    assert match_label_selector(labels, "!tier") is False
+    assert match_label_selector(labels, "app in (nb)") is None
+
+
+def test_list_items_falls_back_at_once_when_list_keeps_failing():
+    def list_func(namespace, **kwargs):
+        raise ApiException(status=403, reason="Forbidden")
+
+    cache = WatchCache(sync_timeout=5.0)
+    try:
+        started = time.time()
+        assert cache.list_items("pods", "user", list_func) is None
+        assert cache.list_items("pods", "user", list_func) is None
+        assert time.time() - started < 1.0
+        assert cache.get_metrics()["informers"][0]["last_error"] == "403 Forbidden"
+    finally:
+        cache.stop()
+
+
+def test_list_items_filters_synced_items_by_label_selector():
+    listed = {"metadata": {"resourceVersion": "1"}, "items": [
+        {"metadata": {"name": "a", "labels": {"app": "nb"}, "resourceVersion": "1"}},
+        {"metadata": {"name": "b", "labels": {"app": "db"}, "resourceVersion": "1"}},
+    ]}
+
+    def list_func(namespace, **kwargs):
+        if kwargs.get("watch"):
+            raise ApiException(status=500, reason="watch unavailable")
+        return listed
+
+    cache = WatchCache(sync_timeout=5.0)
+    try:
+        items = cache.list_items("notebooks", "user", list_func, label_selector="app=nb")
+        assert [item["metadata"]["name"] for item in items] == ["a"]
+    finally:
+        cache.stop()
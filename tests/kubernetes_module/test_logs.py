@@ -0,0 +1,57 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.kubernetes_module.cluster.logs import open_log_stream, aiter_log_chunks, aiter_log_lines
+from src.kubernetes_module.exceptions import KubernetesHttpError
+
+
+async def chunks_of(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def collect(lines):
+    return [line async for line in lines]
+
+
+def test_aiter_log_lines_joins_lines_split_across_chunks():
+    lines = aiter_log_lines(chunks_of(b"first li", b"ne\nsecond\nthi", b"rd"))
+    assert asyncio.run(collect(lines)) == ["first line", "second", "third"]
+
+
+def test_aiter_log_lines_handles_empty_lines_and_invalid_utf8():
+    lines = aiter_log_lines(chunks_of(b"a\n\n", b"\xff\n"))
+    assert asyncio.run(collect(lines)) == ["a", "", "�"]
+
+
+def test_open_log_stream_sends_only_given_params():
+    def handler(request: httpx.Request):
+        assert request.url.path == "/api/v1/namespaces/user/pods/nb-0/log"
+        assert dict(request.url.params) == {"container": "nb", "follow": "true"}
+        assert request.headers["authorization"] == "Bearer token"
+        return httpx.Response(200, content=chunks_of(b"line 1\nli", b"ne 2\n"))
+
+    async def read():
+        async with httpx.AsyncClient(base_url="https://cluster", transport=httpx.MockTransport(handler)) as client:
+            response = await open_log_stream(client, {"Authorization": "Bearer token"}, "user", "nb-0",
+                                             {"container": "nb", "follow": "true", "tailLines": None},
+                                             timeout=httpx.Timeout(5))
+            return await collect(aiter_log_lines(aiter_log_chunks(response)))
+
+    assert asyncio.run(read()) == ["line 1", "line 2"]
+
+
+def test_open_log_stream_raises_before_streaming():
+    def handler(request: httpx.Request):
+        return httpx.Response(404, json={"kind": "Status", "message": 'pods "nb-0" not found'})
+
+    async def read():
+        async with httpx.AsyncClient(base_url="https://cluster", transport=httpx.MockTransport(handler)) as client:
+            await open_log_stream(client, {}, "user", "nb-0", {}, timeout=httpx.Timeout(5))
+
+    with pytest.raises(KubernetesHttpError) as error:
+        asyncio.run(read())
+    assert error.value.code == 103404
+    assert error.value.result == 'pods "nb-0" not found'
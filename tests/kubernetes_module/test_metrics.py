@@ -0,0 +1,87 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from kubernetes.client import ApiClient
+from kubernetes.client.rest import ApiException
+
+from src.kubernetes_module.cluster.metrics import ResourceUsageCollector, _to_resources, _to_usage, _ratio, \
+    pod_requests
+
+
+def container(name: str, requests: dict = None):
+    return {"name": name, "resources": {"requests": requests} if requests is not None else {}}
+
+
+def test_to_resources_parses_quantities():
+    assert _to_resources({"cpu": "500m", "memory": "1Gi", "nvidia.com/gpu": "2"}) == \
+        {"cpu": 0.5, "memory": 1024 ** 3, "gpu": 2}
+    assert _to_resources(None) == {"cpu": 0.0, "memory": 0, "gpu": 0}
+    assert _to_usage({"cpu": "250000000n", "memory": "128Ki"}) == {"cpu": 0.25, "memory": 128 * 1024}
+
+
+def test_ratio():
+    assert _ratio(1, 4) == 0.25
+    assert _ratio(None, 4) is None
+    assert _ratio(1, 0) is None
+
+
+def test_pod_requests_sums_containers():
+    spec = {"containers": [container("a", {"cpu": "1", "memory": "1Gi"}), container("b", {"cpu": "500m"}),
+                           container("c")]}
+    assert pod_requests(spec) == {"cpu": 1.5, "memory": 1024 ** 3, "gpu": 0}
+
+
+def test_pod_requests_uses_largest_init_container_and_overhead():
+    spec = {
+        "containers": [container("app", {"cpu": "1", "memory": "1Gi"})],
+        "initContainers": [container("migrate", {"cpu": "2", "memory": "512Mi"}),
+                           container("download", {"memory": "2Gi", "nvidia.com/gpu": "1"})],
+        "overhead": {"cpu": "100m", "memory": "64Mi"},
+    }
+    assert pod_requests(spec) == {"cpu": 2.1, "memory": 2 * 1024 ** 3 + 64 * 1024 ** 2, "gpu": 1}
+
+
+class FakeCoreClient:
+    def __init__(self, nodes: list, pods: list):
+        self.nodes, self.pods = nodes, pods
+        self.fail = False
+        self.field_selector = None
+
+    def list_node(self, _preload_content):
+        if self.fail:
+            raise ApiException(status=503, reason="Service Unavailable")
+        return SimpleNamespace(data=json.dumps({"items": self.nodes}).encode())
+
+    def list_pod_for_all_namespaces(self, field_selector, _preload_content):
+        self.field_selector = field_selector
+        return SimpleNamespace(data=json.dumps({"items": self.pods}).encode())
+
+
+def collector_with(core_client: FakeCoreClient):
+    collector = ResourceUsageCollector(ApiClient(), interval=0)
+    collector.core_client = core_client
+    collector.crd_client = SimpleNamespace(list_cluster_custom_object=Mock(side_effect=ApiException(status=404)))
+    return collector
+
+
+def test_collect_counts_pods_bound_to_a_node():
+    node = {"metadata": {"name": "n1"}, "status": {"allocatable": {"cpu": "4", "memory": "8Gi"}}}
+    pending = {"metadata": {"namespace": "user", "name": "nb-0"},
+               "spec": {"nodeName": "n1", "containers": [container("nb", {"cpu": "1"})]}}
+    core_client = FakeCoreClient([node], [pending])
+    usage = collector_with(core_client).get_cluster_usage()
+    # Pending 이어도 node 에 배정된 pod 는 포함하고, 종료된 pod 와 배정 전 pod 는 제외한다.
+    assert core_client.field_selector == "spec.nodeName!=,status.phase!=Succeeded,status.phase!=Failed"
+    assert usage["nodes"][0]["requests"]["cpu"] == 1.0
+    assert usage["last_error"] is None
+
+
+def test_failed_collection_serves_previous_snapshot_with_error():
+    core_client = FakeCoreClient([], [])
+    collector = collector_with(core_client)
+    collected_at = collector.get_cluster_usage()["collected_at"]
+    core_client.fail = True
+    usage = collector.get_cluster_usage()
+    assert usage["collected_at"] == collected_at
+    assert usage["last_error"]["message"] == "503 Service Unavailable"
@@ -0,0 +1,28 @@
+from types import SimpleNamespace
+
+from src.kubernetes_module.crds import service
+from src.kubernetes_module.crds.service import CrdService
+
+
+def notebook(name: str, resource_version: str = "1"):
+    return {"metadata": {"namespace": "user", "name": name, "resourceVersion": resource_version}}
+
+
+def crd_service_with(items: list, monkeypatch):
+    monkeypatch.setattr(service.Render, "to_notebook_status", lambda item: {"name": item["metadata"]["name"]})
+    crd_client = SimpleNamespace(list_namespaced_custom_object=lambda **kwargs: {"items": items})
+    return CrdService(api_client=None, crd_client=crd_client)
+
+
+def test_get_notebooks_returns_not_modified_for_weak_and_listed_etags(monkeypatch):
+    crd_service = crd_service_with([notebook("a"), notebook("b")], monkeypatch)
+    etag, result = crd_service.get_notebooks("user")
+    assert result == [{"name": "a"}, {"name": "b"}]
+    assert crd_service.get_notebooks("user", f'"other", W/{etag}') == (etag, None)
+
+
+def test_notebook_status_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(CrdService, "NOTEBOOK_STATUS_CACHE_SIZE", 2)
+    crd_service = crd_service_with([notebook(name) for name in "abc"], monkeypatch)
+    crd_service.get_notebooks("user")
+    assert list(crd_service._notebook_status) == [("user", "b"), ("user", "c")]
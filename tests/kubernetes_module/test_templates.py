@@ -0,0 +1,65 @@
+import pytest
+
+from src.kubernetes_module.crds.templates import NotebookTemplateService, _percentile
+from src.kubernetes_module.exceptions import RequestValidationError
+from src.kubernetes_module.resource import ResourceFactory
+from src.kubernetes_module.schemas import NotebookTemplate, NotebookFromTemplate, Metadata, \
+    NOTEBOOK_TEMPLATE_NAME_MAX_LENGTH
+
+
+def test_percentile():
+    assert _percentile([], 0.5) is None
+    assert _percentile([3.0], 0.9) == 3.0
+    samples = [float(value) for value in range(1, 11)]
+    assert _percentile(samples, 0.5) == 6.0
+    assert _percentile(samples, 0.9) == 10.0
+    assert _percentile(list(reversed(samples)), 0.5) == 6.0
+
+
+@pytest.mark.parametrize("name", ["Torch", "torch_gpu", "-torch", "torch-", "",
+                                  "a" * (NOTEBOOK_TEMPLATE_NAME_MAX_LENGTH + 1)])
+def test_template_name_must_fit_daemon_set_name(name):
+    with pytest.raises(RequestValidationError):
+        NotebookTemplate(name=name, image="jupyter")
+
+
+def test_warm_pool_name_is_a_valid_label():
+    name = "a" * NOTEBOOK_TEMPLATE_NAME_MAX_LENGTH
+    assert len(NotebookTemplateService.warm_pool_name(NotebookTemplate(name=name, image="jupyter").name)) == 63
+
+
+def test_build_warm_pool_daemon_set_tolerates_gpu_nodes_only_for_gpu_templates():
+    labels = {"notebook-template": "torch"}
+    cpu = ResourceFactory.build_warm_pool_daemonset("pool", NotebookTemplate(name="torch", image="torch"), labels)
+    gpu = ResourceFactory.build_warm_pool_daemonset("pool", NotebookTemplate(name="torch", image="torch", gpu="1"),
+                                                    labels)
+    assert cpu.spec.template.spec.tolerations is None
+    assert gpu.spec.template.spec.tolerations[0].key == "nvidia.com/gpu"
+    assert gpu.spec.template.spec.init_containers[-1].image == "torch"
+    # warm pool 은 GPU 를 요청하지 않는다.
+    assert all("nvidia.com/gpu" not in container.resources.requests
+               for container in gpu.spec.template.spec.init_containers)
+
+
+def test_build_warm_pool_daemon_set_does_not_need_a_shell_in_the_template_image():
+    daemon_set = ResourceFactory.build_warm_pool_daemonset("pool", NotebookTemplate(name="slim", image="distroless"),
+                                                           {"notebook-template": "slim"})
+    install, pre_pull = daemon_set.spec.template.spec.init_containers
+    assert pre_pull.image == "distroless"
+    assert pre_pull.command == [install.command[-1], "true"]
+    assert install.volume_mounts[0].name == pre_pull.volume_mounts[0].name == \
+        daemon_set.spec.template.spec.volumes[0].name
+
+
+def test_build_template_notebook_merges_request():
+    template = NotebookTemplate(name="torch", image="torch:2", gpu="1", env={"A": "1", "B": "1"})
+    request = NotebookFromTemplate(metadata=Metadata(name="nb", labels={"team": "ml"}), env={"B": "2"})
+    body = ResourceFactory.build_template_notebook(template, request)
+    container = body["spec"]["template"].spec.containers[0]
+    assert body["metadata"].labels["notebook-template"] == "torch"
+    assert body["metadata"].labels["team"] == "ml"
+    assert container.image == "torch:2"
+    assert {env.name: env.value for env in container.env} == {"A": "1", "B": "2"}
+    assert container.resources.limits["nvidia.com/gpu"] == "1"
+    # 요청 객체는 변경하지 않는다.
+    assert request.metadata.labels == {"team": "ml"}
@@ -0,0 +1,16 @@
+import pytest
+
+from src.kubernetes_module.utils import etag_matches
+
+
+@pytest.mark.parametrize("if_none_match, matched", [
+    (None, False),
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"xyz", W/"abc"', True),
+    ('*', True),
+    ('"xyz"', False),
+    ('abc', False),
+])
+def test_etag_matches(if_none_match, matched):
+    assert etag_matches(if_none_match, '"abc"') is matched